@@ -1,5 +1,7 @@
 #!/usr/bin/python3
 """ Module for app.py """
+from api.v1 import cache
+from api.v1.json_provider import FastJSONProvider
 from api.v1.views import app_views
 from flask import Flask, jsonify
 from models import storage
@@ -8,9 +10,12 @@ from flask_cors import CORS
 
 
 app = Flask(__name__)
+app.json = FastJSONProvider(app)
 # cors = CORS(app, resources={r'/*': {"origins": "0.0.0.0"}})
-cors = CORS(app, resources={r"/api/v1/*": {"origins": "*"}})
+cors = CORS(app, resources={r"/api/v1/*": {"origins": "*"}},
+            expose_headers=["X-Next-Cursor"])
 app.register_blueprint(app_views)
+storage.subscribe(cache.invalidate)
 
 
 @app.teardown_appcontext
@@ -0,0 +1,170 @@
+#!/usr/bin/python3
+""" response cache of the API """
+from collections import OrderedDict
+from functools import wraps
+import hashlib
+from os import getenv
+import threading
+import time
+from flask import make_response, request
+from models import storage
+
+# seconds a response stays cached, 0 disables the cache; off by default
+# in DB mode, where other processes write to the same database
+TTL = float(getenv("HBNB_API_CACHE_TTL",
+                   "0" if getenv("HBNB_TYPE_STORAGE") == "db" else "60"))
+# responses kept by the in-process cache
+MAX_ENTRIES = int(getenv("HBNB_API_CACHE_MAX", "1024"))
+# largest body cached, in bytes
+MAX_BODY = int(getenv("HBNB_API_CACHE_MAX_BODY", str(1 << 20)))
+# headers set by the views that are cached along with the body
+HEADERS = ("X-Next-Cursor",)
+
+
+class MemoryCache:
+    """in-process LRU cache whose entries expire after a TTL
+
+    Any object with the same get, set, incr and counter methods, for
+    example one talking to a cache server shared by every worker, can
+    replace it through set_backend().
+    """
+
+    def __init__(self, max_entries=MAX_ENTRIES):
+        """creates an empty cache
+        Args:
+            max_entries (int): entries kept before the least recently
+                               used one is dropped
+        """
+        self.__max = max_entries
+        self.__lock = threading.Lock()
+        self.__entries = OrderedDict()
+        # counters live apart from the entries so they are never evicted
+        self.__counters = {}
+
+    def get(self, key):
+        """returns the value cached under key, None if missing or
+        expired"""
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self.__entries[key]
+                return None
+            self.__entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        """caches value under key for ttl seconds"""
+        with self.__lock:
+            self.__entries[key] = (time.monotonic() + ttl, value)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max:
+                self.__entries.popitem(last=False)
+
+    def incr(self, key):
+        """increments the counter key and returns its new value; a
+        missing counter counts as 0"""
+        with self.__lock:
+            self.__counters[key] = self.__counters.get(key, 0) + 1
+            return self.__counters[key]
+
+    def counter(self, key):
+        """returns the value of the counter key"""
+        with self.__lock:
+            return self.__counters.get(key, 0)
+
+
+backend = MemoryCache()
+
+
+def set_backend(new_backend):
+    """replaces the cache backend"""
+    global backend
+    backend = new_backend
+
+
+def invalidate(cls_names):
+    """drops the cached responses that depend on any of cls_names, by
+    moving their classes to a new generation"""
+    for cls_name in cls_names:
+        backend.incr("generation:" + cls_name)
+
+
+def cache_key(cls_names):
+    """returns the cache key of the current request, made of its method,
+    path, query, body and the generations of the classes it reads; the
+    storage generations follow the writes of other processes in DB
+    mode"""
+    generations = ",".join(str(backend.counter("generation:" + cls_name))
+                           for cls_name in cls_names)
+    body = hashlib.sha1(request.get_data()).hexdigest()
+    return "{} {} {} {} {}".format(request.method, request.full_path, body,
+                                   generations,
+                                   storage.generation(*cls_names))
+
+
+def kept_headers(resp):
+    """returns the (name, value) pairs of the HEADERS resp has"""
+    return [(name, resp.headers[name]) for name in HEADERS
+            if name in resp.headers]
+
+
+def store(key, chunks, headers):
+    """yields chunks, caching their concatenation and headers under key
+    once they are all sent, unless they add up to more than MAX_BODY
+    bytes"""
+    body = []
+    size = 0
+    try:
+        for chunk in chunks:
+            if size <= MAX_BODY:
+                data = chunk.encode() if isinstance(chunk, str) else chunk
+                body.append(data)
+                size += len(data)
+            yield chunk
+    finally:
+        if hasattr(chunks, "close"):
+            chunks.close()
+    if size <= MAX_BODY:
+        body = b"".join(body)
+        backend.set(key, (body, headers), TTL)
+
+
+def cached(*cls_names):
+    """caches the 200 responses of a view, with their HEADERS, until TTL
+    expires or objects of one of cls_names change; validators and 304s
+    are left to conditional()
+    Args:
+        cls_names (str): names of the classes the view reads
+    """
+    def decorator(view):
+        """wraps view"""
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            """returns the cached response, or the one of view"""
+            if TTL <= 0:
+                return view(*args, **kwargs)
+            key = cache_key(cls_names)
+            hit = backend.get(key)
+            if hit is not None:
+                body, headers = hit
+                resp = make_response(body)
+                resp.mimetype = 'application/json'
+                for name, value in headers:
+                    resp.headers[name] = value
+                return resp
+            resp = make_response(view(*args, **kwargs))
+            if resp.status_code != 200:
+                return resp
+            if resp.is_streamed:
+                resp.response = store(key, resp.response,
+                                      kept_headers(resp))
+                return resp
+            body = resp.get_data()
+            if len(body) <= MAX_BODY:
+                backend.set(key, (body, kept_headers(resp)), TTL)
+            return resp
+        return wrapper
+    return decorator
@@ -0,0 +1,35 @@
+#!/usr/bin/python3
+""" JSON provider of the API, encoding with the models JSON backend """
+from flask.json.provider import DefaultJSONProvider
+from models.engine import json_backend
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """DefaultJSONProvider encoding through models.engine.json_backend,
+    which uses orjson when it is installed"""
+
+    def dumps(self, obj, **kwargs):
+        """returns obj serialized as a JSON string; options the backend
+        does not support go to the default provider"""
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return json_backend.dumps(obj, default=self.default,
+                                  sort_keys=self.sort_keys).decode()
+
+    def loads(self, s, **kwargs):
+        """returns the object serialized in the JSON string s"""
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return json_backend.loads(s)
+
+    def response(self, *args, **kwargs):
+        """returns the compact JSON response of the arguments, or the
+        indented one of the default provider in debug mode"""
+        if (self.compact is None and self._app.debug) or \
+                self.compact is False:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        body = json_backend.dumps(obj, default=self.default,
+                                  sort_keys=self.sort_keys)
+        return self._app.response_class(body + b"\n",
+                                        mimetype=self.mimetype)
@@ -1,16 +1,22 @@
 #!/usr/bin/python3
 """ amenities module for the API """
+from api.v1.cache import cached
 from api.v1.views import app_views
+from api.v1.views.conditional import conditional, object_response
+from api.v1.views.conditional import object_etag, precondition_failed
+from api.v1.views.conditional import respond
+from api.v1.views.pagination import paginated
 from flask import jsonify, request
 from models import storage
 from models.amenity import Amenity
 
 
 @app_views.route('/amenities', strict_slashes=False, methods=['GET'])
+@conditional(Amenity)
+@cached('Amenity')
 def get_amenities():
-    amenities = storage.all(Amenity)
-    amenity_list = [amenity.to_dict() for amenity in amenities.values()]
-    return jsonify(amenity_list)
+    return paginated(lambda limit, after:
+                     storage.page(Amenity, limit, after))
 
 
 @app_views.route('/amenities/<amenity_id>', methods=['GET'])
@@ -18,7 +24,7 @@ def get_amenity(amenity_id):
     amenity = storage.get(Amenity, amenity_id)
     if amenity is None:
         return jsonify({"error": "Not found"}), 404
-    return jsonify(amenity.to_dict())
+    return object_response(amenity)
 
 
 @app_views.route('/amenities/<amenity_id>', methods=['DELETE'])
@@ -48,6 +54,9 @@ def update_amenity(amenity_id):
     amenity = storage.get(Amenity, amenity_id)
     if amenity is None:
         return jsonify({"error": "Not found"}), 404
+    failed = precondition_failed(amenity)
+    if failed is not None:
+        return failed
     data = request.get_json(silent=True)
     if not isinstance(data, dict):
         return jsonify({"error": "Not a JSON"}), 400
@@ -55,4 +64,5 @@ def update_amenity(amenity_id):
         if key not in ['id', 'created_at', 'updated_at']:
             setattr(amenity, key, value)
     amenity.save()
-    return jsonify(amenity.to_dict()), 200
+    return respond(jsonify(amenity.to_dict()), object_etag(amenity),
+                   amenity.updated_at)
@@ -0,0 +1,84 @@
+#!/usr/bin/python3
+""" batch module for the API """
+from api.v1.views import app_views
+from flask import jsonify, request
+from models import storage
+from models.amenity import Amenity
+from models.city import City
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+
+# resource: (class, required keys, parent classes, keys PUT ignores)
+resources = {
+    'states': (State, ['name'], {}, ['id', 'created_at', 'updated_at']),
+    'amenities': (Amenity, ['name'], {},
+                  ['id', 'created_at', 'updated_at']),
+    'users': (User, ['email', 'password'], {},
+              ['id', 'email', 'created_at', 'updated_at']),
+    'cities': (City, ['state_id', 'name'], {'state_id': State},
+               ['id', 'state_id', 'created_at', 'updated_at']),
+    'places': (Place, ['city_id', 'user_id', 'name'],
+               {'city_id': City, 'user_id': User},
+               ['id', 'user_id', 'city_id', 'created_at', 'updated_at']),
+    'reviews': (Review, ['place_id', 'user_id', 'text'],
+                {'place_id': Place, 'user_id': User},
+                ['id', 'user_id', 'place_id', 'created_at', 'updated_at']),
+}
+
+
+def get_items():
+    """returns the list of objects in the request body, or None"""
+    data = request.get_json(silent=True)
+    if not isinstance(data, list):
+        return None
+    if not all(isinstance(item, dict) for item in data):
+        return None
+    return data
+
+
+@app_views.route('/batch/<resource>', strict_slashes=False,
+                 methods=['POST'])
+def create_batch(resource):
+    """creates every object of the list in the request body"""
+    if resource not in resources:
+        return jsonify({"error": "Not found"}), 404
+    cls, required, parents, ignored = resources[resource]
+    items = get_items()
+    if items is None:
+        return jsonify({"error": "Not a list"}), 400
+    for item in items:
+        for key in required:
+            if key not in item:
+                return jsonify({"error": "Missing {}".format(key)}), 400
+        for key, parent in parents.items():
+            if storage.get(parent, item[key]) is None:
+                return jsonify({"error": "Not found"}), 404
+    objs = [cls(**item) for item in items]
+    storage.bulk_new(objs)
+    return jsonify([obj.to_dict() for obj in objs]), 201
+
+
+@app_views.route('/batch/<resource>', strict_slashes=False,
+                 methods=['PUT'])
+def update_batch(resource):
+    """updates every object of the list in the request body"""
+    if resource not in resources:
+        return jsonify({"error": "Not found"}), 404
+    cls, required, parents, ignored = resources[resource]
+    items = get_items()
+    if items is None:
+        return jsonify({"error": "Not a list"}), 400
+    updates = []
+    for item in items:
+        if 'id' not in item:
+            return jsonify({"error": "Missing id"}), 400
+        if storage.get(cls, item['id']) is None:
+            return jsonify({"error": "Not found"}), 404
+        values = {key: value for key, value in item.items()
+                  if key not in ignored}
+        values['id'] = item['id']
+        updates.append(values)
+    objs = storage.bulk_update(cls, updates)
+    return jsonify([obj.to_dict() for obj in objs]), 200
@@ -1,6 +1,11 @@
 #!/usr/bin/python3
 """ cities module for the API """
+from api.v1.cache import cached
 from api.v1.views import app_views
+from api.v1.views.conditional import conditional, object_response
+from api.v1.views.conditional import object_etag, precondition_failed
+from api.v1.views.conditional import respond
+from api.v1.views.pagination import paginated
 from flask import jsonify, request
 from models import storage
 from models.city import City
@@ -9,12 +14,14 @@ from models.state import State
 
 @app_views.route('/states/<state_id>/cities', strict_slashes=False,
                  methods=['GET'])
+@conditional(City, 'state_id', 'state_id', State)
+@cached('State', 'City')
 def get_cities(state_id):
     state = storage.get(State, state_id)
     if state is None:
         return jsonify({"error": "Not found"}), 404
-    cities = [city.to_dict() for city in state.cities]
-    return jsonify(cities)
+    return paginated(lambda limit, after:
+                     storage.page(City, limit, after, 'state_id', state_id))
 
 
 @app_views.route('/cities/<city_id>', methods=['GET'])
@@ -22,7 +29,7 @@ def get_city(city_id):
     city = storage.get(City, city_id)
     if city is None:
         return jsonify({"error": "Not found"}), 404
-    return jsonify(city.to_dict())
+    return object_response(city)
 
 
 @app_views.route('/cities/<city_id>', methods=['DELETE'])
@@ -57,6 +64,9 @@ def update_city(city_id):
     city = storage.get(City, city_id)
     if city is None:
         return jsonify({"error": "Not found"}), 404
+    failed = precondition_failed(city)
+    if failed is not None:
+        return failed
     data = request.get_json(silent=True)
     if not isinstance(data, dict):
         return jsonify({"error": "Not a JSON"}), 400
@@ -64,4 +74,5 @@ def update_city(city_id):
         if key not in ['id', 'state_id', 'created_at', 'updated_at']:
             setattr(city, key, value)
     city.save()
-    return jsonify(city.to_dict()), 200
+    return respond(jsonify(city.to_dict()), object_etag(city),
+                   city.updated_at)
@@ -0,0 +1,89 @@
+#!/usr/bin/python3
+""" conditional request helpers of the API, based on updated_at """
+from datetime import timezone
+from functools import wraps
+import hashlib
+from flask import jsonify, make_response, request
+from models import storage
+
+
+def validators(*parts):
+    """returns the ETag made of parts"""
+    return hashlib.sha1("|".join(str(part) for part in parts)
+                        .encode()).hexdigest()
+
+
+def object_etag(obj):
+    """returns the ETag of obj, which changes with its updated_at"""
+    return validators(obj.__class__.__name__, obj.id, obj.updated_at)
+
+
+def not_modified(etag, last_modified):
+    """tells whether the client already has the representation with etag
+    that last changed at last_modified, according to its If-None-Match
+    or If-Modified-Since header"""
+    if request.if_none_match:
+        return request.if_none_match.contains(etag)
+    since = request.if_modified_since
+    if since is None or last_modified is None:
+        return False
+    last_modified = last_modified.replace(microsecond=0,
+                                          tzinfo=timezone.utc)
+    return last_modified <= since
+
+
+def respond(resp, etag, last_modified):
+    """returns resp with the ETag and Last-Modified headers set"""
+    resp = make_response(resp)
+    if resp.status_code in (200, 304):
+        resp.set_etag(etag)
+        if last_modified is not None:
+            resp.last_modified = last_modified.replace(tzinfo=timezone.utc)
+    return resp
+
+
+def object_response(obj):
+    """returns the JSON response of obj, or a 304 if the client already
+    has it"""
+    etag = object_etag(obj)
+    if not_modified(etag, obj.updated_at):
+        return respond(("", 304), etag, obj.updated_at)
+    return respond(jsonify(obj.to_dict()), etag, obj.updated_at)
+
+
+def precondition_failed(obj):
+    """returns a 412 response if the If-Match header of the request does
+    not match the current ETag of obj, None otherwise"""
+    if request.if_match and not request.if_match.contains(object_etag(obj)):
+        return jsonify({"error": "Precondition Failed"}), 412
+    return None
+
+
+def conditional(cls, arg=None, attr=None, parent=None):
+    """answers a collection view with a 304 when the collection has not
+    changed, before the view serializes anything; its ETag comes from
+    the latest updated_at and the number of objects, and it has no
+    Last-Modified since deleting an object does not move updated_at
+    Args:
+        cls (class): class of the objects listed by the view
+        arg (str): view argument holding the id of the parent object
+        attr (str): foreign-key attribute of cls referencing the parent
+        parent (class): class of the parent object, left to the view to
+                        answer when it does not exist
+    """
+    def decorator(view):
+        """wraps view"""
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            """returns a 304, or the response of view with its ETag"""
+            value = kwargs.get(arg) if arg else None
+            if parent is not None and storage.get(parent, value) is None:
+                return view(*args, **kwargs)
+            last_modified, count = storage.last_modified(cls, attr, value)
+            etag = validators(request.full_path, last_modified, count)
+            if request.if_none_match and \
+                    request.if_none_match.contains(etag):
+                return respond(("", 304), etag, None)
+            return respond(view(*args, **kwargs), etag, None)
+        return wrapper
+    return decorator
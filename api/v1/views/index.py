@@ -1,5 +1,6 @@
 #!/usr/bin/python3
 """ index module for the API """
+from api.v1.cache import cached
 from api.v1.views import app_views
 from flask import jsonify
 
@@ -10,6 +11,7 @@ def get_status():
 
 
 @app_views.route('/stats', methods=['GET'], strict_slashes=False)
+@cached('Amenity', 'City', 'Place', 'Review', 'State', 'User')
 def get_stats():
     from models import storage
     from models.state import State
@@ -27,7 +29,16 @@ def get_stats():
         'reviews': Review,
         'users': User
     }
+    counts = storage.counts()
     stats = {}
     for key, value in classes.items():
-        stats[key] = storage.count(value)
+        stats[key] = counts.get(value.__name__, 0)
     return jsonify(stats)
+
+
+@app_views.route('/stats/pool', methods=['GET'], strict_slashes=False)
+def get_pool_stats():
+    from models import storage, storage_t
+    if storage_t != 'db':
+        return jsonify({})
+    return jsonify(storage.pool_stats())
@@ -0,0 +1,54 @@
+#!/usr/bin/python3
+""" pagination helpers for the list endpoints of the API """
+from itertools import islice
+from flask import Response, jsonify, request, stream_with_context
+from models.engine import json_backend
+from models.pagination import fetch_page, page_args
+
+# objects encoded per chunk of a streamed response
+CHUNK = 100
+
+
+def stream_json(objs, expand=None):
+    """yields the JSON array of the dictionaries of objs, CHUNK objects
+    at a time, so the whole list is never held in memory
+    Args:
+        objs (iterable): objects to encode
+        expand (function): called with each chunk of objects and the
+                           list of their dictionaries, to add related
+                           objects to the dictionaries
+    """
+    yield "["
+    sep = ""
+    objs = iter(objs)
+    chunk = list(islice(objs, CHUNK))
+    while chunk:
+        dicts = [obj.to_dict() for obj in chunk]
+        if expand is not None:
+            expand(chunk, dicts)
+        yield sep + b", ".join(json_backend.dumps(d) for d in dicts).decode()
+        sep = ", "
+        chunk = list(islice(objs, CHUNK))
+    yield "]\n"
+
+
+def paginated(fetch, expand=None):
+    """returns the streamed JSON list response for one page of objects,
+    with the cursor of the next page in the X-Next-Cursor header if
+    there is one
+    Args:
+        fetch (function): called with (limit, after), returns an iterator
+                          over the objects of the page ordered by
+                          (created_at, id)
+        expand (function): passed to stream_json()
+    """
+    try:
+        limit, after = page_args(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    objs, cursor = fetch_page(fetch, limit, after)
+    resp = Response(stream_with_context(stream_json(objs, expand)),
+                    mimetype='application/json')
+    if cursor is not None:
+        resp.headers['X-Next-Cursor'] = cursor
+    return resp
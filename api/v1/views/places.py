@@ -1,23 +1,28 @@
 #!/usr/bin/python3
 """ places module for the API """
+from api.v1.cache import cached
 from api.v1.views import app_views
+from api.v1.views.conditional import conditional, object_response
+from api.v1.views.conditional import object_etag, precondition_failed
+from api.v1.views.conditional import respond
+from api.v1.views.pagination import paginated
 from flask import jsonify, request, abort
 from models import storage
-from models.amenity import Amenity
 from models.city import City
 from models.place import Place
-from models.state import State
 from models.user import User
 
 
 @app_views.route('/cities/<city_id>/places', strict_slashes=False,
                  methods=['GET'])
+@conditional(Place, 'city_id', 'city_id', City)
+@cached('City', 'Place')
 def get_places(city_id):
     city = storage.get(City, city_id)
     if city is None:
         return jsonify({"error": "Not found"}), 404
-    places = [place.to_dict() for place in city.places]
-    return jsonify(places)
+    return paginated(lambda limit, after:
+                     storage.page(Place, limit, after, 'city_id', city_id))
 
 
 @app_views.route('/places/<place_id>', strict_slashes=False,
@@ -26,7 +31,7 @@ def get_place(place_id):
     place = storage.get(Place, place_id)
     if place is None:
         return jsonify({"error": "Not found"}), 404
-    return jsonify(place.to_dict())
+    return object_response(place)
 
 
 @app_views.route('/places/<place_id>', strict_slashes=False,
@@ -67,6 +72,9 @@ def update_place(place_id):
     place = storage.get(Place, place_id)
     if place is None:
         return jsonify({"error": "Not found"}), 404
+    failed = precondition_failed(place)
+    if failed is not None:
+        return failed
     data = request.get_json(silent=True)
     if not isinstance(data, dict):
         return jsonify({"error": "Not a JSON"}), 400
@@ -75,45 +83,49 @@ def update_place(place_id):
         if key not in checker:
             setattr(place, key, value)
     place.save()
-    return jsonify(place.to_dict()), 200
+    return respond(jsonify(place.to_dict()), object_etag(place),
+                   place.updated_at)
+
+
+def owner(user):
+    """returns the public fields of user shown as the owner of a place,
+    None if the user does not exist"""
+    if user is None:
+        return None
+    return {"id": user.id, "first_name": user.first_name,
+            "last_name": user.last_name}
+
+
+def expand_users(places, dicts):
+    """adds the owner of each of places to its dictionary, with a single
+    storage call for all of them"""
+    users = storage.get_many(User, {place.user_id for place in places})
+    for place, place_dict in zip(places, dicts):
+        place_dict['user'] = owner(users.get(place.user_id))
+
 
 @app_views.route('/places_search', methods=['POST'], strict_slashes=False)
+@cached('Place', 'City', 'Amenity', 'User')
 def places_search():
     """
     Retrieves all Place objects depending of the JSON in
-    the body of the request.
+    the body of the request, one page at a time if limit or
+    cursor are given, with the id and names of their owner
+    under "user" if expand=user is given.
     """
     data = request.get_json(silent=True)
     if not isinstance(data, dict):
         return jsonify({"error": "Not a JSON"}), 400
 
+    expand = request.args.get('expand')
+    if expand not in (None, 'user'):
+        return jsonify({"error": "Invalid expand"}), 400
+
     states = data.get('states', [])
     cities = data.get('cities', [])
     amenities = data.get('amenities', [])
 
-    if not data or (not states and not cities and not amenities):
-        places = storage.all(Place).values()
-    else:
-        places = []
-        for state_id in states:
-            state = storage.get(State, state_id)
-            if state:
-                for city in state.cities:
-                    places.extend(city.places)
-        for city_id in cities:
-            city = storage.get(City, city_id)
-            if city:
-                # ensure no duplicates
-                for place in city.places:
-                    if place.id not in (place.id for place in places):
-                        places.append(place)
-
-    # filter by amenity
-    if len(amenities) > 0:
-        amenities_objs = [storage.get(Amenity, amenity_id)
-                          for amenity_id in amenities]
-        places = [place for place in places
-                  if all(amenity in [a.id for a in place.amenities]
-                         for amenity in amenities_objs)]
-
-    return jsonify([place.to_dict() for place in places]), 200
+    return paginated(lambda limit, after:
+                     storage.search_places(states, cities, amenities,
+                                           limit, after),
+                     expand_users if expand else None)
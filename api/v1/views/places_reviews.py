@@ -1,6 +1,11 @@
 #!/usr/bin/python3
 """ places_reviews module for the API """
+from api.v1.cache import cached
 from api.v1.views import app_views
+from api.v1.views.conditional import conditional, object_response
+from api.v1.views.conditional import object_etag, precondition_failed
+from api.v1.views.conditional import respond
+from api.v1.views.pagination import paginated
 from flask import jsonify, request
 from models import storage
 from models.place import Place
@@ -10,12 +15,15 @@ from models.user import User
 
 @app_views.route('/places/<place_id>/reviews', strict_slashes=False,
                  methods=['GET'])
+@conditional(Review, 'place_id', 'place_id', Place)
+@cached('Place', 'Review')
 def get_reviews(place_id):
     place = storage.get(Place, place_id)
     if place is None:
         return jsonify({"error": "Not found"}), 404
-    reviews = [review.to_dict() for review in place.reviews]
-    return jsonify(reviews)
+    return paginated(lambda limit, after:
+                     storage.page(Review, limit, after, 'place_id',
+                                  place_id))
 
 
 @app_views.route('/reviews/<review_id>', methods=['GET'])
@@ -23,7 +31,7 @@ def get_review(review_id):
     review = storage.get(Review, review_id)
     if review is None:
         return jsonify({"error": "Not found"}), 404
-    return jsonify(review.to_dict())
+    return object_response(review)
 
 
 @app_views.route('/reviews/<review_id>', methods=['DELETE'])
@@ -63,6 +71,9 @@ def update_review(review_id):
     review = storage.get(Review, review_id)
     if review is None:
         return jsonify({"error": "Not found"}), 404
+    failed = precondition_failed(review)
+    if failed is not None:
+        return failed
     data = request.get_json(silent=True)
     if not isinstance(data, dict):
         return jsonify({"error": "Not a JSON"}), 400
@@ -71,4 +82,5 @@ def update_review(review_id):
         if key not in checker:
             setattr(review, key, value)
     review.save()
-    return jsonify(review.to_dict()), 200
+    return respond(jsonify(review.to_dict()), object_etag(review),
+                   review.updated_at)
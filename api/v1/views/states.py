@@ -1,18 +1,22 @@
 #!/usr/bin/python3
 """ states module for the API """
+from api.v1.cache import cached
 from api.v1.views import app_views
+from api.v1.views.conditional import conditional, object_response
+from api.v1.views.conditional import object_etag, precondition_failed
+from api.v1.views.conditional import respond
+from api.v1.views.pagination import paginated
 from flask import jsonify, request
 from models import storage
 from models.state import State
 
 
 @app_views.route('/states', strict_slashes=False, methods=['GET'])
+@conditional(State)
+@cached('State')
 def get_states():
-    states = storage.all(State)
-    states_list = []
-    for state in states.values():
-        states_list.append(state.to_dict())
-    return jsonify(states_list)
+    return paginated(lambda limit, after:
+                     storage.page(State, limit, after))
 
 
 @app_views.route('/states/<state_id>', methods=['GET'])
@@ -20,7 +24,7 @@ def get_state(state_id):
     state = storage.get(State, state_id)
     if state is None:
         return jsonify({"error": "Not found"}), 404
-    return jsonify(state.to_dict())
+    return object_response(state)
 
 
 @app_views.route('/states/<state_id>', methods=['DELETE'])
@@ -50,6 +54,9 @@ def update_state(state_id):
     state = storage.get(State, state_id)
     if state is None:
         return jsonify({"error": "Not found"}), 404
+    failed = precondition_failed(state)
+    if failed is not None:
+        return failed
     data = request.get_json(silent=True)
     if not isinstance(data, dict):
         return jsonify({"error": "Not a JSON"}), 400
@@ -57,4 +64,5 @@ def update_state(state_id):
         if key not in ['id', 'created_at', 'updated_at']:
             setattr(state, key, value)
     state.save()
-    return jsonify(state.to_dict()), 200
+    return respond(jsonify(state.to_dict()), object_etag(state),
+                   state.updated_at)
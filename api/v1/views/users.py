@@ -1,16 +1,22 @@
 #!/usr/bin/python3
 """ users module for the API """
+from api.v1.cache import cached
 from api.v1.views import app_views
+from api.v1.views.conditional import conditional, object_response
+from api.v1.views.conditional import object_etag, precondition_failed
+from api.v1.views.conditional import respond
+from api.v1.views.pagination import paginated
 from flask import jsonify, request
 from models import storage
 from models.user import User
 
 
 @app_views.route('/users', strict_slashes=False, methods=['GET'])
+@conditional(User)
+@cached('User')
 def get_users():
-    users = storage.all(User)
-    user_list = [user.to_dict() for user in users.values()]
-    return jsonify(user_list)
+    return paginated(lambda limit, after:
+                     storage.page(User, limit, after))
 
 
 @app_views.route('/users/<user_id>', methods=['GET'])
@@ -18,7 +24,7 @@ def get_user(user_id):
     user = storage.get(User, user_id)
     if user is None:
         return jsonify({"error": "Not found"}), 404
-    return jsonify(user.to_dict())
+    return object_response(user)
 
 
 @app_views.route('/users/<user_id>', methods=['DELETE'])
@@ -50,6 +56,9 @@ def update_user(user_id):
     user = storage.get(User, user_id)
     if user is None:
         return jsonify({"error": "Not found"}), 404
+    failed = precondition_failed(user)
+    if failed is not None:
+        return failed
     data = request.get_json(silent=True)
     if not isinstance(data, dict):
         return jsonify({"error": "Not a JSON"}), 400
@@ -57,4 +66,5 @@ def update_user(user_id):
         if key not in ['id', 'email', 'created_at', 'updated_at']:
             setattr(user, key, value)
     user.save()
-    return jsonify(user.to_dict()), 200
+    return respond(jsonify(user.to_dict()), object_etag(user),
+                   user.updated_at)
@@ -0,0 +1,50 @@
+#!/usr/bin/python3
+"""
+Measures the time web_flask/100-hbnb.py takes to answer a request, with
+the filters sidebar rendered on every request and served from the
+fragment cache between writes
+
+usage: python3 -m benchmarks.fragments [states]
+"""
+import importlib
+import sys
+from unittest import mock
+from benchmarks.render import best
+from models.amenity import Amenity
+from models.city import City
+from models.engine.file_storage import FileStorage
+from models.state import State
+from web_common import fragments
+
+
+def main(count):
+    """requests the page over count states of 20 cities each"""
+    client = importlib.import_module("web_flask.100-hbnb").app.test_client()
+    with mock.patch.object(FileStorage, "_FileStorage__objects", {}), \
+            mock.patch.object(FileStorage, "close", lambda self: None):
+        storage = FileStorage()
+        for i in range(count):
+            state = State(name="state{:d}".format(i))
+            storage.new(state)
+            for j in range(20):
+                storage.new(City(name="city{:d}".format(j),
+                                 state_id=state.id))
+        for i in range(100):
+            storage.new(Amenity(name="amenity{:d}".format(i)))
+
+        def request():
+            """gets the page"""
+            client.get("/hbnb").get_data()
+        with mock.patch.object(fragments, "MAX_ENTRIES", 0):
+            before = best(request)
+        fragments.clear()
+        request()
+        after = best(request)
+    print("states: {:d}, cities: {:d}".format(count, count * 20))
+    print("before: {:.2f} ms".format(before * 1000))
+    print("after:  {:.2f} ms ({:.0f}x)"
+          .format(after * 1000, before / after))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,54 @@
+#!/usr/bin/python3
+"""
+Measures the memory FileStorage.reload() holds once done, with each id
+and foreign key loaded as a string of its own and with the objects
+sharing one string per id
+
+usage: python3 -m benchmarks.ids [objects]
+"""
+import gc
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+from unittest import mock
+from benchmarks.reload import generate
+from models.engine.file_storage import FileStorage
+
+
+def loaded(storage):
+    """returns the bytes still allocated after a reload() of storage"""
+    FileStorage._FileStorage__objects = {}
+    gc.collect()
+    tracemalloc.start()
+    storage.reload()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def main(count):
+    """writes count objects to a temporary file and reloads it"""
+    fd, path = tempfile.mkstemp(suffix=".json")
+    with os.fdopen(fd, "w") as f:
+        json.dump(generate(count), f)
+    try:
+        with mock.patch.object(FileStorage, "_FileStorage__file_path", path):
+            storage = FileStorage()
+            with mock.patch("models.engine.file_storage.share_ids",
+                            lambda record, ids, attrs: None):
+                before = loaded(storage)
+            after = loaded(storage)
+    finally:
+        os.remove(path)
+    print("objects: {:d}".format(count))
+    print("before:  {:.1f} MB ({:.0f} B/object)"
+          .format(before / 1e6, before / count))
+    print("after:   {:.1f} MB ({:.0f} B/object, {:.0%})"
+          .format(after / 1e6, after / count, after / before - 1))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,58 @@
+#!/usr/bin/python3
+"""
+Measures the memory taken by the objects FileStorage.reload() builds, in
+bytes per object of every class, with the models keeping their
+attributes in a dictionary and in slots (HBNB_COMPACT_MODELS=1); the
+attribute values themselves are not counted
+
+usage: python3 -m benchmarks.memory [objects]
+"""
+import os
+import subprocess
+import sys
+import tracemalloc
+from benchmarks.reload import generate
+
+
+def measure(count):
+    """prints the bytes per object of each class, for the mode the
+    models were imported in"""
+    from models.engine.file_storage import classes
+    values = list(generate(count).values())
+    per_class = {}
+    for value in values:
+        per_class.setdefault(value["__class__"], []).append(value)
+    for name, records in per_class.items():
+        cls = classes[name]
+        tracemalloc.start()
+        objs = [cls.from_storage_dict(value) for value in records]
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(name, size / len(objs))
+        del objs
+
+
+def main(count):
+    """runs measure() with and without the compact models"""
+    results = {}
+    for mode in ("0", "1"):
+        env = dict(os.environ, HBNB_COMPACT_MODELS=mode)
+        env.pop("HBNB_TYPE_STORAGE", None)
+        out = subprocess.run([sys.executable, "-m", "benchmarks.memory",
+                              str(count), "--measure"], env=env, check=True,
+                             capture_output=True, text=True).stdout
+        for line in out.splitlines():
+            name, size = line.split()
+            results.setdefault(name, []).append(float(size))
+    print("objects: {:d}".format(count))
+    print("{:10s} {:>12s} {:>12s}".format("class", "dict", "slots"))
+    for name, (before, after) in results.items():
+        print("{:10s} {:>10.0f} B {:>10.0f} B ({:.0%})"
+              .format(name, before, after, after / before - 1))
+
+
+if __name__ == "__main__":
+    if "--measure" in sys.argv:
+        measure(int(sys.argv[1]))
+    else:
+        main(int(sys.argv[1]) if len(sys.argv) > 1 else 60000)
@@ -0,0 +1,125 @@
+#!/usr/bin/python3
+"""
+Shows the query plans and timings of the queries DBStorage runs for the
+list endpoints and places_search, without and then with the indexes the
+models declare, on the database DBStorage is configured for through the
+HBNB_MYSQL_* variables; it adds rows, so point it to a test database
+
+usage: HBNB_TYPE_STORAGE=db python3 -m benchmarks.query_plans [places]
+"""
+import sys
+import time as clock
+import models
+from models.amenity import Amenity
+from models.base_model import Base
+from models.city import City
+from models.place import Place, place_amenity
+from models.review import Review
+from models.state import State
+from models.user import User
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+def seed(storage, places):
+    """inserts places places with their states, cities, users, reviews
+    and three amenities each"""
+    states = [State(name="state{:d}".format(i)) for i in range(50)]
+    cities = [City(name="city{:d}".format(i), state_id=states[i % 50].id)
+              for i in range(max(places // 20, 50))]
+    users = [User(email="user{:d}@hbnb.io".format(i), password="pwd")
+             for i in range(max(places // 20, 50))]
+    amenities = [Amenity(name="amenity{:d}".format(i)) for i in range(20)]
+    rows = [Place(name="place{:d}".format(i),
+                  city_id=cities[i % len(cities)].id,
+                  user_id=users[i % len(users)].id, number_rooms=1,
+                  number_bathrooms=1, max_guest=2, price_by_night=i % 500)
+            for i in range(places)]
+    reviews = [Review(text="review", place_id=place.id,
+                      user_id=users[i % len(users)].id)
+               for i, place in enumerate(rows)]
+    storage.bulk_new(states + cities + users + amenities + rows + reviews)
+    links = [{"place_id": place.id,
+              "amenity_id": amenities[(i + j) % 20].id}
+             for i, place in enumerate(rows) for j in range(3)]
+    with storage._DBStorage__engine.begin() as connection:
+        connection.execute(place_amenity.insert(), links)
+    return states[0], cities[0], users[0], amenities[:2]
+
+
+def capture(calls):
+    """yields the name of each of calls with the SQL statements and
+    parameters it ran"""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, many):
+        """keeps the statement"""
+        statements.append((statement, parameters))
+    event.listen(Engine, "before_cursor_execute", record)
+    try:
+        for name, call in calls:
+            del statements[:]
+            call()
+            yield name, list(statements)
+    finally:
+        event.remove(Engine, "before_cursor_execute", record)
+
+
+def report(engine, calls, repeat=20):
+    """prints the plan and the average time of the queries of calls"""
+    explain = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" \
+        else "EXPLAIN "
+    with engine.connect() as connection:
+        for name, statements in capture(calls):
+            for statement, parameters in statements:
+                plan = connection.exec_driver_sql(explain + statement,
+                                                  parameters).fetchall()
+                tic = clock.perf_counter()
+                for i in range(repeat):
+                    connection.exec_driver_sql(statement,
+                                               parameters).fetchall()
+                elapsed = (clock.perf_counter() - tic) / repeat
+                print("  {} ({:.2f} ms)".format(name, elapsed * 1000))
+                for row in plan:
+                    print("    " + " | ".join(str(col) for col in row))
+
+
+def main(places):
+    """seeds the database and reports the plans before and after the
+    indexes are created"""
+    storage = models.storage
+    engine = storage._DBStorage__engine
+    state, city, user, amenities = seed(storage, places)
+    session = storage._DBStorage__session
+    ids = [amenity.id for amenity in amenities]
+    calls = [
+        ("cities of a state",
+         lambda: list(storage.page(City, 100, None, "state_id", state.id))),
+        ("places of a city",
+         lambda: list(storage.page(Place, 100, None, "city_id", city.id))),
+        ("places_search",
+         lambda: list(storage.search_places([state.id], [], ids, 100))),
+        ("user by email",
+         lambda: session.query(User).filter(User.email == user.email)
+         .all()),
+        ("places by price",
+         lambda: session.query(Place).order_by(Place.price_by_night)
+         .limit(100).all()),
+        ("states by name",
+         lambda: session.query(State).order_by(State.name).all()),
+    ]
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.drop(engine)
+            except Exception:
+                print("kept {} (needed by a foreign key)".format(index.name))
+    print("before:")
+    report(engine, calls)
+    storage.reload()
+    print("after:")
+    report(engine, calls)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
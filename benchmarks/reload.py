@@ -0,0 +1,100 @@
+#!/usr/bin/python3
+"""
+Measures FileStorage.reload() throughput, in objects per second, with
+BaseModel.from_storage_dict() and with the constructor it replaced, one
+setattr per key and strptime for the dates
+
+usage: python3 -m benchmarks.reload [objects]
+"""
+from datetime import datetime, timedelta
+import json
+import os
+import sys
+import tempfile
+import time as clock
+from unittest import mock
+import uuid
+from models.base_model import BaseModel, time
+from models.engine.file_storage import FileStorage
+
+
+def legacy(cls, data):
+    """builds an instance from data the way reload() used to"""
+    obj = cls.__new__(cls)
+    for key, value in data.items():
+        if key != "__class__":
+            setattr(obj, key, value)
+    obj.created_at = datetime.strptime(data["created_at"], time)
+    obj.updated_at = datetime.strptime(data["updated_at"], time)
+    return obj
+
+
+def generate(count):
+    """returns a storage file content holding count objects of every
+    class, with their foreign keys set"""
+    start = datetime(2017, 4, 14, 16, 21, 42)
+    objects = {}
+    parents = {}
+    layout = (("State", {}, ("name",)),
+              ("City", {"state_id": "State"}, ("name",)),
+              ("User", {}, ("email", "password", "first_name",
+                            "last_name")),
+              ("Amenity", {}, ("name",)),
+              ("Place", {"city_id": "City", "user_id": "User"},
+               ("name", "description")),
+              ("Review", {"place_id": "Place", "user_id": "User"},
+               ("text",)))
+    for i in range(count):
+        cls, fks, texts = layout[i % len(layout)]
+        stamp = (start + timedelta(seconds=i)).strftime(time)
+        obj = {"__class__": cls, "id": str(uuid.uuid4()),
+               "created_at": stamp, "updated_at": stamp}
+        for attr in texts:
+            obj[attr] = "{}{:d}".format(attr, i)
+        for attr, parent in fks.items():
+            obj[attr] = parents.get(parent, "")
+        if cls == "Place":
+            obj.update(number_rooms=i % 5, price_by_night=i % 300,
+                       latitude=0.5, longitude=1.5,
+                       amenity_ids=[parents.get("Amenity", "")])
+        parents[cls] = obj["id"]
+        objects[cls + "." + obj["id"]] = obj
+    return objects
+
+
+def throughput(storage, count, repeat=3):
+    """returns the best reload() throughput of storage over repeat runs,
+    in objects per second"""
+    best = None
+    for i in range(repeat):
+        FileStorage._FileStorage__objects = {}
+        tic = clock.perf_counter()
+        storage.reload()
+        elapsed = clock.perf_counter() - tic
+        assert len(FileStorage._FileStorage__objects) == count
+        best = elapsed if best is None else min(best, elapsed)
+    return count / best
+
+
+def main(count):
+    """writes count objects to a temporary file and reloads it"""
+    fd, path = tempfile.mkstemp(suffix=".json")
+    with os.fdopen(fd, "w") as f:
+        json.dump(generate(count), f)
+    try:
+        with mock.patch.object(FileStorage, "_FileStorage__file_path", path):
+            storage = FileStorage()
+            with mock.patch.object(BaseModel, "from_storage_dict",
+                                   classmethod(legacy)):
+                before = throughput(storage, count)
+            after = throughput(storage, count)
+    finally:
+        os.remove(path)
+    print("objects: {:d}".format(count))
+    print("before:  {:,.0f} objects/s".format(before))
+    print("after:   {:,.0f} objects/s ({:.1f}x)".format(after,
+                                                        after / before))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -0,0 +1,95 @@
+#!/usr/bin/python3
+"""
+Measures the time web_flask/100-hbnb.py takes to render its filters
+sidebar, web_common/templates/web_common/filters.html, with the states,
+cities and amenities sorted by the template's sort filter on every
+render, taken from the name order views of the storage by
+render_sidebar(), and served from the fragment cache
+
+usage: python3 -m benchmarks.render [states]
+"""
+import importlib
+import sys
+import time as clock
+from unittest import mock
+from flask import render_template_string
+from models.amenity import Amenity
+from models.city import City
+from models.engine.file_storage import FileStorage
+from models.state import State
+from web_common import fragments
+
+# template of the sidebar, the fragment render_sidebar() renders
+TEMPLATE = fragments.SIDEBAR
+# list - the loops of the template, and the sort filters they used
+SORTED = [("states %}", "states|sort(attribute='name') %}"),
+          ("cities[state.id] %}",
+           "cities[state.id]|sort(attribute='name') %}"),
+          ("amenities %}", "amenities|sort(attribute='name') %}")]
+
+
+def best(func, repeat=5):
+    """returns the shortest of repeat runs of func, in seconds"""
+    times = []
+    for i in range(repeat):
+        tic = clock.perf_counter()
+        func()
+        times.append(clock.perf_counter() - tic)
+    return min(times)
+
+
+def main(count):
+    """renders the sidebar over count states of 20 cities each"""
+    app = importlib.import_module("web_flask.100-hbnb").app
+    with open(fragments.blueprint.root_path + "/templates/" + TEMPLATE) as f:
+        source = f.read()
+    legacy = source
+    for loop, sort in SORTED:
+        if loop not in legacy:
+            raise ValueError("{} has no loop over {}".format(TEMPLATE, loop))
+        legacy = legacy.replace(loop, sort)
+    with mock.patch.object(FileStorage, "_FileStorage__objects", {}):
+        storage = FileStorage()
+        for i in range(count):
+            state = State(name="state{:d}".format(count - i))
+            storage.new(state)
+            for j in range(20):
+                storage.new(City(name="city{:d}".format(20 - j),
+                                 state_id=state.id))
+        for i in range(100):
+            amenity = Amenity(name="amenity{:d}".format(100 - i))
+            storage.new(amenity)
+
+        def before():
+            """renders with the sort filters over unordered objects"""
+            storage.new(amenity)
+            states = list(storage.all("State").values())
+            cities = storage.children_of("City", "state_id",
+                                         [state.id for state in states])
+            render_template_string(legacy, states=states, cities=cities,
+                                   amenities=storage.all("Amenity")
+                                   .values())
+
+        def after():
+            """renders the objects of the name order views"""
+            storage.new(amenity)
+            fragments.render_sidebar(TEMPLATE)
+
+        def cached():
+            """gets the sidebar from the fragment cache"""
+            fragments.render_sidebar(TEMPLATE)
+        with app.test_request_context("/hbnb"):
+            old = best(before)
+            with mock.patch.object(fragments, "MAX_ENTRIES", 0):
+                new = best(after)
+            fragments.clear()
+            cached()
+            hit = best(cached)
+    print("states: {:d}, cities: {:d}".format(count, count * 20))
+    print("before: {:.1f} ms".format(old * 1000))
+    print("after:  {:.1f} ms ({:.1f}x)".format(new * 1000, old / new))
+    print("cached: {:.3f} ms ({:.0f}x)".format(hit * 1000, old / hit))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,69 @@
+#!/usr/bin/python3
+"""
+Measures the throughput of to_dict() plus JSON encoding, as done by the
+list endpoints, and of FileStorage.save(), in objects per second, with
+the cached isoformat() strings and orjson, and with strftime and the
+json module they replaced
+
+usage: python3 -m benchmarks.serialize [objects]
+"""
+import os
+import sys
+import tempfile
+import time as clock
+from unittest import mock
+from benchmarks.reload import generate
+from models import base_model
+from models.base_model import time
+from models.engine import json_backend
+from models.engine.file_storage import FileStorage, classes
+
+
+def best(func, repeat=3):
+    """returns the shortest of repeat runs of func, in seconds"""
+    times = []
+    for i in range(repeat):
+        tic = clock.perf_counter()
+        func()
+        times.append(clock.perf_counter() - tic)
+    return min(times)
+
+
+def measure(storage, objs):
+    """returns the encoding and save() throughputs over objs"""
+    def encode():
+        """encodes every object the way the list endpoints do"""
+        for obj in objs:
+            json_backend.dumps(obj.to_dict())
+    return len(objs) / best(encode), len(objs) / best(storage.save)
+
+
+def main(count):
+    """serializes count objects, then saves them to a temporary file"""
+    objs = [classes[value["__class__"]].from_storage_dict(value)
+            for value in generate(count).values()]
+    fd, path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    try:
+        with mock.patch.object(FileStorage, "_FileStorage__file_path",
+                               path), \
+                mock.patch.object(FileStorage, "_FileStorage__objects",
+                                  {}):
+            storage = FileStorage()
+            for obj in objs:
+                storage.new(obj)
+            with mock.patch.object(base_model, "format_time",
+                                   lambda value: value.strftime(time)), \
+                    mock.patch.object(json_backend, "orjson", None):
+                before = measure(storage, objs)
+            after = measure(storage, objs)
+    finally:
+        os.remove(path)
+    print("objects: {:d}".format(count))
+    for name, old, new in zip(("to_dict+dumps", "save()"), before, after):
+        print("{:14s} before: {:,.0f}/s  after: {:,.0f}/s ({:.1f}x)"
+              .format(name, old, new, new / old))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -4,6 +4,7 @@ Contains class BaseModel
 """
 
 from datetime import datetime
+from functools import lru_cache
 import models
 from os import getenv
 import sqlalchemy
@@ -12,19 +13,72 @@ from sqlalchemy.ext.declarative import declarative_base
 import uuid
 
 time = "%Y-%m-%dT%H:%M:%S.%f"
+# int - datetimes whose string in the time format is kept for to_dict()
+time_cache = int(getenv("HBNB_TIME_CACHE", "65536"))
+
+# boolean - keep the attributes of file storage objects in slots instead
+# of a dictionary per instance
+compact = models.storage_t != "db" and \
+    getenv("HBNB_COMPACT_MODELS") in ("1", "true")
+
+
+class Slotted(type):
+    """metaclass of the compact models: the attributes a class declares
+    with a default value become slots, and the defaults are kept in the
+    defaults dictionary of the class"""
+
+    def __new__(mcs, name, bases, namespace):
+        """creates the class, turning its data attributes into slots"""
+        defaults = {key: value for key, value in namespace.items()
+                    if not key.startswith("__") and
+                    not hasattr(value, "__get__")}
+        for key in defaults:
+            del namespace[key]
+        namespace["__slots__"] = tuple(defaults)
+        cls = super().__new__(mcs, name, bases, namespace)
+        inherited = getattr(cls, "defaults", {})
+        cls.defaults = dict(inherited, **defaults)
+        cls.fields = tuple(field for klass in reversed(cls.__mro__)
+                           for field in vars(klass).get("__slots__", ())
+                           if not field.endswith("__extra"))
+        return cls
+
 
 if models.storage_t == "db":
     Base = declarative_base()
+elif compact:
+    Base = Slotted("Base", (), {})
 else:
     Base = object
 
 
+def parse_time(value):
+    """returns the datetime of a string in the time format"""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        # fromisoformat() is much faster, but before Python 3.11 it only
+        # reads 3 or 6 digits of microseconds
+        return datetime.strptime(value, time)
+
+
+@lru_cache(maxsize=time_cache)
+def format_time(value):
+    """returns the string of a naive datetime in the time format; the
+    strings of timestamps that did not change are served from a cache"""
+    return value.isoformat(timespec="microseconds")
+
+
 class BaseModel:
     """The BaseModel class from which future classes will be derived"""
     if models.storage_t == "db":
         id = Column(String(60), primary_key=True)
         created_at = Column(DateTime, default=datetime.utcnow)
         updated_at = Column(DateTime, default=datetime.utcnow)
+    elif compact:
+        # attributes outside the slots go to the __extra dictionary
+        __slots__ = ("id", "created_at", "updated_at", "__extra")
+        fields = __slots__[:-1]
 
     def __init__(self, *args, **kwargs):
         """Initialization of the base model"""
@@ -33,11 +87,11 @@ class BaseModel:
                 if key != "__class__":
                     setattr(self, key, value)
             if kwargs.get("created_at", None) and type(self.created_at) is str:
-                self.created_at = datetime.strptime(kwargs["created_at"], time)
+                self.created_at = parse_time(kwargs["created_at"])
             else:
                 self.created_at = datetime.utcnow()
             if kwargs.get("updated_at", None) and type(self.updated_at) is str:
-                self.updated_at = datetime.strptime(kwargs["updated_at"], time)
+                self.updated_at = parse_time(kwargs["updated_at"])
             else:
                 self.updated_at = datetime.utcnow()
             if kwargs.get("id", None) is None:
@@ -47,6 +101,90 @@ class BaseModel:
             self.created_at = datetime.utcnow()
             self.updated_at = self.created_at
 
+    @classmethod
+    def from_storage_dict(cls, data):
+        """returns the instance storage serialized as data with to_dict(),
+        trusting data instead of setting its attributes one at a time
+        Args:
+            data (dict): dictionary read back from the storage file
+        Returns:
+            the new instance
+        """
+        if models.storage_t == "db":
+            return cls(**data)
+        obj = cls.__new__(cls)
+        if compact:
+            fields = cls.fields
+            for key, value in data.items():
+                if key in fields:
+                    object.__setattr__(obj, key, value)
+                elif key != "__class__":
+                    obj.__store(key, value)
+            for name in ("created_at", "updated_at"):
+                if name in data:
+                    object.__setattr__(obj, name, parse_time(data[name]))
+            return obj
+        attrs = obj.__dict__
+        attrs.update(data)
+        del attrs["__class__"]
+        for name in ("created_at", "updated_at"):
+            if name in attrs:
+                attrs[name] = parse_time(attrs[name])
+        return obj
+
+    if models.storage_t != "db":
+        def __setattr__(self, name, value):
+            """sets an attribute, keeping the storage indexes current"""
+            changed = (name == "name" or name.endswith(("_id", "_ids"))) \
+                and getattr(self, name, None) != value
+            if compact:
+                self.__store(name, value)
+            else:
+                super().__setattr__(name, value)
+            if changed and getattr(models, "storage", None) is not None:
+                models.storage.reindex(self)
+
+    if compact:
+        def __store(self, name, value):
+            """sets an attribute in its slot, or in the __extra dictionary
+            if the class has no attribute of that name"""
+            if hasattr(type(self), name):
+                object.__setattr__(self, name, value)
+                return
+            extra = getattr(self, "_BaseModel__extra", None)
+            if extra is None:
+                extra = {}
+                object.__setattr__(self, "_BaseModel__extra", extra)
+            extra[name] = value
+
+        def __getattr__(self, name):
+            """returns an attribute of the __extra dictionary, or the class
+            default of an empty slot"""
+            if name != "_BaseModel__extra":
+                extra = getattr(self, "_BaseModel__extra", None)
+                if extra is not None and name in extra:
+                    return extra[name]
+                defaults = getattr(type(self), "defaults", {})
+                if name in defaults:
+                    return defaults[name]
+            raise AttributeError("'{}' object has no attribute '{}'"
+                                 .format(type(self).__name__, name))
+
+        @property
+        def __dict__(self):
+            """returns a new dictionary of the attributes set on the
+            instance, as a model without slots would hold them"""
+            attrs = {}
+            for field in type(self).fields:
+                try:
+                    attrs[field] = object.__getattribute__(self, field)
+                except AttributeError:
+                    pass
+            extra = getattr(self, "_BaseModel__extra", None)
+            if extra:
+                attrs.update(extra)
+            return attrs
+
     def __str__(self):
         """String representation of the BaseModel class"""
         return "[{:s}] ({:s}) {}".format(self.__class__.__name__, self.id,
@@ -62,12 +200,11 @@ class BaseModel:
         """returns a dictionary containing all keys/values of the instance"""
         new_dict = self.__dict__.copy()
         if "created_at" in new_dict:
-            new_dict["created_at"] = new_dict["created_at"].strftime(time)
+            new_dict["created_at"] = format_time(new_dict["created_at"])
         if "updated_at" in new_dict:
-            new_dict["updated_at"] = new_dict["updated_at"].strftime(time)
+            new_dict["updated_at"] = format_time(new_dict["updated_at"])
         new_dict["__class__"] = self.__class__.__name__
-        if "_sa_instance_state" in new_dict:
-            del new_dict["_sa_instance_state"]
+        new_dict.pop("_sa_instance_state", None)
         return new_dict
 
     def delete(self):
@@ -4,7 +4,7 @@ import models
 from models.base_model import BaseModel, Base
 from os import getenv
 import sqlalchemy
-from sqlalchemy import Column, String, ForeignKey
+from sqlalchemy import Column, String, ForeignKey, Index
 from sqlalchemy.orm import relationship
 
 
@@ -12,6 +12,9 @@ class City(BaseModel, Base):
     """Representation of city """
     if models.storage_t == "db":
         __tablename__ = 'cities'
+        __table_args__ = (Index('ix_cities_state_id', 'state_id', 'created_at',
+                                'id'),
+                          Index('ix_cities_name', 'name'))
         state_id = Column(String(60), ForeignKey('states.id'), nullable=False)
         name = Column(String(128), nullable=False)
         places = relationship("Place", backref="city",
@@ -23,8 +26,4 @@ class City(BaseModel, Base):
     if models.storage_t != "db":
         @property
         def places(self):
-            places = []
-            for place in models.storage.all(models.place.Place).values():
-                if place.city_id == self.id:
-                    places.append(place)
-            return places
+            return models.storage.lookup("Place", "city_id", self.id)
@@ -0,0 +1,134 @@
+#!/usr/bin/python3
+"""
+Contains the BinarySnapshot class
+"""
+
+import json
+import mmap
+import os
+import struct
+
+# magic, number of records, offset of the sorted offset table
+HEADER = struct.Struct("<8sQQ")
+# key length, indexed values JSON length, record JSON length
+RECORD = struct.Struct("<HII")
+OFFSET = struct.Struct("<Q")
+MAGIC = b"HBNBSNP2"
+
+
+class BinarySnapshot:
+    """read-only, memory-mapped view of a binary snapshot
+
+    The file holds a header, length-prefixed records (key, foreign-key
+    values and record as JSON) and a table of record offsets sorted by
+    key, so one record is found by binary search and decoded alone.
+    The mapping is shared with every process reading the same file.
+    """
+
+    def __init__(self, path):
+        """maps the snapshot at path
+        Args:
+            path (str): path of the binary snapshot
+        Raises:
+            ValueError: if the file is not a binary snapshot
+        """
+        with open(path, 'rb') as f:
+            self.__mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.__count, self.__table = HEADER.unpack_from(self.__mm)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError("not a binary snapshot")
+
+    @staticmethod
+    def is_binary(path):
+        """tells whether the file at path is a binary snapshot"""
+        try:
+            with open(path, 'rb') as f:
+                return f.read(len(MAGIC)) == MAGIC
+        except OSError:
+            return False
+
+    @staticmethod
+    def dump(f, records):
+        """writes records to the binary file f
+        Args:
+            f (file): file opened for binary writing
+            records (list): (key, record JSON bytes, indexed values dict)
+                            tuples
+        """
+        records = sorted((key.encode(), value, json.dumps(fks).encode())
+                         for key, value, fks in records)
+        offsets = []
+        offset = HEADER.size
+        f.write(HEADER.pack(MAGIC, 0, 0))
+        for key, value, fks in records:
+            offsets.append(offset)
+            f.write(RECORD.pack(len(key), len(fks), len(value)))
+            for chunk in (key, fks, value):
+                f.write(chunk)
+            offset += RECORD.size + len(key) + len(fks) + len(value)
+        for record_offset in offsets:
+            f.write(OFFSET.pack(record_offset))
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, len(offsets), offset))
+        f.seek(0, os.SEEK_END)
+
+    def __key_at(self, index):
+        """returns the record offset and the encoded key at index"""
+        offset = OFFSET.unpack_from(self.__mm,
+                                    self.__table + index * OFFSET.size)[0]
+        key_len = RECORD.unpack_from(self.__mm, offset)[0]
+        start = offset + RECORD.size
+        return offset, self.__mm[start:start + key_len]
+
+    def __find(self, key):
+        """returns the offset of the record of key, or None"""
+        key = key.encode()
+        low, high = 0, self.__count
+        while low < high:
+            mid = (low + high) // 2
+            if self.__key_at(mid)[1] < key:
+                low = mid + 1
+            else:
+                high = mid
+        if low < self.__count:
+            offset, found = self.__key_at(low)
+            if found == key:
+                return offset
+        return None
+
+    def __fields(self, key):
+        """returns the offsets and lengths of the fields of key"""
+        offset = self.__find(key)
+        if offset is None:
+            raise KeyError(key)
+        key_len, fks_len, value_len = RECORD.unpack_from(self.__mm, offset)
+        return offset + RECORD.size + key_len, fks_len, value_len
+
+    def __contains__(self, key):
+        """tells whether the snapshot has a record for key"""
+        return self.__find(key) is not None
+
+    def __iter__(self):
+        """iterates over the keys of the snapshot in sorted order"""
+        for index in range(self.__count):
+            yield self.__key_at(index)[1].decode()
+
+    def __len__(self):
+        """returns the number of records in the snapshot"""
+        return self.__count
+
+    def read(self, key):
+        """returns the JSON text of the record of key"""
+        start, fks_len, value_len = self.__fields(key)
+        start += fks_len
+        return self.__mm[start:start + value_len]
+
+    def index_values(self, key):
+        """returns the indexed attribute values of the record of key"""
+        start, fks_len, value_len = self.__fields(key)
+        return json.loads(self.__mm[start:start + fks_len])
+
+    def close(self):
+        """unmaps the snapshot"""
+        self.__mm.close()
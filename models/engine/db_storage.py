@@ -3,17 +3,24 @@
 Contains the class DBStorage
 """
 
+from datetime import datetime
 import models
 from models.amenity import Amenity
-from models.base_model import BaseModel, Base
+from models.base_model import BaseModel, Base, time
 from models.city import City
+from models.engine.metered_pool import MeteredQueuePool, pool_options
+from models.engine.replica_router import ReplicaRouter, RoutingSession
 from models.place import Place
 from models.review import Review
 from models.state import State
 from models.user import User
 from os import getenv
 import sqlalchemy
-from sqlalchemy import create_engine
+from sqlalchemy import and_, create_engine, distinct, func, literal, or_
+from sqlalchemy import select
+from sqlalchemy import union_all
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import make_transient_to_detached
 from sqlalchemy.orm import scoped_session, sessionmaker
 
 classes = {"Amenity": Amenity, "City": City,
@@ -24,6 +31,13 @@ class DBStorage:
     """interaacts with the MySQL database"""
     __engine = None
     __session = None
+    __router = None
+    # list - callbacks given the names of the classes that changed
+    __listeners = []
+    # dictionary - class name to the number of times its objects changed
+    __generations = {}
+    # set - names of the classes changed since the last commit
+    __changed = set()
 
     def __init__(self):
         """Instantiate a DBStorage object"""
@@ -36,7 +50,18 @@ class DBStorage:
                                       format(HBNB_MYSQL_USER,
                                              HBNB_MYSQL_PWD,
                                              HBNB_MYSQL_HOST,
-                                             HBNB_MYSQL_DB))
+                                             HBNB_MYSQL_DB),
+                                      poolclass=MeteredQueuePool,
+                                      **pool_options())
+        # comma-separated database URLs of read replicas of the primary
+        replicas = [url.strip() for url in
+                    getenv('HBNB_MYSQL_REPLICAS', '').split(',')
+                    if url.strip()]
+        if replicas:
+            self.__router = ReplicaRouter(
+                [create_engine(url, poolclass=MeteredQueuePool,
+                               **pool_options()) for url in replicas],
+                float(getenv('HBNB_MYSQL_REPLICA_CHECK', '5')))
         if HBNB_ENV == "test":
             Base.metadata.drop_all(self.__engine)
 
@@ -51,25 +76,264 @@ class DBStorage:
                     new_dict[key] = obj
         return (new_dict)
 
+    @staticmethod
+    def __page(query, cls, limit, after):
+        """orders query by (created_at, id) and restricts it to the rows
+        after the (created_at, id) cursor after, limit rows at most;
+        rows are fetched from a server-side cursor as they are consumed"""
+        if after is not None:
+            created = datetime.strptime(after[0], time)
+            query = query.filter(or_(cls.created_at > created,
+                                     and_(cls.created_at == created,
+                                          cls.id > after[1])))
+        query = query.order_by(cls.created_at, cls.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return iter(query.yield_per(100))
+
+    def page(self, cls, limit=None, after=None, attr=None, value=None):
+        """returns the cls objects ordered by (created_at, id), with the
+        cursor and the limit pushed into the query
+        Args:
+            cls (class or str): class of the objects
+            limit (int): maximum number of objects, None for all
+            after (tuple): (created_at, id) of the last object of the
+                           previous page, None for the first page
+            attr (str): foreign-key column that must be value for the
+                        objects to be returned
+            value (str): id of the referenced object
+        Returns:
+            iterator: the objects of the page, read as they are consumed
+        """
+        cls = classes.get(cls, cls)
+        query = self.__session.query(cls)
+        if attr is not None:
+            query = query.filter(getattr(cls, attr) == value)
+        return self.__page(query, cls, limit, after)
+
+    def sorted_by_name(self, cls):
+        """returns the cls objects ordered by name, through the index on
+        the name column
+        Args:
+            cls (class or str): class of the objects
+        Returns:
+            list: the objects
+        """
+        cls = classes.get(cls, cls)
+        return self.__session.query(cls).order_by(cls.name, cls.id).all()
+
+    def children_of(self, cls, attr, ids, sort_by_name=False):
+        """returns the cls objects whose foreign key attr is one of ids,
+        grouped by id, with a single query
+        Args:
+            cls (class or str): class of the objects to look up
+            attr (str): foreign-key column name
+            ids (iterable): ids of the referenced objects
+            sort_by_name (bool): order each group by name
+        Returns:
+            dict: every id of ids to the list of its objects
+        """
+        cls = classes.get(cls, cls)
+        children = {id: [] for id in ids}
+        if children:
+            column = getattr(cls, attr)
+            query = self.__session.query(cls).filter(
+                column.in_(list(children)))
+            if sort_by_name:
+                query = query.order_by(cls.name, cls.id)
+            for obj in query:
+                children[getattr(obj, attr)].append(obj)
+        return children
+
+    def last_modified(self, cls, attr=None, value=None):
+        """returns when the cls objects last changed and how many there
+        are, with a single query
+        Args:
+            cls (class or str): class of the objects
+            attr (str): foreign-key column that must be value for the
+                        objects to be counted
+            value (str): id of the referenced object
+        Returns:
+            tuple: latest updated_at (None without objects), number of
+                   objects
+        """
+        cls = classes.get(cls, cls)
+        query = self.__session.query(func.max(cls.updated_at),
+                                     func.count(cls.id))
+        if attr is not None:
+            query = query.filter(getattr(cls, attr) == value)
+        latest, count = query.one()
+        return latest, count
+
+    def search_places(self, states=(), cities=(), amenities=(), limit=None,
+                      after=None):
+        """returns the places in any of the states or cities that have
+        all of the amenities, with a single query
+        Args:
+            states (list): State ids, none means every state
+            cities (list): City ids, added to the cities of states
+            amenities (list): Amenity ids a place must all have
+            limit (int): maximum number of places, None for all
+            after (tuple): (created_at, id) of the last place of the
+                           previous page, None for the first page
+        Returns:
+            iterator: the matching Place objects, ordered by
+                      (created_at, id)
+        """
+        from models.place import place_amenity
+        query = self.__session.query(Place)
+        if states or cities:
+            query = query.join(City, Place.city_id == City.id).filter(
+                or_(City.state_id.in_(states), City.id.in_(cities)))
+        amenities = set(amenities)
+        if amenities:
+            query = query.filter(Place.id.in_(
+                select(place_amenity.c.place_id)
+                .where(place_amenity.c.amenity_id.in_(amenities))
+                .group_by(place_amenity.c.place_id)
+                .having(func.count(distinct(place_amenity.c.amenity_id)) ==
+                        len(amenities))))
+        return self.__page(query, Place, limit, after)
+
+    def subscribe(self, callback):
+        """calls callback with a tuple of class names whenever objects of
+        those classes are added, changed or deleted"""
+        DBStorage.__listeners.append(callback)
+
+    def generation(self, *cls_names):
+        """returns a value that changes whenever objects of cls_names are
+        added, changed or deleted; the latest updated_at and the number
+        of rows of each class are part of it, so writes made by other
+        processes change it too
+        Args:
+            cls_names (str): names of the classes
+        Returns:
+            tuple: the generation of each class
+        """
+        generations = DBStorage.__generations
+        return tuple((generations.get(cls_name, 0),) +
+                     tuple(self.last_modified(cls_name))
+                     for cls_name in cls_names)
+
+    def __notify(self, *cls_names):
+        """tells the listeners that objects of cls_names changed, once
+        the change is committed so that nothing reads the old rows after
+        it"""
+        generations = DBStorage.__generations
+        for cls_name in cls_names:
+            generations[cls_name] = generations.get(cls_name, 0) + 1
+        for callback in DBStorage.__listeners:
+            callback(cls_names)
+
     def new(self, obj):
         """add the object to the current database session"""
         self.__session.add(obj)
+        self.__changed.add(obj.__class__.__name__)
+
+    @staticmethod
+    def __column_value(obj, column):
+        """returns the value of column in obj, set to the default of the
+        column if obj has none, as the ORM would do on insert"""
+        value = getattr(obj, column.key)
+        default = column.default
+        if value is None and default is not None:
+            value = default.arg if default.is_scalar else default.arg(None)
+            setattr(obj, column.key, value)
+        return value
+
+    def bulk_new(self, objs):
+        """inserts objs with one executemany per table, in a single
+        transaction
+        Args:
+            objs (iterable): objects to store
+        """
+        objs = list(objs)
+        rows = {}
+        for obj in objs:
+            table = obj.__table__
+            rows.setdefault(table, []).append(
+                {column.key: self.__column_value(obj, column)
+                 for column in table.columns})
+        try:
+            for table in Base.metadata.sorted_tables:
+                if table in rows:
+                    self.__session.execute(table.insert(), rows[table])
+            self.__session.commit()
+        except Exception:
+            self.__session.rollback()
+            raise
+        self.__notify(*{obj.__class__.__name__ for obj in objs})
+        # attach the inserted objects without inserting them again
+        for obj in objs:
+            make_transient_to_detached(obj)
+            self.__session.add(obj)
+
+    def bulk_update(self, cls, updates):
+        """sets attributes on objects of cls and commits them in a single
+        transaction
+        Args:
+            cls (class): class of the objects to update
+            updates (list): dictionaries holding the "id" of an object
+                            and the attributes to set on it
+        Returns:
+            list: the updated objects, unknown ids are skipped
+        """
+        ids = [values.get("id") for values in updates]
+        found = {obj.id: obj for obj in
+                 self.__session.query(cls).filter(cls.id.in_(ids))}
+        now = datetime.utcnow()
+        objs = []
+        for values in updates:
+            obj = found.get(values.get("id"))
+            if obj is None:
+                continue
+            for key, value in values.items():
+                if key != "id":
+                    setattr(obj, key, value)
+            obj.updated_at = now
+            objs.append(obj)
+        self.__session.commit()
+        self.__notify(cls.__name__)
+        return objs
 
     def save(self):
         """commit all changes of the current database session"""
         self.__session.commit()
+        changed, DBStorage.__changed = self.__changed, set()
+        if changed:
+            self.__notify(*changed)
 
     def delete(self, obj=None):
         """delete from the current database session obj if not None"""
         if obj is not None:
             self.__session.delete(obj)
+            self.__changed.add(obj.__class__.__name__)
 
     def reload(self):
         """reloads data from the database"""
         Base.metadata.create_all(self.__engine)
-        sess_factory = sessionmaker(bind=self.__engine, expire_on_commit=False)
+        self.__create_indexes()
+        sess_factory = sessionmaker(bind=self.__engine, expire_on_commit=False,
+                                    class_=RoutingSession,
+                                    router=self.__router)
         Session = scoped_session(sess_factory)
         self.__session = Session
+        self.__notify(*classes)
+
+    def __create_indexes(self):
+        """creates the indexes declared on the models that are missing
+        from tables created before they were declared, which create_all()
+        leaves untouched; an index another worker creates at the same
+        time is left as it is"""
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                try:
+                    index.create(self.__engine, checkfirst=True)
+                except DBAPIError as e:
+                    message = str(e.orig)
+                    if ("already exists" not in message and
+                            "Duplicate key name" not in message):
+                        raise
 
     def close(self):
         """call remove() method on the private session attribute"""
@@ -87,11 +351,58 @@ class DBStorage:
             return self.__session.get(cls, id)
         return None
 
+    def get_many(self, cls, ids):
+        """A method to retrieve the objects of several ids with a single
+        query
+        Args:
+            cls (class or str): class of the objects
+            ids (iterable): object IDs
+        Returns:
+            dict: ID to object, for the IDs found
+        """
+        cls = classes.get(cls, cls)
+        ids = list(set(ids))
+        if not ids:
+            return {}
+        return {obj.id: obj for obj in
+                self.__session.query(cls).filter(cls.id.in_(ids))}
+
     def count(self, cls=None):
         """A method to count the number of objects in storage
         Args:
             cls (str): class name
         """
         if cls:
-            return len(self.all(cls))
-        return len(self.all())
+            cls = classes.get(cls, cls)
+            return self.__session.query(func.count(cls.id)).scalar()
+        return sum(self.counts().values())
+
+    def pool_stats(self):
+        """returns the metrics of the connection pool
+        Returns:
+            dict: see MeteredQueuePool.stats, empty if the engine does not
+                  use a metered pool; with read replicas, "replicas" lists
+                  their health, reads and pool metrics
+        """
+        stats = {}
+        pool = self.__engine.pool
+        if isinstance(pool, MeteredQueuePool):
+            stats = pool.stats()
+        if self.__router is not None:
+            stats["replicas"] = []
+            for engine, health in zip(self.__router.engines(),
+                                      self.__router.stats()):
+                if isinstance(engine.pool, MeteredQueuePool):
+                    health.update(engine.pool.stats())
+                stats["replicas"].append(health)
+        return stats
+
+    def counts(self):
+        """count the rows of every table with a single query
+        Returns:
+            dict: class name to number of objects
+        """
+        query = union_all(*[select(literal(name), func.count())
+                            .select_from(cls.__table__)
+                            for name, cls in classes.items()])
+        return dict(self.__session.execute(query).all())
@@ -3,10 +3,18 @@
 Contains the FileStorage class
 """
 
-import json
+from bisect import bisect_right, insort
+from datetime import datetime
+import hashlib
+import os
+from os import getenv
+import threading
 from models.amenity import Amenity
-from models.base_model import BaseModel
+from models.base_model import BaseModel, parse_time, time
 from models.city import City
+from models.engine import json_backend
+from models.engine.binary_snapshot import BinarySnapshot
+from models.engine.lazy_objects import JSONSnapshot, LazyObjects, share_ids
 from models.place import Place
 from models.review import Review
 from models.state import State
@@ -23,51 +31,741 @@ class FileStorage:
     __file_path = "file.json"
     # dictionary - empty but will store all objects by <class name>.id
     __objects = {}
+    # tuple - foreign-key attributes maintained in secondary indexes
+    fk_attrs = ("state_id", "city_id", "place_id", "user_id", "amenity_ids")
+    # tuple - attributes the indexes are built from, read without loading
+    # the objects in lazy mode
+    index_attrs = fk_attrs + ("created_at", "updated_at", "name")
+    # dictionary - per-class, foreign-key, creation order, update time and
+    # name order indexes over __objects, and the memo of children_of()
+    __indexes = None
+    # tuple - (inode, size, mtime) of the files when last saved or loaded
+    __file_stat = None
+    # boolean - append changed objects to a journal instead of rewriting
+    __journal = getenv("HBNB_FILE_JOURNAL") in ("1", "true")
+    # int - journal records allowed before it is compacted into the file
+    __journal_max = int(getenv("HBNB_FILE_JOURNAL_MAX", "1000"))
+    # int - records appended to the journal since the last snapshot
+    __journal_len = 0
+    # boolean - append a sha256 footer to the JSON file when saving
+    __checksum = getenv("HBNB_FILE_CHECKSUM") in ("1", "true")
+    # dictionary - the __objects the file and journal were written from
+    __journaled = None
+    # tuple - (inode, size, mtime) of the file the journal applies to
+    __journal_base = None
+    # tuple - (inode, size, mtime) of a file that failed its checksum
+    __corrupt = None
+    # set - keys of objects added or deleted since the last save
+    __dirty = set()
+    # boolean - read objects from the file only when they are accessed
+    __lazy = getenv("HBNB_FILE_LAZY") in ("1", "true")
+    # int - objects kept in memory once read in lazy mode
+    __lazy_max = int(getenv("HBNB_FILE_LAZY_MAX", "10000"))
+    # string - "json", or "binary" for a memory-mapped binary snapshot
+    __format = getenv("HBNB_FILE_FORMAT", "json")
+    # list - callbacks given the names of the classes that changed
+    __listeners = []
+    # dictionary - class name to the number of times its objects changed
+    __generations = {}
+
+    def subscribe(self, callback):
+        """calls callback with a tuple of class names whenever objects of
+        those classes are added, changed or deleted"""
+        FileStorage.__listeners.append(callback)
+
+    def generation(self, *cls_names):
+        """returns a value that changes whenever objects of cls_names are
+        added, changed or deleted, or reloaded from the file
+        Args:
+            cls_names (str): names of the classes
+        Returns:
+            tuple: the generation of each class
+        """
+        generations = FileStorage.__generations
+        return tuple(generations.get(cls_name, 0) for cls_name in cls_names)
+
+    def __changed(self, *cls_names):
+        """tells the listeners that objects of cls_names changed"""
+        self.__forget()
+        generations = FileStorage.__generations
+        for cls_name in cls_names:
+            generations[cls_name] = generations.get(cls_name, 0) + 1
+        for callback in FileStorage.__listeners:
+            callback(cls_names)
+
+    @staticmethod
+    def __forget():
+        """empties the memo of children_of()"""
+        if FileStorage.__indexes is not None:
+            FileStorage.__indexes["memo"].clear()
+
+    def __journal_path(self):
+        """returns the path of the journal next to the JSON file"""
+        return self.__file_path + ".journal"
+
+    def __stat(self):
+        """returns the (inode, size, mtime) signatures of the JSON file
+        and its journal, None for a file that does not exist"""
+        sig = []
+        for path in (self.__file_path, self.__journal_path()):
+            try:
+                st = os.stat(path)
+                sig.append((st.st_ino, st.st_size, st.st_mtime_ns))
+            except OSError:
+                sig.append(None)
+        return tuple(sig)
+
+    def __index(self):
+        """returns the secondary indexes, rebuilding them if __objects
+        was replaced or modified behind the storage's back"""
+        objects = self.__objects
+        indexes = FileStorage.__indexes
+        if (indexes is None or indexes["objects"] is not objects or
+                indexes["size"] != len(objects)):
+            indexes = {"objects": objects, "size": 0, "classes": {},
+                       "fks": {}, "entries": {}, "created": {},
+                       "updated": {}, "sorted": {}, "names": {},
+                       "by_name": {}, "memo": {}}
+            FileStorage.__indexes = indexes
+            for key in objects:
+                self.__index_add(indexes, key, self.__values(objects, key))
+            indexes["size"] = len(objects)
+        return indexes
+
+    @staticmethod
+    def __index_values(obj):
+        """returns the indexed attribute values of obj, with created_at
+        and updated_at as the strings to_dict() writes"""
+        values = {attr: getattr(obj, attr, None)
+                  for attr in FileStorage.index_attrs}
+        for attr in ("created_at", "updated_at"):
+            if isinstance(values[attr], datetime):
+                values[attr] = values[attr].strftime(time)
+        return values
+
+    @staticmethod
+    def __values(objects, key):
+        """returns the indexed attribute values of the object under key,
+        without reading it from disk in lazy mode"""
+        if isinstance(objects, LazyObjects):
+            obj = objects.peek(key)
+            if obj is None:
+                return objects.index_values(key)
+        else:
+            obj = objects[key]
+        return FileStorage.__index_values(obj)
+
+    @staticmethod
+    def __name_key(name):
+        """returns the sort key of name, compared case-insensitively like
+        Jinja's sort filter does"""
+        return name.lower() if isinstance(name, str) else ""
+
+    @staticmethod
+    def __index_add(indexes, key, fks):
+        """adds key to the per-class, foreign-key, creation order and
+        name order indexes"""
+        cls_name = key.split(".", 1)[0]
+        indexes["classes"].setdefault(cls_name, {})[key] = None
+        created = fks.get("created_at") or ""
+        indexes["created"][key] = created
+        indexes["updated"][key] = fks.get("updated_at") or ""
+        order = indexes["sorted"].get(cls_name)
+        if order is not None:
+            insort(order, (created, key))
+        name = FileStorage.__name_key(fks.get("name"))
+        indexes["names"][key] = name
+        views = indexes["by_name"]
+        entries = []
+        for attr in FileStorage.fk_attrs:
+            values = fks.get(attr)
+            if not values:
+                continue
+            if not isinstance(values, list):
+                values = [values]
+            for value in values:
+                entry = (cls_name, attr, value)
+                indexes["fks"].setdefault(entry, {})[key] = None
+                entries.append(entry)
+        indexes["entries"][key] = entries
+        for view in [cls_name] + entries:
+            order = views.get(view)
+            if order is not None:
+                insort(order, (name, key))
+
+    @staticmethod
+    def __index_remove(indexes, key):
+        """removes key from the per-class, foreign-key, creation order
+        and name order indexes"""
+        cls_name = key.split(".", 1)[0]
+        bucket = indexes["classes"].get(cls_name)
+        if bucket is not None:
+            bucket.pop(key, None)
+        created = indexes["created"].pop(key, None)
+        indexes["updated"].pop(key, None)
+        order = indexes["sorted"].get(cls_name)
+        if created is not None and order is not None:
+            i = bisect_right(order, (created, key)) - 1
+            if i >= 0 and order[i] == (created, key):
+                del order[i]
+        entries = indexes["entries"].pop(key, ())
+        name = indexes["names"].pop(key, None)
+        if name is not None:
+            views = indexes["by_name"]
+            for view in [cls_name] + entries:
+                order = views.get(view)
+                if order is not None:
+                    i = bisect_right(order, (name, key)) - 1
+                    if i >= 0 and order[i] == (name, key):
+                        del order[i]
+        for entry in entries:
+            children = indexes["fks"].get(entry)
+            if children is not None:
+                children.pop(key, None)
+                if not children:
+                    del indexes["fks"][entry]
 
     def all(self, cls=None):
-        """returns the dictionary __objects"""
+        """returns the dictionary __objects
+        Args:
+            cls (class or str): class of the objects, None for all
+        """
         if cls is not None:
-            new_dict = {}
-            for key, value in self.__objects.items():
-                if cls == value.__class__ or cls == value.__class__.__name__:
-                    new_dict[key] = value
-            return new_dict
+            if not isinstance(cls, str):
+                cls = cls.__name__
+            indexes = self.__index()
+            objects = indexes["objects"]
+            return {key: objects[key]
+                    for key in indexes["classes"].get(cls, ())}
         return self.__objects
 
+    def lookup(self, cls, attr, value):
+        """returns the list of cls objects whose foreign key attr is value
+        Args:
+            cls (class or str): class of the objects to look up
+            attr (str): foreign-key attribute name, one of fk_attrs; for
+                        a list attribute, value must be one of its items
+            value (str): id of the referenced object
+        Returns:
+            list: the matching objects
+        """
+        return list(self.children_of(cls, attr, (value,))[value])
+
+    def sorted_by_name(self, cls):
+        """returns the cls objects ordered by name, case-insensitively,
+        from a name order index kept sorted as objects are written
+        Args:
+            cls (class or str): class of the objects
+        Returns:
+            list: the objects
+        """
+        if not isinstance(cls, str):
+            cls = cls.__name__
+        indexes = self.__index()
+        order = self.__name_view(indexes, cls,
+                                 indexes["classes"].get(cls, ()))
+        return list(self.__resolve(indexes["objects"], order))
+
+    @staticmethod
+    def __name_view(indexes, view, keys):
+        """returns the (name, key) pairs of keys sorted by name, built
+        on first use and then kept sorted by the writes"""
+        order = indexes["by_name"].get(view)
+        if order is None:
+            names = indexes["names"]
+            order = sorted((names[key], key) for key in keys)
+            indexes["by_name"][view] = order
+        return order
+
+    def children_of(self, cls, attr, ids, sort_by_name=False):
+        """returns the cls objects whose foreign key attr is one of ids,
+        grouped by id; the groups are memoized until the next write or
+        close(), which ends each request
+        Args:
+            cls (class or str): class of the objects to look up
+            attr (str): foreign-key attribute name; for a list attribute,
+                        the objects are grouped by each of its items
+            ids (iterable): ids of the referenced objects
+            sort_by_name (bool): order each group by name, from name
+                                 order indexes kept sorted on writes
+        Returns:
+            dict: every id of ids to the list of its objects, which must
+                  not be modified
+        """
+        if not isinstance(cls, str):
+            cls = cls.__name__
+        indexes = self.__index()
+        memo = indexes["memo"]
+        children = {}
+        missing = []
+        for id in ids:
+            group = memo.get((cls, attr, id, sort_by_name))
+            if group is None:
+                missing.append(id)
+            else:
+                children[id] = group
+        if not missing:
+            return children
+        if attr in self.fk_attrs:
+            objects = indexes["objects"]
+            fks = indexes["fks"]
+            if sort_by_name:
+                found = {id: list(self.__resolve(objects, self.__name_view(
+                    indexes, (cls, attr, id), fks.get((cls, attr, id), ()))))
+                    for id in missing}
+            else:
+                found = {id: [objects[key]
+                              for key in fks.get((cls, attr, id), ())]
+                         for id in missing}
+        else:
+            # not indexed: group in a single scan of the class
+            found = {id: [] for id in missing}
+            for obj in self.all(cls).values():
+                value = getattr(obj, attr, None)
+                if isinstance(value, str) and value in found:
+                    found[value].append(obj)
+            if sort_by_name:
+                for group in found.values():
+                    group.sort(key=lambda obj: self.__name_key(
+                        getattr(obj, "name", None)))
+        for id, group in found.items():
+            memo[(cls, attr, id, sort_by_name)] = group
+        children.update(found)
+        return children
+
+    def page(self, cls, limit=None, after=None, attr=None, value=None):
+        """returns the cls objects ordered by (created_at, id), using a
+        creation order index kept sorted as objects are added
+        Args:
+            cls (class or str): class of the objects
+            limit (int): maximum number of objects, None for all
+            after (tuple): (created_at, id) of the last object of the
+                           previous page, None for the first page
+            attr (str): foreign-key attribute, one of fk_attrs, that
+                        must be value for the objects to be returned
+            value (str): id of the referenced object
+        Returns:
+            iterator: the objects of the page, read as they are consumed
+        """
+        if not isinstance(cls, str):
+            cls = cls.__name__
+        indexes = self.__index()
+        if attr is not None:
+            keys = indexes["fks"].get((cls, attr, value), ())
+            return self.__ordered(indexes, keys, limit, after)
+        order = indexes["sorted"].get(cls)
+        if order is None:
+            created = indexes["created"]
+            order = sorted((created[key], key)
+                           for key in indexes["classes"].get(cls, ()))
+            indexes["sorted"][cls] = order
+        start = 0
+        if after is not None:
+            start = bisect_right(order, (after[0], cls + "." + after[1]))
+        stop = len(order) if limit is None else start + limit
+        return self.__resolve(indexes["objects"], order[start:stop])
+
+    def last_modified(self, cls, attr=None, value=None):
+        """returns when the cls objects last changed and how many there
+        are, from the update time index
+        Args:
+            cls (class or str): class of the objects
+            attr (str): foreign-key attribute, one of fk_attrs, that
+                        must be value for the objects to be counted
+            value (str): id of the referenced object
+        Returns:
+            tuple: latest updated_at as a datetime (None without
+                   objects), number of objects
+        """
+        if not isinstance(cls, str):
+            cls = cls.__name__
+        indexes = self.__index()
+        if attr is None:
+            keys = indexes["classes"].get(cls, ())
+        else:
+            keys = indexes["fks"].get((cls, attr, value), ())
+        updated = indexes["updated"]
+        latest = max((updated[key] for key in keys), default="")
+        if not latest:
+            return None, len(keys)
+        return parse_time(latest), len(keys)
+
+    @staticmethod
+    def __resolve(objects, order):
+        """yields the objects of the (created_at or name, key) pairs of
+        order, skipping those deleted since the page was cut"""
+        for created, key in order:
+            obj = objects.get(key)
+            if obj is not None:
+                yield obj
+
+    @staticmethod
+    def __ordered(indexes, keys, limit, after):
+        """returns the objects of keys ordered by (created_at, id),
+        starting after the (created_at, id) cursor after"""
+        created = indexes["created"]
+        order = sorted((created[key], key) for key in keys)
+        start = 0
+        if after is not None and order:
+            cls_name = order[0][1].split(".", 1)[0]
+            start = bisect_right(order, (after[0],
+                                         cls_name + "." + after[1]))
+        stop = len(order) if limit is None else start + limit
+        return FileStorage.__resolve(indexes["objects"], order[start:stop])
+
+    def search_places(self, states=(), cities=(), amenities=(), limit=None,
+                      after=None):
+        """returns the places in any of the states or cities that have
+        all of the amenities, using the foreign-key indexes
+        Args:
+            states (list): State ids, none means every state
+            cities (list): City ids, added to the cities of states
+            amenities (list): Amenity ids a place must all have
+            limit (int): maximum number of places, None for all
+            after (tuple): (created_at, id) of the last place of the
+                           previous page, None for the first page
+        Returns:
+            iterator: the matching Place objects, ordered by
+                      (created_at, id)
+        """
+        indexes = self.__index()
+        fks = indexes["fks"]
+        keys = None
+        if states or cities:
+            city_ids = set(cities)
+            for state_id in states:
+                city_ids.update(key.split(".", 1)[1] for key in
+                                fks.get(("City", "state_id", state_id), ()))
+            keys = set()
+            for city_id in city_ids:
+                keys.update(fks.get(("Place", "city_id", city_id), ()))
+        having = [fks.get(("Place", "amenity_ids", amenity_id), {})
+                  for amenity_id in set(amenities)]
+        for places in sorted(having, key=len):
+            if keys is None:
+                keys = set(places)
+            elif len(keys) <= len(places):
+                keys = {key for key in keys if key in places}
+            else:
+                keys = {key for key in places if key in keys}
+        if keys is None:
+            return self.page(Place, limit, after)
+        return self.__ordered(indexes, keys, limit, after)
+
     def new(self, obj):
         """sets in __objects the obj with key <obj class name>.id"""
         if obj is not None:
             key = obj.__class__.__name__ + "." + obj.id
+            indexes = self.__index()
+            self.__index_remove(indexes, key)
             self.__objects[key] = obj
+            self.__index_add(indexes, key, self.__index_values(obj))
+            self.__dirty.add(key)
+            indexes["size"] = len(self.__objects)
+            self.__changed(obj.__class__.__name__)
+
+    def bulk_new(self, objs):
+        """adds every object of objs and saves them in a single pass
+        Args:
+            objs (iterable): objects to store
+        """
+        for obj in objs:
+            self.new(obj)
+        self.save()
+
+    def bulk_update(self, cls, updates):
+        """sets attributes on objects of cls and saves them in one pass
+        Args:
+            cls (class): class of the objects to update
+            updates (list): dictionaries holding the "id" of an object
+                            and the attributes to set on it
+        Returns:
+            list: the updated objects, unknown ids are skipped
+        """
+        now = datetime.utcnow()
+        objs = []
+        for values in updates:
+            obj = self.get(cls, values.get("id"))
+            if obj is None:
+                continue
+            for key, value in values.items():
+                if key != "id":
+                    setattr(obj, key, value)
+            obj.updated_at = now
+            self.new(obj)
+            objs.append(obj)
+        self.save()
+        return objs
+
+    def reindex(self, obj):
+        """refreshes the foreign-key and name index entries of obj after
+        its attributes changed"""
+        key = obj.__class__.__name__ + "." + str(getattr(obj, "id", None))
+        indexes = FileStorage.__indexes
+        if indexes is None:
+            return
+        objects = indexes["objects"]
+        if isinstance(objects, LazyObjects):
+            current = objects.peek(key)
+        else:
+            current = objects.get(key)
+        if current is obj:
+            self.__index_remove(indexes, key)
+            self.__index_add(indexes, key, self.__index_values(obj))
+            self.__forget()
 
     def save(self):
-        """serializes __objects to the JSON file (path: __file_path)"""
-        json_objects = {}
+        """serializes __objects to the JSON file (path: __file_path), or
+        appends only the changed objects to the journal in journal mode
+        Raises:
+            ValueError: if the file failed its checksum when reloaded and
+                        is still there, to keep it for recovery
+        """
+        if (FileStorage.__corrupt is not None and
+                FileStorage.__corrupt == self.__stat()[0]):
+            raise ValueError("{} does not match its checksum, not writing "
+                             "over it".format(self.__file_path))
+        if (self.__journal and self.__objects is FileStorage.__journaled and
+                FileStorage.__journal_len + len(self.__dirty) <=
+                self.__journal_max and
+                FileStorage.__journal_base is not None and
+                FileStorage.__journal_base == self.__stat()[0]):
+            self.__append()
+        else:
+            self.__snapshot()
+        self.__dirty.clear()
+        self.__file_stat = self.__stat()
+
+    def __snapshot(self):
+        """writes every object to the JSON file and drops the journal
+
+        The snapshot is written to a temporary file, fsynced and renamed
+        over the JSON file, so readers never see a partial file.
+        """
+        objects = self.__objects
+        binary = self.__format == "binary"
+        tmp_path = "{}.{}.{}.tmp".format(self.__file_path, os.getpid(),
+                                         threading.get_ident())
+        try:
+            with open(tmp_path, 'wb') as f:
+                if binary:
+                    BinarySnapshot.dump(f, [(key,) + self.__record(key)
+                                            for key in objects])
+                else:
+                    records = self.__dump_json(f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.__file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        if isinstance(objects, LazyObjects):
+            if binary:
+                snapshot = BinarySnapshot(self.__file_path)
+            else:
+                snapshot = JSONSnapshot(self.__file_path, self.index_attrs,
+                                        records)
+            objects.rebase(snapshot)
+        try:
+            os.remove(self.__journal_path())
+        except FileNotFoundError:
+            pass
+        FileStorage.__journal_len = 0
+        FileStorage.__journaled = self.__objects
+        FileStorage.__journal_base = self.__stat()[0]
+
+    def __record(self, key):
+        """returns the JSON text and the indexed values of key, copying
+        the text from the current file when it is unchanged"""
+        objects = self.__objects
+        value = None
+        if isinstance(objects, LazyObjects):
+            value = objects.raw(key)
+        fks = self.__values(objects, key)
+        if value is None:
+            value = json_backend.dumps(objects[key].to_dict())
+        return value, {attr: fk for attr, fk in fks.items() if fk}
+
+    def __dump_json(self, f):
+        """writes the objects to f as a JSON object with one record per
+        line, followed by a sha256 footer if checksums are enabled
+        Returns:
+            dict: key to (offset, length, indexed values) of records
+        """
+        hasher = hashlib.sha256()
+        records = {}
+        offset = 0
         for key in self.__objects:
-            json_objects[key] = self.__objects[key].to_dict()
-        with open(self.__file_path, 'w') as f:
-            json.dump(json_objects, f)
+            value, fks = self.__record(key)
+            prefix = (b",\n" if offset else b"{\n") + \
+                json_backend.dumps(key) + b": "
+            records[key] = (offset + len(prefix), len(value), fks)
+            for chunk in (prefix, value):
+                f.write(chunk)
+                hasher.update(chunk)
+            offset += len(prefix) + len(value)
+        end = b"\n}" if offset else b"{\n}"
+        f.write(end)
+        hasher.update(end)
+        if self.__checksum:
+            f.write(b"\n#sha256 " + hasher.hexdigest().encode())
+        f.write(b"\n")
+        return records
+
+    def __append(self):
+        """appends one JSON line per changed object to the journal, with
+        a null value for deleted objects
+
+        A new journal starts with the signature of the JSON file it
+        applies to, so it is not replayed over another file.
+        """
+        lines = []
+        for key in self.__dirty:
+            obj = self.__objects.get(key)
+            value = obj.to_dict() if obj is not None else None
+            lines.append(json_backend.dumps({"key": key, "value": value}) +
+                         b"\n")
+        with open(self.__journal_path(), 'ab') as f:
+            if f.tell() == 0:
+                f.write(json_backend.dumps(
+                    {"snapshot": FileStorage.__journal_base}) + b"\n")
+            f.writelines(lines)
+        FileStorage.__journal_len += len(lines)
+
+    @staticmethod
+    def __verify(data):
+        """returns the JSON file content without its sha256 footer
+        Raises:
+            ValueError: if the content does not match the footer
+        """
+        body, sep, digest = data.rstrip(b"\n").rpartition(b"\n#sha256 ")
+        if sep:
+            if hashlib.sha256(body).hexdigest() != digest.decode():
+                raise ValueError("checksum mismatch")
+            data = body
+        return data
+
+    def __journal_matches(self, header):
+        """tells whether the journal header line was written for the
+        JSON file reload() read"""
+        snapshot = self.__file_stat[0]
+        if snapshot is None:
+            return False
+        try:
+            return json_backend.loads(header)["snapshot"] == list(snapshot)
+        except (ValueError, TypeError, KeyError):
+            return False
 
     def reload(self):
-        """deserializes the JSON file to __objects"""
+        """deserializes the JSON file to __objects, then replays the
+        journal over it if it was written for that file
+        Raises:
+            ValueError: if the file does not match its checksum footer;
+                        save() then refuses to write over it
+        """
+        FileStorage.__indexes = None
+        self.__file_stat = self.__stat()
+        FileStorage.__corrupt = None
+        # id to the one string the objects loaded share for it
+        ids = {}
+        if not self.__reload_lazy():
+            try:
+                with open(self.__file_path, 'rb') as f:
+                    data = f.read()
+            except OSError:
+                data = b""
+            try:
+                data = self.__verify(data)
+            except ValueError:
+                FileStorage.__corrupt = self.__file_stat[0]
+                raise ValueError("{} does not match its checksum"
+                                 .format(self.__file_path))
+            try:
+                jo = json_backend.loads(data)
+                for key, value in jo.items():
+                    share_ids(value, ids, self.fk_attrs)
+                    cls = classes[value["__class__"]]
+                    self.__objects[key] = cls.from_storage_dict(value)
+            except Exception:
+                pass
+        FileStorage.__journaled = self.__objects
+        FileStorage.__journal_len = 0
+        FileStorage.__journal_base = self.__file_stat[0]
         try:
-            with open(self.__file_path, 'r') as f:
-                jo = json.load(f)
-            for key in jo:
-                self.__objects[key] = classes[jo[key]["__class__"]](**jo[key])
-        except Exception:
+            with open(self.__journal_path(), 'rb') as f:
+                lines = f
+                if not self.__journal_matches(f.readline()):
+                    # left over from another file: compact on the next save
+                    FileStorage.__journaled = None
+                    lines = ()
+                for line in lines:
+                    try:
+                        record = json_backend.loads(line)
+                    except ValueError:
+                        # torn write: compact on the next save
+                        FileStorage.__journaled = None
+                        break
+                    key, value = record["key"], record["value"]
+                    if value is None:
+                        self.__objects.pop(key, None)
+                    else:
+                        share_ids(value, ids, self.fk_attrs)
+                        cls = classes[value["__class__"]]
+                        self.__objects[key] = cls.from_storage_dict(value)
+                    FileStorage.__journal_len += 1
+        except OSError:
             pass
+        self.__changed(*classes)
+
+    def __reload_lazy(self):
+        """replaces __objects with a LazyObjects over the file, if it is
+        a binary snapshot or lazy mode is on, keeping in-memory objects
+        the file does not have
+        Returns:
+            bool: False if the file was not loaded lazily
+        """
+        try:
+            if BinarySnapshot.is_binary(self.__file_path):
+                snapshot = BinarySnapshot(self.__file_path)
+            elif self.__lazy:
+                snapshot = JSONSnapshot(self.__file_path, self.index_attrs)
+            else:
+                return False
+        except (OSError, ValueError):
+            return False
+        objects = LazyObjects(snapshot, classes, self.index_attrs,
+                              self.__lazy_max)
+        old = self.__objects
+        if isinstance(old, LazyObjects):
+            old = old.unsaved()
+        for key, obj in old.items():
+            if key not in objects:
+                objects[key] = obj
+        if "_FileStorage__objects" in self.__dict__:
+            self.__objects = objects
+        else:
+            FileStorage.__objects = objects
+        return True
 
     def delete(self, obj=None):
         """delete obj from __objects if it’s inside"""
         if obj is not None:
             key = obj.__class__.__name__ + '.' + obj.id
             if key in self.__objects:
+                indexes = self.__index()
                 del self.__objects[key]
+                self.__index_remove(indexes, key)
+                self.__dirty.add(key)
+                indexes["size"] = len(self.__objects)
+                self.__changed(obj.__class__.__name__)
 
     def close(self):
-        """call reload() method for deserializing the JSON file to objects"""
-        self.reload()
+        """call reload() method for deserializing the JSON file to objects,
+        unless the file is unchanged since it was last saved or loaded"""
+        self.__forget()
+        if self.__stat() != self.__file_stat:
+            self.reload()
 
     def get(self, cls, id):
         """retrieve one object
@@ -82,6 +780,24 @@ class FileStorage:
             return self.__objects.get(key)
         return None
 
+    def get_many(self, cls, ids):
+        """retrieve the objects of several ids
+        Args:
+            cls (class or str): class of the objects
+            ids (iterable): object IDs
+        Returns:
+            dict: ID to object, for the IDs found
+        """
+        if not isinstance(cls, str):
+            cls = cls.__name__
+        objects = self.__objects
+        found = {}
+        for id in ids:
+            obj = objects.get(cls + '.' + str(id))
+            if obj is not None:
+                found[id] = obj
+        return found
+
     def count(self, cls=None):
         """count the number of objects in storage
         Args:
@@ -90,5 +806,15 @@ class FileStorage:
             int: number of objects in storage
         """
         if cls:
-            return len(self.all(cls))
-        return len(self.all())
+            if not isinstance(cls, str):
+                cls = cls.__name__
+            return len(self.__index()["classes"].get(cls, ()))
+        return len(self.__objects)
+
+    def counts(self):
+        """count the number of objects of every class in storage
+        Returns:
+            dict: class name to number of objects
+        """
+        return {cls: len(keys)
+                for cls, keys in self.__index()["classes"].items()}
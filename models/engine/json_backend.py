@@ -0,0 +1,50 @@
+#!/usr/bin/python3
+"""
+JSON encoding and decoding shared by the file engine and the API, with
+orjson when it is installed and the json module otherwise
+"""
+import json
+from os import getenv
+
+# string - "json" forces the json module even when orjson is installed
+BACKEND = getenv("HBNB_JSON_BACKEND", "orjson")
+
+orjson = None
+if BACKEND == "orjson":
+    try:
+        import orjson
+    except ImportError:
+        BACKEND = "json"
+
+# options making orjson hand the types the json module cannot encode to
+# default, so both backends accept the same objects
+_OPTIONS = 0 if orjson is None else (orjson.OPT_PASSTHROUGH_DATETIME |
+                                     orjson.OPT_PASSTHROUGH_DATACLASS)
+
+
+def dumps(obj, default=None, sort_keys=False):
+    """returns the compact JSON encoding of obj, as UTF-8 bytes
+    Args:
+        obj: object to encode
+        default (callable): returns an encodable version of the objects
+                            JSON cannot encode natively
+        sort_keys (bool): write the keys of dictionaries in sorted order
+    """
+    if orjson is not None:
+        option = _OPTIONS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        try:
+            return orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            # non-string keys or integers wider than 64 bits: let the
+            # json module encode them, or raise its own error
+            pass
+    return json.dumps(obj, default=default, sort_keys=sort_keys,
+                      ensure_ascii=False,
+                      separators=(",", ":")).encode("utf-8")
+
+
+def loads(data):
+    """returns the object encoded in data, str or bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,278 @@
+#!/usr/bin/python3
+"""
+Contains the JSONSnapshot and LazyObjects classes
+"""
+
+from collections import OrderedDict
+from collections.abc import MutableMapping
+import hashlib
+import json
+import os
+from models.engine import json_backend
+
+
+def share_ids(record, ids, attrs):
+    """replaces the id and the foreign keys of record by the equal strings
+    already in ids, adding the new ones, so that every id loaded is held
+    in memory once however many objects reference it
+    Args:
+        record (dict): dictionary of an object read from a snapshot
+        ids (dict): id to the string shared by the records loaded
+        attrs (tuple): attributes holding ids, as a string or a list of
+                       strings
+    """
+    if "id" in record:
+        record["id"] = ids.setdefault(record["id"], record["id"])
+    for attr in attrs:
+        value = record.get(attr)
+        if type(value) is str:
+            record[attr] = ids.setdefault(value, value)
+        elif type(value) is list:
+            record[attr] = [ids.setdefault(item, item) for item in value]
+
+
+class JSONSnapshot:
+    """byte ranges of the records of a line-per-record JSON snapshot,
+    whose JSON is only decoded once a record is accessed"""
+
+    def __init__(self, path, attrs, records=None):
+        """scans the snapshot at path for the byte range of every record
+        Args:
+            path (str): path of the JSON snapshot
+            attrs (tuple): attributes kept for the storage indexes
+            records (dict): key to (offset, length, indexed values),
+                            to skip the scan of a file just written
+        Raises:
+            OSError: if the file cannot be opened
+            ValueError: if the file is not a line-per-record snapshot or
+                        its checksum footer does not match
+        """
+        self.__path = path
+        self.__attrs = attrs
+        # id to the string shared by the indexed values decoded
+        self.__ids = {}
+        self.__fd = None
+        # the file is opened once, so that reads hit the file that was
+        # indexed even if another writer replaces it afterwards
+        self.__fd = os.open(path, os.O_RDONLY)
+        self.__records = records
+        if records is None:
+            self.__records = {}
+            try:
+                self.__scan()
+            except Exception:
+                self.close()
+                raise
+
+    def __scan(self):
+        """records where each record of the snapshot starts and ends,
+        from the '"<key>": {' prefix and the closing brace of its line,
+        without decoding the record
+        Raises:
+            ValueError: if a line is not a record, the closing brace or
+                        the checksum footer
+        """
+        hasher = hashlib.sha256()
+        digest = None
+        closed = False
+        with open(self.__fd, 'rb', closefd=False) as f:
+            if f.readline() != b"{\n":
+                raise ValueError("not a line-per-record snapshot")
+            # the checksum covers the file up to the closing brace
+            hasher.update(b"{\n")
+            offset = 2
+            for line in f:
+                if closed:
+                    if not line.startswith(b"#sha256 "):
+                        raise ValueError("data after the closing brace")
+                    digest = line[8:].strip().decode()
+                    break
+                if line.rstrip(b"\n") == b"}":
+                    hasher.update(b"}")
+                    closed = True
+                elif line.startswith(b'"'):
+                    hasher.update(line)
+                    sep = line.find(b'": {')
+                    if sep < 0:
+                        raise ValueError("not a line-per-record snapshot")
+                    key = line[1:sep]
+                    try:
+                        if b"\\" in key:
+                            key = json.loads(line[:sep + 1])
+                        else:
+                            key = key.decode()
+                    except ValueError:
+                        raise ValueError("not a line-per-record snapshot")
+                    start = sep + 3
+                    stop = len(line.rstrip(b",\n"))
+                    if not isinstance(key, str) or \
+                            line[stop - 1:stop] != b"}":
+                        raise ValueError("not a line-per-record snapshot")
+                    self.__records[key] = (offset + start, stop - start,
+                                           None)
+                else:
+                    raise ValueError("not a line-per-record snapshot")
+                offset += len(line)
+        if not closed:
+            raise ValueError("truncated snapshot")
+        if digest is not None and hasher.hexdigest() != digest:
+            raise ValueError("checksum mismatch")
+
+    def __contains__(self, key):
+        """tells whether the snapshot has a record for key"""
+        return key in self.__records
+
+    def __iter__(self):
+        """iterates over the keys of the snapshot"""
+        return iter(self.__records)
+
+    def __len__(self):
+        """returns the number of records in the snapshot"""
+        return len(self.__records)
+
+    def read(self, key):
+        """returns the JSON text of the record of key"""
+        offset, length, values = self.__records[key]
+        if self.__fd is None:
+            raise ValueError("snapshot closed")
+        return os.pread(self.__fd, length, offset)
+
+    def index_values(self, key):
+        """returns the indexed attribute values of the record of key,
+        decoding the record the first time
+        Raises:
+            ValueError: if the record is not a JSON object
+        """
+        offset, length, values = self.__records[key]
+        if values is None:
+            record = json_backend.loads(self.read(key))
+            if not isinstance(record, dict):
+                raise ValueError("not a record: {}".format(key))
+            values = {attr: record[attr] for attr in self.__attrs
+                      if record.get(attr)}
+            share_ids(values, self.__ids, self.__attrs)
+            self.__records[key] = (offset, length, values)
+        return values
+
+    def close(self):
+        """closes the snapshot file descriptor"""
+        if self.__fd is not None:
+            os.close(self.__fd)
+            self.__fd = None
+
+    def __del__(self):
+        """closes the snapshot file descriptor"""
+        self.close()
+
+
+class LazyObjects(MutableMapping):
+    """maps <class name>.id keys to objects that are read from a
+    snapshot only when they are accessed"""
+
+    def __init__(self, snapshot, classes, attrs, max_hydrated=10000):
+        """wraps snapshot, a JSONSnapshot or a BinarySnapshot
+        Args:
+            snapshot: read-only view of the records on disk
+            classes (dict): class name to class mapping
+            attrs (tuple): attributes kept for the storage indexes
+            max_hydrated (int): objects kept in memory once read
+        """
+        self.__snapshot = snapshot
+        self.__classes = classes
+        self.__attrs = attrs
+        self.__max = max_hydrated
+        # on-disk records read back as objects, least recently used first
+        self.__hydrated = OrderedDict()
+        # objects set in memory that are not in the snapshot as they are
+        self.__pinned = {}
+        # keys of the snapshot that were deleted or are pinned
+        self.__masked = set()
+
+    def __getitem__(self, key):
+        """returns the object under key, reading it from disk if needed"""
+        obj = self.__pinned.get(key)
+        if obj is not None:
+            return obj
+        obj = self.__hydrated.get(key)
+        if obj is not None:
+            self.__hydrated.move_to_end(key)
+            return obj
+        if key in self.__masked or key not in self.__snapshot:
+            raise KeyError(key)
+        value = json_backend.loads(self.__snapshot.read(key))
+        obj = self.__classes[value["__class__"]].from_storage_dict(value)
+        self.__hydrated[key] = obj
+        if len(self.__hydrated) > self.__max:
+            self.__hydrated.popitem(last=False)
+        return obj
+
+    def __setitem__(self, key, obj):
+        """keeps obj in memory under key until the next snapshot"""
+        self.__hydrated.pop(key, None)
+        self.__pinned[key] = obj
+        if key in self.__snapshot:
+            self.__masked.add(key)
+
+    def __delitem__(self, key):
+        """forgets the object under key"""
+        if key not in self:
+            raise KeyError(key)
+        self.__pinned.pop(key, None)
+        self.__hydrated.pop(key, None)
+        if key in self.__snapshot:
+            self.__masked.add(key)
+
+    def __contains__(self, key):
+        """tells whether key is stored, without reading it from disk"""
+        return key in self.__pinned or (key not in self.__masked and
+                                        key in self.__snapshot)
+
+    def __iter__(self):
+        """iterates over every key, on disk or in memory"""
+        masked = set(self.__masked)
+        for key in self.__snapshot:
+            if key not in masked:
+                yield key
+        yield from list(self.__pinned)
+
+    def __len__(self):
+        """returns the number of stored objects"""
+        return (len(self.__snapshot) - len(self.__masked) +
+                len(self.__pinned))
+
+    def peek(self, key):
+        """returns the object under key if it is in memory, else None"""
+        return self.__pinned.get(key) or self.__hydrated.get(key)
+
+    def raw(self, key):
+        """returns the JSON text of key as it is on disk, or None if the
+        object is held in memory and must be serialized from there"""
+        if key in self.__pinned or key in self.__hydrated:
+            return None
+        return self.__snapshot.read(key)
+
+    def index_values(self, key):
+        """returns the indexed attribute values of key without reading
+        it"""
+        obj = self.peek(key)
+        if obj is not None:
+            return {attr: getattr(obj, attr, None)
+                    for attr in self.__attrs}
+        return self.__snapshot.index_values(key)
+
+    def unsaved(self):
+        """returns the objects set in memory since the last snapshot"""
+        return dict(self.__pinned)
+
+    def rebase(self, snapshot):
+        """switches to a freshly written snapshot holding every object
+        Args:
+            snapshot: read-only view of the new file
+        """
+        self.__snapshot.close()
+        self.__snapshot = snapshot
+        self.__hydrated.update(self.__pinned)
+        self.__pinned = {}
+        self.__masked = set()
+        while len(self.__hydrated) > self.__max:
+            self.__hydrated.popitem(last=False)
@@ -0,0 +1,82 @@
+#!/usr/bin/python3
+"""
+Contains the MeteredQueuePool class and the pool settings of DBStorage
+"""
+
+from os import getenv
+import threading
+import time
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import QueuePool
+
+# create_engine argument: (environment variable, type, default)
+POOL_SETTINGS = {
+    "pool_size": ("HBNB_MYSQL_POOL_SIZE", int, 5),
+    "max_overflow": ("HBNB_MYSQL_POOL_MAX_OVERFLOW", int, 10),
+    "pool_timeout": ("HBNB_MYSQL_POOL_TIMEOUT", float, 30),
+    "pool_recycle": ("HBNB_MYSQL_POOL_RECYCLE", int, 3600),
+    "pool_pre_ping": ("HBNB_MYSQL_POOL_PRE_PING", bool, True),
+}
+
+
+def pool_options():
+    """returns the create_engine pool arguments set by the HBNB_MYSQL_POOL_*
+    environment variables, with their defaults for the unset ones"""
+    options = {}
+    for option, (name, kind, default) in POOL_SETTINGS.items():
+        value = getenv(name)
+        if value is None:
+            options[option] = default
+        elif kind is bool:
+            options[option] = value in ("1", "true")
+        else:
+            options[option] = kind(value)
+    return options
+
+
+class MeteredQueuePool(QueuePool):
+    """QueuePool that counts checkouts and times how long they wait for a
+    connection"""
+
+    def __init__(self, *args, **kwargs):
+        """creates the pool with zeroed counters"""
+        super().__init__(*args, **kwargs)
+        self.__lock = threading.Lock()
+        self.__checkouts = 0
+        self.__timeouts = 0
+        self.__wait_total = 0.0
+        self.__wait_max = 0.0
+
+    def connect(self):
+        """checks a connection out, recording the time spent waiting for
+        it and whether the wait timed out"""
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        except TimeoutError:
+            with self.__lock:
+                self.__timeouts += 1
+            raise
+        finally:
+            wait = time.perf_counter() - start
+            with self.__lock:
+                self.__checkouts += 1
+                self.__wait_total += wait
+                self.__wait_max = max(self.__wait_max, wait)
+
+    def stats(self):
+        """returns the pool metrics
+        Returns:
+            dict: pool size, connections checked out and in, overflow,
+                  number of checkouts and timeouts, total and longest
+                  checkout wait in seconds
+        """
+        with self.__lock:
+            return {"size": self.size(),
+                    "checked_out": self.checkedout(),
+                    "checked_in": self.checkedin(),
+                    "overflow": max(self.overflow(), 0),
+                    "checkouts": self.__checkouts,
+                    "timeouts": self.__timeouts,
+                    "wait_total": self.__wait_total,
+                    "wait_max": self.__wait_max}
@@ -0,0 +1,102 @@
+#!/usr/bin/python3
+"""
+Contains the ReplicaRouter and RoutingSession classes
+"""
+
+import threading
+import time
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+
+class ReplicaRouter:
+    """hands out read replica engines round-robin, skipping the ones that
+    failed their last health check"""
+
+    def __init__(self, engines, check_interval=5):
+        """keeps the replica engines
+        Args:
+            engines (list): engines of the read replicas
+            check_interval (float): seconds between two health checks of
+                                    a replica
+        """
+        self.__engines = list(engines)
+        self.__interval = check_interval
+        self.__lock = threading.Lock()
+        self.__next = 0
+        # per replica: [healthy, monotonic time of the last check, reads]
+        self.__health = [[True, None, 0] for engine in self.__engines]
+
+    def __check(self, index):
+        """tells whether the replica at index is healthy, running
+        SELECT 1 on it if its last check is older than the interval"""
+        health = self.__health[index]
+        now = time.monotonic()
+        if health[1] is not None and now - health[1] < self.__interval:
+            return health[0]
+        try:
+            with self.__engines[index].connect() as conn:
+                conn.execute(text("SELECT 1"))
+            healthy = True
+        except Exception:
+            healthy = False
+        with self.__lock:
+            health[0], health[1] = healthy, now
+        return healthy
+
+    def engine(self):
+        """returns the next healthy replica engine, or None if none is"""
+        for attempt in range(len(self.__engines)):
+            with self.__lock:
+                index = self.__next
+                self.__next = (index + 1) % len(self.__engines)
+            if self.__check(index):
+                with self.__lock:
+                    self.__health[index][2] += 1
+                return self.__engines[index]
+        return None
+
+    def engines(self):
+        """returns the replica engines"""
+        return list(self.__engines)
+
+    def stats(self):
+        """returns, for every replica, whether it is healthy and how many
+        reads it was given"""
+        with self.__lock:
+            return [{"healthy": healthy, "reads": reads}
+                    for healthy, checked, reads in self.__health]
+
+
+class RoutingSession(Session):
+    """session sending reads to a replica and writes to the primary
+    engine it is bound to; once it has written, every read goes to the
+    primary too, so it reads its own writes"""
+
+    def __init__(self, router=None, **kwargs):
+        """creates the session
+        Args:
+            router (ReplicaRouter): replicas to read from, None to use
+                                    the primary only
+        """
+        super().__init__(**kwargs)
+        self.router = router
+        self.wrote = False
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        """returns a replica engine for the SELECTs of a session that has
+        not written, the primary engine otherwise"""
+        if clause is not None and not clause.is_select:
+            self.wrote = True
+        elif (self.router is not None and not self.wrote and
+                not self._flushing and clause is not None):
+            engine = self.router.engine()
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def stick_to_primary(session, flush_context):
+    """routes the reads of session to the primary once it wrote"""
+    session.wrote = True
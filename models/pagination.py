@@ -0,0 +1,80 @@
+#!/usr/bin/python3
+"""
+keyset pagination helpers shared by the API and the web pages
+"""
+import base64
+from datetime import datetime
+import json
+from models.base_model import time
+
+# largest page a client can ask for
+MAX_LIMIT = 1000
+
+
+def encode_cursor(obj):
+    """returns the opaque cursor pointing right after obj"""
+    data = json.dumps([obj.created_at.strftime(time), obj.id])
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """returns the (created_at, id) tuple encoded in cursor
+    Raises:
+        ValueError: if cursor was not made by encode_cursor
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, id = json.loads(data)
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(created_at, str) or not isinstance(id, str):
+        raise ValueError("Invalid cursor")
+    try:
+        datetime.strptime(created_at, time)
+    except ValueError:
+        raise ValueError("Invalid cursor")
+    return created_at, id
+
+
+def page_args(args):
+    """returns the (limit, after) pagination arguments of a query string,
+    None for the ones that are not given
+    Args:
+        args (dict): arguments of the query string, with the optional
+                     limit and cursor
+    Raises:
+        ValueError: if limit is not a positive integer or cursor is
+                    not valid
+    """
+    limit = args.get('limit')
+    if limit is not None:
+        try:
+            limit = int(limit)
+        except ValueError:
+            raise ValueError("Invalid limit")
+        if limit < 1:
+            raise ValueError("Invalid limit")
+        limit = min(limit, MAX_LIMIT)
+    cursor = args.get('cursor')
+    after = decode_cursor(cursor) if cursor else None
+    return limit, after
+
+
+def fetch_page(fetch, limit, after):
+    """returns the objects of one page and the cursor of the next page
+    Args:
+        fetch (function): called with (limit, after), returns an iterator
+                          over the objects ordered by (created_at, id)
+        limit (int): size of the page, None for every object
+        after (tuple): (created_at, id) cursor of the previous page
+    Returns:
+        tuple: iterable over the objects, cursor of the next page or
+               None on the last page
+    """
+    if limit is None:
+        return fetch(None, after), None
+    objs = list(fetch(limit + 1, after))
+    if len(objs) > limit:
+        objs = objs[:limit]
+        return objs, encode_cursor(objs[-1])
+    return objs, None
@@ -5,6 +5,7 @@ from models.base_model import BaseModel, Base
 from os import getenv
 import sqlalchemy
 from sqlalchemy import Column, String, Integer, Float, ForeignKey, Table
+from sqlalchemy import Index
 from sqlalchemy.orm import relationship
 
 if models.storage_t == 'db':
@@ -16,13 +17,21 @@ if models.storage_t == 'db':
                           Column('amenity_id', String(60),
                                  ForeignKey('amenities.id', onupdate='CASCADE',
                                             ondelete='CASCADE'),
-                                 primary_key=True))
+                                 primary_key=True),
+                          Index('ix_place_amenity_amenity_id', 'amenity_id',
+                                'place_id'))
 
 
 class Place(BaseModel, Base):
     """Representation of Place """
     if models.storage_t == 'db':
         __tablename__ = 'places'
+        __table_args__ = (Index('ix_places_city_id', 'city_id', 'created_at',
+                                'id'),
+                          Index('ix_places_user_id', 'user_id'),
+                          Index('ix_places_created_at', 'created_at', 'id'),
+                          Index('ix_places_price_by_night', 'price_by_night'),
+                          Index('ix_places_name', 'name'))
         city_id = Column(String(60), ForeignKey('cities.id'), nullable=False)
         user_id = Column(String(60), ForeignKey('users.id'), nullable=False)
         name = Column(String(128), nullable=False)
@@ -54,26 +63,34 @@ class Place(BaseModel, Base):
     def __init__(self, *args, **kwargs):
         """initializes Place"""
         super().__init__(*args, **kwargs)
+        if models.storage_t != 'db' and "amenity_ids" not in kwargs:
+            # a list of its own rather than the class default, which every
+            # place would share and append to
+            self.amenity_ids = []
+
+    @classmethod
+    def from_storage_dict(cls, data):
+        """returns the place storage serialized as data, with a list of
+        amenity ids of its own"""
+        place = super().from_storage_dict(data)
+        if models.storage_t != 'db' and "amenity_ids" not in data:
+            place.amenity_ids = []
+        return place
 
     if models.storage_t != 'db':
         @property
         def reviews(self):
             """getter attribute returns the list of Review instances"""
             from models.review import Review
-            review_list = []
-            all_reviews = models.storage.all(Review)
-            for review in all_reviews.values():
-                if review.place_id == self.id:
-                    review_list.append(review)
-            return review_list
+            return models.storage.lookup(Review, "place_id", self.id)
 
         @property
         def amenities(self):
             """getter attribute returns the list of Amenity instances"""
             from models.amenity import Amenity
             amenity_list = []
-            all_amenities = models.storage.all(Amenity)
-            for amenity in all_amenities.values():
-                if amenity.place_id == self.id:
+            for amenity_id in self.amenity_ids:
+                amenity = models.storage.get(Amenity, amenity_id)
+                if amenity is not None:
                     amenity_list.append(amenity)
             return amenity_list
@@ -4,7 +4,7 @@ import models
 from models.base_model import BaseModel, Base
 from os import getenv
 import sqlalchemy
-from sqlalchemy import Column, String
+from sqlalchemy import Column, String, Index
 from sqlalchemy.orm import relationship
 
 
@@ -12,6 +12,8 @@ class User(BaseModel, Base):
     """Representation of a user """
     if models.storage_t == 'db':
         __tablename__ = 'users'
+        __table_args__ = (Index('ix_users_created_at', 'created_at', 'id'),
+                          Index('ix_users_email', 'email'))
         email = Column(String(128), nullable=False)
         password = Column(String(128), nullable=False)
         first_name = Column(String(128), nullable=True)
@@ -52,6 +52,14 @@ class TestApp(BaseTestCase):
         resp = self.client.get('/not_found')
         self.assertEqual(404, resp.status_code)
 
+    def test_cors_exposes_cursor(self):
+        """Test that browsers can read the cursor of the next page."""
+        resp = self.client.get('/api/v1/states?limit=1',
+                               headers={'Origin': 'http://localhost:5000'})
+        resp.get_data()
+        self.assertIn('X-Next-Cursor',
+                      resp.headers.get('Access-Control-Expose-Headers', ''))
+
     def test_cors(self):
         """Test CORS."""
         resp = self.client.get('/api/v1/status')
@@ -0,0 +1,155 @@
+#!/usr/bin/python3
+"""
+Contains tests for api/v1/cache.py.
+"""
+import inspect
+import unittest
+from unittest import mock
+import pycodestyle
+from tests.test_api.test_v1.base_test import BaseTestCase, TestData
+from api.v1 import cache
+
+
+class TestCacheDocs(unittest.TestCase):
+    """Tests to check the documentation and style cache.py."""
+
+    def test_pep8_conformance_cache(self):
+        """Test that api/v1/cache.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/cache.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_cache_module_docstring(self):
+        """Test for the api/v1/cache.py module docstring"""
+        self.assertIsNot(cache.__doc__, None,
+                         "api/v1/cache.py needs a docstring")
+        self.assertTrue(len(cache.__doc__) >= 1,
+                        "api/v1/cache.py needs a docstring")
+
+    def test_cache_func_docstrings(self):
+        """Test for the presence of docstrings in cache.py functions"""
+        funcs = inspect.getmembers(cache, inspect.isfunction)
+        funcs += inspect.getmembers(cache.MemoryCache, inspect.isfunction)
+        for name, func in funcs:
+            if func.__module__ == cache.__name__:
+                self.assertIsNot(func.__doc__, None,
+                                 f"{name} needs a docstring")
+
+
+class TestMemoryCache(unittest.TestCase):
+    """Test the MemoryCache backend."""
+
+    def test_lru(self):
+        """Test that the least recently used entry is dropped."""
+        backend = cache.MemoryCache(2)
+        backend.set("a", 1, 60)
+        backend.set("b", 2, 60)
+        self.assertEqual(backend.get("a"), 1)
+        backend.set("c", 3, 60)
+        self.assertIsNone(backend.get("b"))
+        self.assertEqual(backend.get("a"), 1)
+        self.assertEqual(backend.get("c"), 3)
+
+    def test_ttl(self):
+        """Test that entries expire."""
+        backend = cache.MemoryCache()
+        with mock.patch("time.monotonic", return_value=100):
+            backend.set("a", 1, 10)
+        with mock.patch("time.monotonic", return_value=109):
+            self.assertEqual(backend.get("a"), 1)
+        with mock.patch("time.monotonic", return_value=110):
+            self.assertIsNone(backend.get("a"))
+
+    def test_counters(self):
+        """Test that counters survive evictions."""
+        backend = cache.MemoryCache(1)
+        self.assertEqual(backend.counter("n"), 0)
+        self.assertEqual(backend.incr("n"), 1)
+        backend.set("a", 1, 60)
+        backend.set("b", 2, 60)
+        self.assertEqual(backend.counter("n"), 1)
+
+
+class TestCache(BaseTestCase):
+    """Test the caching of the API responses."""
+
+    def setUp(self):
+        """Create test data, with the cache on in every storage mode."""
+        super().setUp()
+        ttl = mock.patch.object(cache, "TTL", 60)
+        ttl.start()
+        self.addCleanup(ttl.stop)
+        self.test_data = TestData(self.storage)
+
+    def tearDown(self):
+        """Destroy test_data."""
+        super().tearDown()
+        del self.test_data
+
+    def test_hit_and_304(self):
+        """Test that a cached response carries an ETag that gives 304s."""
+        first = self.client.get('/api/v1/states').json
+        second = self.client.get('/api/v1/states')
+        self.assertEqual(first, second.json)
+        etag = second.headers.get('ETag')
+        self.assertIsNotNone(etag)
+        resp = self.client.get('/api/v1/states',
+                               headers={'If-None-Match': etag})
+        self.assertEqual(resp.status_code, 304)
+        self.assertEqual(resp.data, b"")
+
+    def test_one_validator(self):
+        """Test that hits and misses carry the ETag of conditional()."""
+        first = self.client.get('/api/v1/states')
+        first.get_data()
+        second = self.client.get('/api/v1/states')
+        self.assertEqual(second.headers.get('ETag'),
+                         first.headers.get('ETag'))
+        self.client.get('/api/v1/stats').get_data()
+        self.assertNotIn('ETag', self.client.get('/api/v1/stats').headers)
+
+    def test_hit_keeps_cursor(self):
+        """Test that a cached page carries the cursor of the next page."""
+        first = self.client.get('/api/v1/states?limit=1')
+        first.get_data()
+        cursor = first.headers.get('X-Next-Cursor')
+        self.assertIsNotNone(cursor)
+        second = self.client.get('/api/v1/states?limit=1')
+        self.assertEqual(second.get_data(), first.get_data())
+        self.assertEqual(second.headers.get('X-Next-Cursor'), cursor)
+
+    def test_invalidation(self):
+        """Test that writes drop the responses reading their class."""
+        self.client.get('/api/v1/states').get_data()
+        states = cache.backend.counter("generation:State")
+        self.client.post('/api/v1/amenities', json={"name": "Wifi"})
+        self.assertEqual(cache.backend.counter("generation:State"), states)
+        resp = self.client.post('/api/v1/states', json={"name": "Nevada"})
+        self.assertGreater(cache.backend.counter("generation:State"),
+                           states)
+        names = [s["name"] for s in self.client.get('/api/v1/states').json]
+        self.assertIn("Nevada", names)
+        self.client.delete(f"/api/v1/states/{resp.json['id']}")
+        names = [s["name"] for s in self.client.get('/api/v1/states').json]
+        self.assertNotIn("Nevada", names)
+
+    def test_keyed_by_storage_generation(self):
+        """Test that writes made by another process miss the cache."""
+        self.client.get('/api/v1/states').get_data()
+        with mock.patch.object(cache.backend, "set") as store:
+            self.client.get('/api/v1/states').get_data()
+            store.assert_not_called()
+            with mock.patch.object(self.storage, "generation",
+                                   return_value=((1, None, 0),)):
+                self.client.get('/api/v1/states').get_data()
+            store.assert_called_once()
+
+    def test_keyed_by_body(self):
+        """Test that places_search results are keyed by the request body."""
+        state = self.test_data.get('State')[1]
+        everything = self.client.post('/api/v1/places_search', json={})
+        self.assertEqual(len(everything.json), 6)
+        some = self.client.post('/api/v1/places_search',
+                                json={"states": [state.id]})
+        self.assertEqual(len(some.json), 1)
@@ -0,0 +1,44 @@
+#!/usr/bin/python3
+"""
+Contains tests for api/v1/json_provider.py.
+"""
+import unittest
+import pycodestyle
+from tests.test_api.test_v1.base_test import BaseTestCase
+from api.v1 import app as app_py, json_provider
+
+
+class TestJSONProviderDocs(unittest.TestCase):
+    """Tests to check the documentation and style json_provider.py."""
+
+    def test_pep8_conformance_json_provider(self):
+        """Test that api/v1/json_provider.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/json_provider.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_json_provider_module_docstring(self):
+        """Test for the api/v1/json_provider.py module docstring"""
+        self.assertIsNot(json_provider.__doc__, None,
+                         "api/v1/json_provider.py needs a docstring")
+        self.assertTrue(len(json_provider.__doc__) >= 1,
+                        "api/v1/json_provider.py needs a docstring")
+
+
+class TestFastJSONProvider(BaseTestCase):
+    """Test the responses encoded by FastJSONProvider."""
+
+    def test_jsonify(self):
+        """Test that jsonify writes compact JSON with sorted keys."""
+        with app_py.app.test_request_context():
+            resp = app_py.app.json.response({"b": 1, "a": [1, 2]})
+        self.assertEqual(resp.get_data(), b'{"a":[1,2],"b":1}\n')
+        self.assertEqual(resp.mimetype, "application/json")
+
+    def test_request_body(self):
+        """Test that request bodies are decoded."""
+        resp = self.client.post('/api/v1/states',
+                                json={"name": "Café"})
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual(resp.json["name"], "Café")
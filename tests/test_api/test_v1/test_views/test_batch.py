@@ -0,0 +1,115 @@
+#!/usr/bin/python3
+"""Test the api/v1/views/batch.py module."""
+import unittest
+import os
+import pycodestyle
+from tests.test_api.test_v1.base_test import BaseTestCase, TestData
+from api.v1.views import batch
+from models.city import City
+from models.place import Place
+from models.state import State
+import json
+
+
+class TestBatchDocs(unittest.TestCase):
+    """Checks that the documentation and style of batch.py."""
+
+    def test_pep8_conformance_batch(self):
+        """Test that api/v1/views/batch.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/views/batch.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_batch_module_docstring(self):
+        """Test for the api/v1/views/batch.py module docstring"""
+        self.assertIsNot(batch.__doc__, None,
+                         "api/v1/views/batch.py needs a docstring")
+        self.assertTrue(len(batch.__doc__) >= 1,
+                        "api/v1/views/batch.py needs a docstring")
+
+
+class TestBatch(BaseTestCase):
+    """Test the batch module."""
+
+    def setUp(self):
+        """Create test data."""
+        super().setUp()
+        self.test_data = TestData(self.storage)
+        self.state = self.test_data.get('State')[0]
+
+    def tearDown(self):
+        """Destroy test_data."""
+        super().tearDown()
+        del self.test_data
+        del self.state
+
+    def test_post_batch_success(self):
+        """Test that every object of the list is created."""
+        headers = {"Content-Type": "application/json"}
+        data = [{"name": "City_{}".format(i), "state_id": self.state.id}
+                for i in range(3)]
+        resp = self.client.post('/api/v1/batch/cities', headers=headers,
+                                data=json.dumps(data))
+        self.assertEqual(resp.status_code, 201)
+        self.assertEqual([d["name"] for d in resp.json],
+                         [d["name"] for d in data])
+        for d in resp.json:
+            self.assertIsNotNone(self.storage.get(City, d["id"]))
+
+    def test_post_batch_minimal_places(self):
+        """Test that places are created with the defaults of the fields
+        they are posted without, like with POST /places."""
+        headers = {"Content-Type": "application/json"}
+        city = self.test_data.get('City')[0]
+        user = self.test_data.get('User')[0]
+        data = [{"name": "Place_{}".format(i), "city_id": city.id,
+                 "user_id": user.id} for i in range(2)]
+        resp = self.client.post('/api/v1/batch/places', headers=headers,
+                                data=json.dumps(data))
+        self.assertEqual(resp.status_code, 201)
+        for d in resp.json:
+            place = self.storage.get(Place, d["id"])
+            self.assertEqual(place.number_rooms, 0)
+            self.assertEqual(place.price_by_night, 0)
+
+    def test_post_batch_fail(self):
+        """Test that an invalid list creates nothing."""
+        headers = {"Content-Type": "application/json"}
+        count = self.storage.count(City)
+        data = [{"name": "City_1", "state_id": self.state.id},
+                {"name": "City_2"}]
+        resp = self.client.post('/api/v1/batch/cities', headers=headers,
+                                data=json.dumps(data))
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(resp.json, {"error": "Missing state_id"})
+        data = [{"name": "City_1", "state_id": "000"}]
+        resp = self.client.post('/api/v1/batch/cities', headers=headers,
+                                data=json.dumps(data))
+        self.assertEqual(resp.status_code, 404)
+        resp = self.client.post('/api/v1/batch/cities', headers=headers,
+                                data=json.dumps({"name": "City_1"}))
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(resp.json, {"error": "Not a list"})
+        resp = self.client.post('/api/v1/batch/nothing', headers=headers,
+                                data=json.dumps([]))
+        self.assertEqual(resp.status_code, 404)
+        self.assertEqual(self.storage.count(City), count)
+
+    def test_put_batch(self):
+        """Test that every object of the list is updated."""
+        headers = {"Content-Type": "application/json"}
+        states = self.test_data.get('State')
+        data = [{"id": s.id, "name": "New_" + s.name, "created_at": "x"}
+                for s in states]
+        resp = self.client.put('/api/v1/batch/states', headers=headers,
+                               data=json.dumps(data))
+        self.assertEqual(resp.status_code, 200)
+        for s in states:
+            state = self.storage.get(State, s.id)
+            self.assertTrue(state.name.startswith("New_"))
+            self.assertNotEqual(state.to_dict()["created_at"], "x")
+        resp = self.client.put('/api/v1/batch/states', headers=headers,
+                               data=json.dumps([{"name": "x"}]))
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(resp.json, {"error": "Missing id"})
@@ -0,0 +1,122 @@
+#!/usr/bin/python3
+"""Test the api/v1/views/conditional.py module."""
+import unittest
+import pycodestyle
+from tests.test_api.test_v1.base_test import BaseTestCase, TestData
+from api.v1.views import conditional
+
+
+class TestConditionalDocs(unittest.TestCase):
+    """Checks that the documentation and style of conditional.py."""
+
+    def test_pep8_conformance_conditional(self):
+        """Test that api/v1/views/conditional.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/views/conditional.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_conditional_module_docstring(self):
+        """Test for the api/v1/views/conditional.py module docstring"""
+        self.assertIsNot(conditional.__doc__, None,
+                         "api/v1/views/conditional.py needs a docstring")
+        self.assertTrue(len(conditional.__doc__) >= 1,
+                        "api/v1/views/conditional.py needs a docstring")
+
+
+class TestConditional(BaseTestCase):
+    """Test the conditional GETs and PUTs."""
+
+    def setUp(self):
+        """Create test data."""
+        super().setUp()
+        self.test_data = TestData(self.storage)
+        self.state = self.test_data.get('State')[0]
+        self.url = f'/api/v1/states/{self.state.id}'
+
+    def tearDown(self):
+        """Destroy test_data."""
+        super().tearDown()
+        del self.test_data
+        del self.state
+
+    def test_get_object(self):
+        """Test that an object is a 304 until its updated_at changes."""
+        resp = self.client.get(self.url)
+        etag = resp.headers.get('ETag')
+        self.assertIsNotNone(etag)
+        last_modified = resp.headers.get('Last-Modified')
+        self.assertIsNotNone(last_modified)
+        resp = self.client.get(self.url, headers={'If-None-Match': etag})
+        self.assertEqual(resp.status_code, 304)
+        self.assertEqual(resp.headers.get('ETag'), etag)
+        resp = self.client.get(self.url,
+                               headers={'If-Modified-Since': last_modified})
+        self.assertEqual(resp.status_code, 304)
+        self.client.put(self.url, json={"name": "Renamed"})
+        resp = self.client.get(self.url, headers={'If-None-Match': etag})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json["name"], "Renamed")
+
+    def test_get_collection(self):
+        """Test that a collection is a 304 until one of its objects
+        changes."""
+        resp = self.client.get('/api/v1/states')
+        resp.get_data()
+        etag = resp.headers.get('ETag')
+        self.assertIsNotNone(etag)
+        resp = self.client.get('/api/v1/states',
+                               headers={'If-None-Match': etag})
+        self.assertEqual(resp.status_code, 304)
+        resp = self.client.get('/api/v1/states?limit=1',
+                               headers={'If-None-Match': etag})
+        self.assertEqual(resp.status_code, 200)
+        resp.get_data()
+        self.client.post('/api/v1/states', json={"name": "Nevada"})
+        resp = self.client.get('/api/v1/states',
+                               headers={'If-None-Match': etag})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.json), 3)
+
+    def test_collection_after_delete(self):
+        """Test that deleting an object changes the collection, which
+        is not validated by date."""
+        resp = self.client.get('/api/v1/states')
+        resp.get_data()
+        etag = resp.headers.get('ETag')
+        self.assertIsNone(resp.headers.get('Last-Modified'))
+        self.client.delete(self.url)
+        resp = self.client.get('/api/v1/states',
+                               headers={'If-None-Match': etag})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.json), 1)
+        resp = self.client.get('/api/v1/states', headers={
+            'If-Modified-Since': 'Fri, 01 Jan 2100 00:00:00 GMT'})
+        self.assertEqual(resp.status_code, 200)
+        resp.get_data()
+
+    def test_collection_of_deleted_parent(self):
+        """Test that the children of a deleted parent are a 404."""
+        url = f'/api/v1/states/{self.state.id}/cities'
+        resp = self.client.get(url)
+        resp.get_data()
+        etag = resp.headers.get('ETag')
+        self.storage.delete(self.state)
+        self.storage.save()
+        resp = self.client.get(url, headers={'If-None-Match': etag})
+        self.assertEqual(resp.status_code, 404)
+
+    def test_put_if_match(self):
+        """Test that PUT honors If-Match."""
+        etag = self.client.get(self.url).headers['ETag']
+        resp = self.client.put(self.url, json={"name": "Stale"},
+                               headers={'If-Match': '"0000"'})
+        self.assertEqual(resp.status_code, 412)
+        self.assertEqual(resp.json, {"error": "Precondition Failed"})
+        resp = self.client.put(self.url, json={"name": "Fresh"},
+                               headers={'If-Match': etag})
+        self.assertEqual(resp.status_code, 200)
+        self.assertNotEqual(resp.headers['ETag'], etag)
+        resp = self.client.put(self.url, json={"name": "Again"},
+                               headers={'If-Match': etag})
+        self.assertEqual(resp.status_code, 412)
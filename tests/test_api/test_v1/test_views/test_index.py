@@ -39,3 +39,12 @@ class TestIndex(BaseTestCase):
         test_obj = TestData(self.storage)
         resp = self.client.get('/api/v1/stats')
         self.assertEqual(resp.json, test_obj.counter)
+
+    def test_get_pool_stats(self):
+        """Test that pool stats are only reported in db mode."""
+        resp = self.client.get('/api/v1/stats/pool')
+        self.assertEqual(resp.status_code, 200)
+        if os.getenv('HBNB_TYPE_STORAGE') == 'db':
+            self.assertIn("checked_out", resp.json)
+        else:
+            self.assertEqual(resp.json, {})
@@ -0,0 +1,130 @@
+#!/usr/bin/python3
+"""Test the api/v1/views/pagination.py module."""
+import unittest
+import pycodestyle
+from tests.test_api.test_v1.base_test import BaseTestCase, TestData
+from api.v1.views import pagination
+import json
+
+
+class TestPaginationDocs(unittest.TestCase):
+    """Checks that the documentation and style of pagination.py."""
+
+    def test_pep8_conformance_pagination(self):
+        """Test that api/v1/views/pagination.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['api/v1/views/pagination.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pagination_module_docstring(self):
+        """Test for the api/v1/views/pagination.py module docstring"""
+        self.assertIsNot(pagination.__doc__, None,
+                         "api/v1/views/pagination.py needs a docstring")
+        self.assertTrue(len(pagination.__doc__) >= 1,
+                        "api/v1/views/pagination.py needs a docstring")
+
+
+class TestPagination(BaseTestCase):
+    """Test the pagination of the list routes."""
+
+    def setUp(self):
+        """Create test data."""
+        super().setUp()
+        self.test_data = TestData(self.storage)
+
+    def tearDown(self):
+        """Destroy test_data."""
+        super().tearDown()
+        del self.test_data
+
+    def walk(self, url, limit, data=None):
+        """Follow the cursors of url and return the pages of ids."""
+        pages = []
+        cursor = None
+        while True:
+            query = f'?limit={limit}'
+            if cursor:
+                query += f'&cursor={cursor}'
+            if data is None:
+                resp = self.client.get(url + query)
+            else:
+                resp = self.client.post(url + query,
+                                        headers={"Content-Type":
+                                                 "application/json"},
+                                        data=json.dumps(data))
+            self.assertEqual(resp.status_code, 200)
+            pages.append([d['id'] for d in resp.json])
+            cursor = resp.headers.get('X-Next-Cursor')
+            if cursor is None:
+                return pages
+
+    def ordered_ids(self, objs):
+        """Return the ids of objs in (created_at, id) order."""
+        return [o.id for o in sorted(objs, key=lambda o: (o.created_at,
+                                                          o.id))]
+
+    def test_list_routes(self):
+        """Test that the list routes page in (created_at, id) order."""
+        city = self.test_data.get('City')[0]
+        state = self.test_data.get('State')[0]
+        place = self.test_data.get('Place')[0]
+        routes = [
+            ('/api/v1/states', self.test_data.get('State')),
+            ('/api/v1/users', self.test_data.get('User')),
+            ('/api/v1/amenities', self.test_data.get('Amenity')),
+            (f'/api/v1/states/{state.id}/cities',
+             [c for c in self.test_data.get('City')
+              if c.state_id == state.id]),
+            (f'/api/v1/cities/{city.id}/places',
+             [p for p in self.test_data.get('Place')
+              if p.city_id == city.id]),
+            (f'/api/v1/places/{place.id}/reviews',
+             [r for r in self.test_data.get('Review')
+              if r.place_id == place.id]),
+        ]
+        for url, objs in routes:
+            with self.subTest(url=url):
+                pages = self.walk(url, 2)
+                self.assertEqual([len(page) for page in pages[:-1]],
+                                 [2] * (len(pages) - 1))
+                self.assertEqual(sum(pages, []), self.ordered_ids(objs))
+
+    def test_places_search(self):
+        """Test that route '/places_search' pages its results."""
+        pages = self.walk('/api/v1/places_search', 4, {})
+        self.assertEqual([len(page) for page in pages], [4, 2])
+        self.assertEqual(sum(pages, []),
+                         self.ordered_ids(self.test_data.get('Place')))
+
+    def test_no_limit(self):
+        """Test that without limit the whole list is returned."""
+        resp = self.client.get('/api/v1/amenities')
+        self.assertEqual(len(resp.json), 5)
+        self.assertNotIn('X-Next-Cursor', resp.headers)
+
+    def test_invalid_arguments(self):
+        """Test that a bad limit or cursor is a 400."""
+        for query, error in (('limit=0', "Invalid limit"),
+                             ('limit=abc', "Invalid limit"),
+                             ('cursor=abc', "Invalid cursor"),
+                             ('cursor=WyJ4IiwgInkiXQ', "Invalid cursor")):
+            with self.subTest(query=query):
+                resp = self.client.get(f'/api/v1/states?{query}')
+                self.assertEqual(resp.status_code, 400)
+                self.assertEqual(resp.json, {"error": error})
+
+    def test_streamed(self):
+        """Test that lists are streamed as a JSON array in chunks."""
+        resp = self.client.get('/api/v1/amenities')
+        self.assertTrue(resp.is_streamed)
+        self.assertEqual(resp.mimetype, 'application/json')
+        self.assertEqual(len(resp.json), 5)
+        places = self.test_data.get('Place')
+        objs = (places * pagination.CHUNK)[:pagination.CHUNK + 1]
+        chunks = list(pagination.stream_json(objs))
+        self.assertEqual(len(chunks), 4)
+        self.assertEqual(json.loads("".join(chunks)),
+                         [obj.to_dict() for obj in objs])
+        self.assertEqual(json.loads("".join(pagination.stream_json([]))),
+                         [])
@@ -6,6 +6,7 @@ import pycodestyle
 from tests.test_api.test_v1.base_test import BaseTestCase, TestData
 from api.v1.views import places
 from models.place import Place
+from models.user import User
 import json
 
 
@@ -197,3 +198,77 @@ class TestPlace(BaseTestCase):
             with self.subTest(k=k, v=v):
                 self.assertNotEqual(resp.json[k], v,
                                     msg=f"key {k} should not be updated")
+
+    def link_amenities(self, place, amenities):
+        """Give place the amenities, in either storage mode."""
+        if os.getenv('HBNB_TYPE_STORAGE') == 'db':
+            place.amenities.extend(amenities)
+        else:
+            place.amenity_ids = [amenity.id for amenity in amenities]
+        place.save()
+
+    def search(self, data):
+        """POST data to places_search and return the sorted place names."""
+        headers = {"Content-Type": "application/json"}
+        resp = self.client.post('/api/v1/places_search', headers=headers,
+                                data=json.dumps(data))
+        self.assertEqual(resp.status_code, 200)
+        return sorted(d["name"] for d in resp.json)
+
+    def test_places_search(self):
+        """Test the filters of route '/places_search'."""
+        s1, s2 = self.test_data.get('State')
+        c1, c2, c3 = self.test_data.get('City')
+        a1, a2 = self.test_data.get('Amenity')[:2]
+        p1, p2 = self.test_data.get('Place')[:2]
+        p6 = self.test_data.get('Place')[5]
+        self.link_amenities(p1, [a1, a2])
+        self.link_amenities(p2, [a1])
+        self.link_amenities(p6, [a1, a2])
+        self.assertEqual(len(self.search({})), 6)
+        self.assertEqual(self.search({"states": [s2.id]}), ["place_6"])
+        self.assertEqual(self.search({"states": [s1.id], "cities": [c1.id]}),
+                         ["place_1", "place_2", "place_3", "place_4",
+                          "place_5"])
+        self.assertEqual(self.search({"cities": [c1.id],
+                                      "amenities": [a1.id]}),
+                         ["place_1", "place_2"])
+        self.assertEqual(self.search({"amenities": [a1.id, a2.id]}),
+                         ["place_1", "place_6"])
+        self.assertEqual(self.search({"amenities": ["000"]}), [])
+
+    def test_places_search_expand_user(self):
+        """Test that expand=user embeds the owner of each place."""
+        user = self.storage.get(User, self.place.user_id)
+        user.first_name = "Jon"
+        user.last_name = "Snow"
+        user.save()
+        headers = {"Content-Type": "application/json"}
+        resp = self.client.post('/api/v1/places_search?expand=user',
+                                headers=headers, data="{}")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.json), 6)
+        for place in resp.json:
+            self.assertEqual(place["user"]["id"], place["user_id"])
+            self.assertNotIn("password", place["user"])
+        owned = [place["user"] for place in resp.json
+                 if place["user_id"] == user.id]
+        self.assertTrue(owned)
+        for user in owned:
+            self.assertEqual((user["first_name"], user["last_name"]),
+                             ("Jon", "Snow"))
+        resp = self.client.post('/api/v1/places_search',
+                                headers=headers, data="{}")
+        self.assertNotIn("user", resp.json[0])
+        resp = self.client.post('/api/v1/places_search?expand=reviews',
+                                headers=headers, data="{}")
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(resp.json, {'error': "Invalid expand"})
+
+    def test_places_search_not_a_json(self):
+        """Test that route '/places_search' needs a JSON body."""
+        headers = {"Content-Type": "application/json"}
+        resp = self.client.post('/api/v1/places_search', headers=headers,
+                                data="not json")
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(resp.json, {'error': "Not a JSON"})
@@ -3,7 +3,10 @@
 from datetime import datetime
 import inspect
 import models
+import os
 import pycodestyle as pycodestyle
+import subprocess
+import sys
 import time
 import unittest
 from unittest import mock
@@ -158,3 +161,85 @@ class TestBaseModel(unittest.TestCase):
         self.assertEqual(old_created_at, new_created_at)
         self.assertTrue(mock_storage.new.called)
         self.assertTrue(mock_storage.save.called)
+
+    def test_parse_time(self):
+        """Test that parse_time reads what to_dict writes"""
+        parse_time = models.base_model.parse_time
+        self.assertEqual(parse_time("2017-04-14T16:21:42.123456"),
+                         datetime(2017, 4, 14, 16, 21, 42, 123456))
+        self.assertEqual(parse_time("2017-04-14T16:21:42.1"),
+                         datetime(2017, 4, 14, 16, 21, 42, 100000))
+        with self.assertRaises(ValueError):
+            parse_time("14/04/2017")
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_from_storage_dict(self):
+        """Test that from_storage_dict rebuilds the instance to_dict
+        serialized"""
+        inst = BaseModel()
+        inst.name = "Holberton"
+        copy = BaseModel.from_storage_dict(inst.to_dict())
+        self.assertIs(type(copy), BaseModel)
+        self.assertEqual(copy.__dict__, inst.__dict__)
+        self.assertEqual(copy.to_dict(), inst.to_dict())
+
+    def test_format_time(self):
+        """Test that format_time writes what parse_time reads"""
+        base_model = models.base_model
+        value = datetime(2017, 4, 14, 16, 21, 42)
+        self.assertEqual(base_model.format_time(value),
+                         value.strftime(base_model.time))
+        self.assertEqual(base_model.parse_time(
+            base_model.format_time(value)), value)
+
+
+class TestSlotted(unittest.TestCase):
+    """Test the compact models"""
+
+    def test_metaclass(self):
+        """Test that data attributes become slots with defaults"""
+        Slotted = models.base_model.Slotted
+        Parent = Slotted("Parent", (), {"name": "", "count": 0})
+        Child = Slotted("Child", (Parent,), {"text": "",
+                                             "size": property(len)})
+        self.assertEqual(Parent.__slots__, ("name", "count"))
+        self.assertEqual(Child.__slots__, ("text",))
+        self.assertEqual(Child.defaults, {"name": "", "count": 0,
+                                          "text": ""})
+        self.assertEqual(Child.fields, ("name", "count", "text"))
+        self.assertIsInstance(Child.size, property)
+        self.assertFalse(hasattr(Child(), "__dict__"))
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_compact_models(self):
+        """Test the models with HBNB_COMPACT_MODELS=1"""
+        script = """if True:
+            import models
+            from models.place import Place
+            from models.state import State
+            state = State(name="Kansas", motto="ad astra")
+            assert type(vars(State)["name"]).__name__ == \\
+                "member_descriptor"
+            assert state.name == "Kansas" and state.motto == "ad astra"
+            assert state.__dict__ == {"name": "Kansas", "motto": "ad astra",
+                                      "id": state.id,
+                                      "created_at": state.created_at,
+                                      "updated_at": state.updated_at}
+            assert State().name == ""
+            copy = State.from_storage_dict(state.to_dict())
+            assert copy.to_dict() == state.to_dict()
+            place = Place.from_storage_dict({"__class__": "Place",
+                                             "id": "1", "number_rooms": 2})
+            assert place.number_rooms == 2 and place.amenity_ids == []
+            assert place.max_guest == 0
+            try:
+                place.reviews = []
+            except AttributeError:
+                pass
+            else:
+                raise AssertionError("set a read-only property")
+        """
+        env = dict(os.environ, HBNB_COMPACT_MODELS="1")
+        result = subprocess.run([sys.executable, "-c", script], env=env,
+                                capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
@@ -0,0 +1,128 @@
+#!/usr/bin/python3
+"""
+Contains the TestBinarySnapshotDocs and TestBinarySnapshot classes
+"""
+
+import inspect
+import io
+import json
+from models.engine import binary_snapshot
+import os
+import pycodestyle
+import unittest
+BinarySnapshot = binary_snapshot.BinarySnapshot
+PATH = "/tmp/test_binary_snapshot.bin"
+
+
+class TestBinarySnapshotDocs(unittest.TestCase):
+    """Tests to check the documentation and style of BinarySnapshot class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.bs_f = inspect.getmembers(BinarySnapshot, inspect.isfunction)
+
+    def test_pep8_conformance_binary_snapshot(self):
+        """Test that models/engine/binary_snapshot.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/binary_snapshot.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_binary_snapshot(self):
+        """Test tests/test_models/test_binary_snapshot.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_binary_snapshot.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_binary_snapshot_module_docstring(self):
+        """Test for the binary_snapshot.py module docstring"""
+        self.assertIsNot(binary_snapshot.__doc__, None,
+                         "binary_snapshot.py needs a docstring")
+        self.assertTrue(len(binary_snapshot.__doc__) >= 1,
+                        "binary_snapshot.py needs a docstring")
+
+    def test_binary_snapshot_class_docstring(self):
+        """Test for the BinarySnapshot class docstring"""
+        self.assertIsNot(BinarySnapshot.__doc__, None,
+                         "BinarySnapshot class needs a docstring")
+        self.assertTrue(len(BinarySnapshot.__doc__) >= 1,
+                        "BinarySnapshot class needs a docstring")
+
+    def test_bs_func_docstrings(self):
+        """Test for the presence of docstrings in BinarySnapshot methods"""
+        for func in self.bs_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestBinarySnapshot(unittest.TestCase):
+    """Test the BinarySnapshot class"""
+    def setUp(self):
+        """Write a binary snapshot with a few cities"""
+        self.records = {}
+        for i in (3, 1, 4, 0, 2):
+            key = "City.{}".format(i)
+            value = {"id": str(i), "name": "City_{}".format(i),
+                     "state_id": "s{}".format(i % 2), "__class__": "City"}
+            self.records[key] = value
+        with open(PATH, "wb") as f:
+            BinarySnapshot.dump(f, [(key, json.dumps(value).encode(),
+                                     {"state_id": value["state_id"]})
+                                    for key, value in self.records.items()])
+        self.snapshot = BinarySnapshot(PATH)
+
+    def tearDown(self):
+        """Unmap and remove the snapshot"""
+        self.snapshot.close()
+        os.remove(PATH)
+
+    def test_is_binary(self):
+        """Test that binary snapshots are told apart from other files"""
+        self.assertTrue(BinarySnapshot.is_binary(PATH))
+        self.assertFalse(BinarySnapshot.is_binary(PATH + ".missing"))
+        self.assertFalse(BinarySnapshot.is_binary(__file__))
+
+    def test_keys_are_sorted(self):
+        """Test that the keys come back sorted"""
+        self.assertEqual(len(self.snapshot), 5)
+        self.assertEqual(list(self.snapshot), sorted(self.records))
+
+    def test_read(self):
+        """Test that a record is found and decoded on its own"""
+        for key, value in self.records.items():
+            with self.subTest(key=key):
+                self.assertIn(key, self.snapshot)
+                self.assertEqual(json.loads(self.snapshot.read(key)), value)
+                self.assertEqual(self.snapshot.index_values(key),
+                                 {"state_id": value["state_id"]})
+        self.assertNotIn("City.5", self.snapshot)
+        self.assertNotIn("Amenity.0", self.snapshot)
+        with self.assertRaises(KeyError):
+            self.snapshot.read("City.5")
+
+    def test_large_index_values(self):
+        """Test that indexed values over 64 KiB are kept whole"""
+        value = {"id": "0", "name": "x" * 70000, "__class__": "State"}
+        with open(PATH, "wb") as f:
+            BinarySnapshot.dump(f, [("State.0", json.dumps(value).encode(),
+                                     {"name": value["name"]})])
+        snapshot = BinarySnapshot(PATH)
+        self.assertEqual(json.loads(snapshot.read("State.0")), value)
+        self.assertEqual(snapshot.index_values("State.0"),
+                         {"name": value["name"]})
+        snapshot.close()
+
+    def test_empty(self):
+        """Test a snapshot without records"""
+        f = io.BytesIO()
+        BinarySnapshot.dump(f, [])
+        with open(PATH, "wb") as out:
+            out.write(f.getvalue())
+        snapshot = BinarySnapshot(PATH)
+        self.assertEqual(len(snapshot), 0)
+        self.assertNotIn("City.0", snapshot)
+        snapshot.close()
@@ -17,7 +17,9 @@ from models.user import User
 import json
 import os
 import pycodestyle
+import sqlalchemy
 import unittest
+from unittest import mock
 DBStorage = db_storage.DBStorage
 classes = {"Amenity": Amenity, "City": City, "Place": Place,
            "Review": Review, "State": State, "User": User}
@@ -140,3 +142,108 @@ class TestDBStorage(unittest.TestCase):
         storage.save()
         updated_count = storage.count()
         self.assertEqual(updated_count, initial_count + 1)
+
+    def test_reload_creates_indexes(self):
+        """Test that reload creates the declared indexes that are missing"""
+        storage = models.storage
+        engine = storage._DBStorage__engine
+        index = next(index for index in City.__table__.indexes
+                     if index.name == "ix_cities_name")
+        index.drop(engine)
+        names = {ix["name"] for ix in
+                 sqlalchemy.inspect(engine).get_indexes("cities")}
+        self.assertNotIn("ix_cities_name", names)
+        storage.reload()
+        names = {ix["name"] for ix in
+                 sqlalchemy.inspect(engine).get_indexes("cities")}
+        self.assertIn("ix_cities_name", names)
+        self.assertIn("ix_cities_state_id", names)
+
+    def test_reload_twice(self):
+        """Test that reload leaves the indexes it finds in place, even
+        those it did not see before creating them"""
+        storage = models.storage
+        engine = storage._DBStorage__engine
+        storage.reload()
+        storage.reload()
+        with mock.patch.object(engine.dialect, "has_index",
+                               return_value=False), \
+                mock.patch.object(engine.dialect, "get_indexes",
+                                  return_value=[]):
+            storage.reload()
+        names = {ix["name"] for ix in
+                 sqlalchemy.inspect(engine).get_indexes("cities")}
+        self.assertIn("ix_cities_name", names)
+
+    def test_children_of(self):
+        """Test that children_of groups objects by foreign key"""
+        storage = models.storage
+        states = [State(name="California"), State(name="Nevada")]
+        city = City(name="Fremont", state_id=states[0].id)
+        for obj in states + [city]:
+            storage.new(obj)
+        storage.save()
+        ids = [state.id for state in states]
+        children = storage.children_of(City, "state_id", ids)
+        self.assertEqual([c.id for c in children[ids[0]]], [city.id])
+        self.assertEqual(children[ids[1]], [])
+        self.assertEqual(storage.children_of(City, "state_id", []), {})
+
+    def test_get_many(self):
+        """Test that get_many returns the rows of the ids found"""
+        storage = models.storage
+        states = [State(name="California"), State(name="Nevada")]
+        for state in states:
+            storage.new(state)
+        storage.save()
+        ids = [state.id for state in states]
+        found = storage.get_many(State, ids + ["missing"])
+        self.assertEqual(sorted(found), sorted(ids))
+        self.assertEqual(storage.get_many("State", []), {})
+
+    def test_generation(self):
+        """Test that the generation of a class changes with its rows"""
+        storage = models.storage
+        before = storage.generation("State", "City")
+        storage.new(State(name="California"))
+        storage.save()
+        after = storage.generation("State", "City")
+        self.assertNotEqual(after[0], before[0])
+        self.assertEqual(after[1], before[1])
+
+    def test_notify_after_commit(self):
+        """Test that the listeners hear of changes once they are
+        committed"""
+        storage = models.storage
+        calls = []
+        listeners = DBStorage._DBStorage__listeners
+        listeners.append(calls.append)
+        try:
+            state = State(name="California")
+            storage.new(state)
+            self.assertEqual(calls, [])
+            storage.save()
+            self.assertEqual(calls, [("State",)])
+            storage.delete(state)
+            self.assertEqual(len(calls), 1)
+            storage.save()
+            self.assertEqual(calls[1], ("State",))
+        finally:
+            listeners.remove(calls.append)
+
+    def test_sorted_by_name(self):
+        """Test that sorted_by_name and children_of order by name"""
+        storage = models.storage
+        state = State(name="zz state")
+        cities = [City(name=name, state_id=state.id)
+                  for name in ("San Jose", "Fremont")]
+        for obj in [state] + cities:
+            storage.new(obj)
+        storage.save()
+        names = [obj.name for obj in storage.sorted_by_name(State)]
+        self.assertEqual(names, sorted(names))
+        self.assertEqual(names[-1], "zz state")
+        children = storage.children_of(City, "state_id", [state.id],
+                                       sort_by_name=True)
+        self.assertEqual([c.name for c in children[state.id]],
+                         ["Fremont", "San Jose"])
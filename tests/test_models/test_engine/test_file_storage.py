@@ -3,12 +3,12 @@
 Contains the TestFileStorageDocs classes
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta
 import inspect
 import models
 from models.engine import file_storage
 from models.amenity import Amenity
-from models.base_model import BaseModel
+from models.base_model import BaseModel, time
 from models.city import City
 from models.place import Place
 from models.review import Review
@@ -18,6 +18,7 @@ import json
 import os
 import pycodestyle
 import unittest
+from unittest import mock
 FileStorage = file_storage.FileStorage
 classes = {"Amenity": Amenity, "BaseModel": BaseModel, "City": City,
            "Place": Place, "Review": Review, "State": State, "User": User}
@@ -71,6 +72,17 @@ test_file_storage.py'])
 @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
 class TestFileStorage(unittest.TestCase):
     """Test the FileStorage class"""
+    def setUp(self):
+        """Pin the modes set by the HBNB_FILE_* variables to their
+        defaults, so each test turns on only the modes it tests"""
+        modes = mock.patch.multiple(
+            FileStorage, _FileStorage__journal=False,
+            _FileStorage__journal_max=1000, _FileStorage__checksum=False,
+            _FileStorage__lazy=False, _FileStorage__lazy_max=10000,
+            _FileStorage__format="json")
+        modes.start()
+        self.addCleanup(modes.stop)
+
     def test_all_returns_dict(self):
         """Test that all returns the FileStorage.__objects attr"""
         storage = FileStorage()
@@ -129,3 +141,530 @@ class TestFileStorage(unittest.TestCase):
         obj = BaseModel()
         storage.new(obj)
         self.assertEqual(storage.count(), count + 1)
+
+    def test_all_cls_uses_class_index(self):
+        """Test that all(cls) only returns objects of that class"""
+        storage = FileStorage()
+        state = State()
+        city = City()
+        storage.new(state)
+        storage.new(city)
+        states = storage.all(State)
+        self.assertIn("State." + state.id, states)
+        self.assertNotIn("City." + city.id, states)
+        self.assertEqual(states, storage.all("State"))
+        storage.delete(state)
+        storage.delete(city)
+        self.assertNotIn("State." + state.id, storage.all(State))
+
+    def test_lookup(self):
+        """Test that lookup follows foreign keys through the index"""
+        storage = FileStorage()
+        state = State()
+        city = City(state_id=state.id)
+        storage.new(state)
+        storage.new(city)
+        self.assertEqual(storage.lookup(City, "state_id", state.id), [city])
+        city.state_id = "moved"
+        self.assertEqual(storage.lookup(City, "state_id", state.id), [])
+        self.assertEqual(storage.lookup(City, "state_id", "moved"), [city])
+        storage.delete(city)
+        self.assertEqual(storage.lookup(City, "state_id", "moved"), [])
+        storage.delete(state)
+
+    def test_lookup_after_objects_replaced(self):
+        """Test that the indexes follow a replaced __objects dictionary"""
+        storage = FileStorage()
+        city = City(state_id="0001")
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {"City." + city.id: city}
+        try:
+            self.assertEqual(storage.lookup(City, "state_id", "0001"),
+                             [city])
+        finally:
+            FileStorage._FileStorage__objects = save
+        self.assertEqual(storage.lookup(City, "state_id", "0001"), [])
+
+    def test_close_skips_reload_when_file_unchanged(self):
+        """Test that close only reloads when the file changed on disk"""
+        storage = FileStorage()
+        path = FileStorage._FileStorage__file_path
+        state = State(name="California")
+        storage.new(state)
+        storage.save()
+        state.name = "Nevada"
+        storage.close()
+        self.assertIs(storage.get(State, state.id), state)
+        self.assertEqual(state.name, "Nevada")
+        with open(path, "r") as f:
+            js = json.load(f)
+        js["State." + state.id]["name"] = "Oregon"
+        with open(path, "w") as f:
+            json.dump(js, f, indent=4)
+        storage.close()
+        self.assertEqual(storage.get(State, state.id).name, "Oregon")
+        storage.delete(storage.get(State, state.id))
+        storage.save()
+
+    def test_save_journal(self):
+        """Test that journal mode appends changes and replays them"""
+        storage = FileStorage()
+        path = FileStorage._FileStorage__file_path
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__journal = True
+        FileStorage._FileStorage__journal_max = 3
+        try:
+            state = State(name="California")
+            storage.new(state)
+            storage.save()
+            self.assertFalse(os.path.exists(path + ".journal"))
+            city = City(name="Fremont", state_id=state.id)
+            storage.new(city)
+            storage.delete(state)
+            storage.save()
+            with open(path + ".journal", "r") as f:
+                lines = f.readlines()
+            self.assertEqual(len(lines), 3)
+            self.assertIn("snapshot", json.loads(lines[0]))
+            with open(path, "r") as f:
+                self.assertIn("State." + state.id, json.load(f))
+            FileStorage._FileStorage__objects = {}
+            storage.reload()
+            self.assertEqual(list(storage.all()), ["City." + city.id])
+            for i in range(2):
+                storage.new(State(name=str(i)))
+            storage.save()
+            self.assertFalse(os.path.exists(path + ".journal"))
+            with open(path, "r") as f:
+                self.assertEqual(len(json.load(f)), 3)
+        finally:
+            FileStorage._FileStorage__objects = save
+            FileStorage._FileStorage__journal = False
+            FileStorage._FileStorage__journal_max = 1000
+            for name in (path, path + ".journal"):
+                if os.path.exists(name):
+                    os.remove(name)
+
+    def test_reload_orphan_journal(self):
+        """Test that a journal left over from another file is ignored"""
+        storage = FileStorage()
+        path = FileStorage._FileStorage__file_path
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__journal = True
+        try:
+            state = State(name="California")
+            storage.new(state)
+            storage.save()
+            city = City(name="Fremont", state_id=state.id)
+            storage.new(city)
+            storage.save()
+            with open(path + ".journal", "rb") as f:
+                orphan = f.read()
+            FileStorage._FileStorage__journal = False
+            storage.delete(city)
+            storage.save()
+            with open(path + ".journal", "wb") as f:
+                f.write(orphan)
+            FileStorage._FileStorage__objects = {}
+            storage.reload()
+            self.assertEqual(list(storage.all()), ["State." + state.id])
+            os.remove(path)
+            FileStorage._FileStorage__objects = {}
+            storage.reload()
+            self.assertEqual(storage.all(), {})
+            FileStorage._FileStorage__journal = True
+            storage.new(State(name="Nevada"))
+            storage.save()
+            self.assertFalse(os.path.exists(path + ".journal"))
+        finally:
+            FileStorage._FileStorage__objects = save
+            FileStorage._FileStorage__journal = False
+            for name in (path, path + ".journal"):
+                if os.path.exists(name):
+                    os.remove(name)
+
+    def test_save_checksum(self):
+        """Test that the checksum footer is written and verified"""
+        storage = FileStorage()
+        path = FileStorage._FileStorage__file_path
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__checksum = True
+        try:
+            state = State(name="California")
+            storage.new(state)
+            storage.save()
+            with open(path, "r") as f:
+                content = f.read()
+            self.assertTrue(content.splitlines()[-1].startswith("#sha256 "))
+            leftovers = [name for name in
+                         os.listdir(os.path.dirname(path) or ".")
+                         if name.startswith(os.path.basename(path)) and
+                         name.endswith(".tmp")]
+            self.assertEqual(leftovers, [])
+            FileStorage._FileStorage__objects = {}
+            storage.reload()
+            self.assertIn("State." + state.id, storage.all())
+            tampered = content.replace("California", "Nevada")
+            with open(path, "w") as f:
+                f.write(tampered)
+            FileStorage._FileStorage__objects = {}
+            with self.assertRaises(ValueError):
+                storage.reload()
+            with self.assertRaises(ValueError):
+                storage.save()
+            with open(path, "r") as f:
+                self.assertEqual(f.read(), tampered)
+            os.remove(path)
+            storage.new(State(name="Nevada"))
+            storage.save()
+            FileStorage._FileStorage__objects = {}
+            storage.reload()
+            self.assertEqual(storage.count(State), 1)
+        finally:
+            FileStorage._FileStorage__objects = save
+            FileStorage._FileStorage__checksum = False
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_reload_shares_ids(self):
+        """Test that reloaded foreign keys are the strings of the ids"""
+        storage = FileStorage()
+        path = FileStorage._FileStorage__file_path
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        try:
+            state = State(name="California")
+            cities = [City(name=str(i), state_id=state.id) for i in range(2)]
+            for obj in [state] + cities:
+                storage.new(obj)
+            storage.save()
+            FileStorage._FileStorage__objects = {}
+            storage.reload()
+            state = storage.get(State, state.id)
+            for city in cities:
+                self.assertIs(storage.get(City, city.id).state_id, state.id)
+        finally:
+            FileStorage._FileStorage__objects = save
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_reload_lazy(self):
+        """Test that lazy mode reads objects from the file on access"""
+        storage = FileStorage()
+        path = FileStorage._FileStorage__file_path
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__lazy = True
+        FileStorage._FileStorage__lazy_max = 1
+        FileStorage._FileStorage__checksum = True
+        try:
+            state = State(name="California")
+            cities = [City(name=str(i), state_id=state.id) for i in range(3)]
+            for obj in [state] + cities:
+                storage.new(obj)
+            storage.save()
+            FileStorage._FileStorage__objects = {}
+            storage.reload()
+            objects = storage.all()
+            self.assertIsInstance(objects, file_storage.LazyObjects)
+            self.assertEqual(len(objects), 4)
+            self.assertIsNone(objects.peek("State." + state.id))
+            self.assertEqual(storage.get(State, state.id).name, "California")
+            self.assertEqual(sorted(c.name for c in storage.lookup(
+                City, "state_id", state.id)), ["0", "1", "2"])
+            self.assertIsNone(objects.peek("State." + state.id))
+            storage.new(City(name="3", state_id=state.id))
+            storage.save()
+            FileStorage._FileStorage__objects = {}
+            storage.reload()
+            self.assertEqual(storage.count(City), 4)
+            with open(path, "r") as f:
+                self.assertEqual(len(json.loads(f.read().rpartition(
+                    "\n#sha256 ")[0])), 5)
+        finally:
+            FileStorage._FileStorage__objects = save
+            FileStorage._FileStorage__lazy = False
+            FileStorage._FileStorage__lazy_max = 10000
+            FileStorage._FileStorage__checksum = False
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_reload_lazy_indented_file(self):
+        """Test that lazy mode loads a JSON file that is not one record
+        per line eagerly instead of losing its objects"""
+        storage = FileStorage()
+        path = FileStorage._FileStorage__file_path
+        save = FileStorage._FileStorage__objects
+        lazy = FileStorage._FileStorage__lazy
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__lazy = True
+        try:
+            state = State(name="California")
+            with open(path, "w") as f:
+                json.dump({"State." + state.id: state.to_dict()}, f,
+                          indent=4)
+            storage.reload()
+            self.assertEqual(storage.count(State), 1)
+            self.assertEqual(storage.get(State, state.id).name, "California")
+        finally:
+            FileStorage._FileStorage__objects = save
+            FileStorage._FileStorage__lazy = lazy
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_save_binary(self):
+        """Test that the binary format is written and read back lazily"""
+        storage = FileStorage()
+        path = FileStorage._FileStorage__file_path
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__format = "binary"
+        try:
+            state = State(name="California")
+            city = City(name="Fremont", state_id=state.id)
+            storage.new(state)
+            storage.new(city)
+            storage.save()
+            self.assertTrue(file_storage.BinarySnapshot.is_binary(path))
+            FileStorage._FileStorage__objects = {}
+            storage.reload()
+            self.assertIsInstance(storage.all(), file_storage.LazyObjects)
+            self.assertEqual(storage.get(State, state.id).name, "California")
+            self.assertEqual(storage.lookup(City, "state_id", state.id)[0].id,
+                             city.id)
+            storage.delete(storage.get(State, state.id))
+            storage.save()
+            FileStorage._FileStorage__format = "json"
+            storage.save()
+            with open(path, "r") as f:
+                self.assertEqual(list(json.load(f)), ["City." + city.id])
+        finally:
+            FileStorage._FileStorage__objects = save
+            FileStorage._FileStorage__format = "json"
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_save_binary_long_name(self):
+        """Test that a name over 64 KiB is saved in the binary format"""
+        storage = FileStorage()
+        path = FileStorage._FileStorage__file_path
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        FileStorage._FileStorage__format = "binary"
+        try:
+            state = State(name="x" * 70000)
+            storage.new(state)
+            storage.save()
+            FileStorage._FileStorage__objects = {}
+            storage.reload()
+            self.assertEqual(storage.get(State, state.id).name, "x" * 70000)
+            self.assertEqual(storage.sorted_by_name("State")[0].id, state.id)
+        finally:
+            FileStorage._FileStorage__objects = save
+            FileStorage._FileStorage__format = "json"
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_bulk_new_and_update(self):
+        """Test that bulk_new and bulk_update save in a single pass"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        try:
+            states = [State(name=str(i)) for i in range(3)]
+            storage.bulk_new(states)
+            self.assertEqual(storage.count(State), 3)
+            updated = storage.bulk_update(State, [
+                {"id": states[0].id, "name": "California"},
+                {"id": "000", "name": "Nowhere"}])
+            self.assertEqual(updated, [states[0]])
+            self.assertEqual(states[0].name, "California")
+            FileStorage._FileStorage__objects = {}
+            storage.reload()
+            self.assertEqual(storage.get(State, states[0].id).name,
+                             "California")
+            self.assertEqual(storage.count(State), 3)
+        finally:
+            FileStorage._FileStorage__objects = save
+            path = FileStorage._FileStorage__file_path
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_counts(self):
+        """Test that counts matches count for every class"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        try:
+            for cls in (State, State, City):
+                storage.new(cls())
+            self.assertEqual(storage.counts(), {"State": 2, "City": 1})
+            self.assertEqual(storage.count(State), 2)
+            self.assertEqual(storage.count("City"), 1)
+            self.assertEqual(storage.count(), 3)
+        finally:
+            FileStorage._FileStorage__objects = save
+
+    def test_page(self):
+        """Test that page walks the objects in (created_at, id) order"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        try:
+            now = datetime(2017, 4, 14, 16, 21, 42)
+            day = timedelta(days=1)
+            states = [State(id=str(i),
+                            created_at=(now - i * day).strftime(time))
+                      for i in range(5)]
+            states.append(State(id="5", created_at=now.strftime(time)))
+            for state in states:
+                storage.new(state)
+            ordered = sorted(states, key=lambda s: (s.created_at, s.id))
+            self.assertEqual(list(storage.page(State)), ordered)
+            first = list(storage.page(State, 2))
+            self.assertEqual(first, ordered[:2])
+            after = (first[-1].created_at.strftime(time), first[-1].id)
+            self.assertEqual(list(storage.page(State, 10, after)), ordered[2:])
+            storage.delete(ordered[3])
+            late = State(id="6", created_at=(now + day).strftime(time))
+            storage.new(late)
+            self.assertEqual(list(storage.page(State, 10, after)),
+                             ordered[2:3] + ordered[4:] + [late])
+            cities = [City(state_id="0",
+                           created_at=(now - i * day).strftime(time))
+                      for i in range(3)]
+            for city in cities:
+                storage.new(city)
+            page = storage.page(City, 2, None, "state_id", "0")
+            self.assertEqual(list(page), cities[:0:-1])
+        finally:
+            FileStorage._FileStorage__objects = save
+
+    def test_last_modified(self):
+        """Test that last_modified follows the newest updated_at"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        try:
+            self.assertEqual(storage.last_modified(State), (None, 0))
+            old = State(updated_at="2017-04-14T16:21:42.000000")
+            new = State(updated_at="2017-04-15T16:21:42.000000")
+            city = City(state_id=old.id,
+                        updated_at="2017-04-13T16:21:42.000000")
+            for obj in (old, new, city):
+                storage.new(obj)
+            self.assertEqual(storage.last_modified(State),
+                             (new.updated_at, 2))
+            self.assertEqual(storage.last_modified(City, "state_id",
+                                                   old.id),
+                             (city.updated_at, 1))
+            storage.delete(new)
+            self.assertEqual(storage.last_modified("State"),
+                             (old.updated_at, 1))
+        finally:
+            FileStorage._FileStorage__objects = save
+
+    def test_children_of(self):
+        """Test that children_of groups objects and memoizes the groups
+        until a write or close()"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        try:
+            states = [State(name="California"), State(name="Nevada")]
+            city = City(name="Fremont", state_id=states[0].id)
+            for obj in states + [city]:
+                storage.new(obj)
+            ids = [state.id for state in states]
+            children = storage.children_of(City, "state_id", ids)
+            self.assertEqual(children, {ids[0]: [city], ids[1]: []})
+            self.assertIs(storage.children_of(City, "state_id",
+                                              ids[:1])[ids[0]],
+                          children[ids[0]])
+            self.assertEqual(storage.children_of("City", "name",
+                                                 ["Fremont"]),
+                             {"Fremont": [city]})
+            other = City(name="Reno", state_id=states[1].id)
+            storage.new(other)
+            self.assertEqual(storage.lookup(City, "state_id", ids[1]),
+                             [other])
+            other.state_id = states[0].id
+            self.assertEqual(storage.lookup(City, "state_id", ids[1]), [])
+            self.assertCountEqual(storage.lookup(City, "state_id", ids[0]),
+                                  [city, other])
+            storage.close()
+            self.assertIsNot(storage.children_of(City, "state_id",
+                                                 ids[:1])[ids[0]],
+                             children[ids[0]])
+        finally:
+            FileStorage._FileStorage__objects = save
+
+    def test_get_many(self):
+        """Test that get_many returns the objects of the ids found"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        try:
+            states = [State(name="California"), State(name="Nevada")]
+            for state in states:
+                storage.new(state)
+            ids = [state.id for state in states]
+            self.assertEqual(storage.get_many(State, ids + ["missing"]),
+                             dict(zip(ids, states)))
+            self.assertEqual(storage.get_many("City", ids), {})
+        finally:
+            FileStorage._FileStorage__objects = save
+
+    def test_generation(self):
+        """Test that the generation of a class changes with its objects"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        try:
+            before = storage.generation("State", "City")
+            state = State(name="California")
+            storage.new(state)
+            after = storage.generation("State", "City")
+            self.assertNotEqual(after[0], before[0])
+            self.assertEqual(after[1], before[1])
+            self.assertEqual(storage.generation("State", "City"), after)
+            storage.delete(state)
+            self.assertNotEqual(storage.generation("State")[0], after[0])
+        finally:
+            FileStorage._FileStorage__objects = save
+
+    def test_sorted_by_name(self):
+        """Test that the name order views follow additions, renames and
+        deletions"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        try:
+            state = State(name="California")
+            other = State(name="arizona")
+            cities = [City(name=name, state_id=state.id)
+                      for name in ("San Jose", "Fremont", "napa")]
+            for obj in [state, other] + cities:
+                storage.new(obj)
+            self.assertEqual(storage.sorted_by_name(State), [other, state])
+            self.assertEqual(storage.children_of(City, "state_id",
+                                                 [state.id],
+                                                 sort_by_name=True),
+                             {state.id: [cities[1], cities[2], cities[0]]})
+            storage.new(City(name="Oakland", state_id=other.id))
+            cities[0].name = "Alameda"
+            storage.delete(cities[2])
+            other.name = "Nevada"
+            self.assertEqual(storage.sorted_by_name("State"), [state, other])
+            self.assertEqual(storage.children_of(City, "state_id",
+                                                 [state.id],
+                                                 sort_by_name=True),
+                             {state.id: [cities[0], cities[1]]})
+            self.assertCountEqual(storage.children_of(City, "state_id",
+                                                      [state.id])[state.id],
+                                  cities[:2])
+        finally:
+            FileStorage._FileStorage__objects = save
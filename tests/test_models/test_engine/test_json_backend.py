@@ -0,0 +1,72 @@
+#!/usr/bin/python3
+"""
+Contains the TestJSONBackendDocs and TestJSONBackend classes
+"""
+
+from datetime import datetime
+import inspect
+import json
+from models.engine import json_backend
+import pycodestyle
+import unittest
+from unittest import mock
+
+
+class TestJSONBackendDocs(unittest.TestCase):
+    """Tests to check the documentation and style of json_backend"""
+
+    def test_pep8_conformance_json_backend(self):
+        """Test that models/engine/json_backend.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/json_backend.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_json_backend_module_docstring(self):
+        """Test for the json_backend.py module docstring"""
+        self.assertIsNot(json_backend.__doc__, None,
+                         "json_backend.py needs a docstring")
+        self.assertTrue(len(json_backend.__doc__) >= 1,
+                        "json_backend.py needs a docstring")
+
+    def test_json_backend_func_docstrings(self):
+        """Test for the presence of docstrings in json_backend functions"""
+        for name, func in inspect.getmembers(json_backend,
+                                             inspect.isfunction):
+            self.assertIsNot(func.__doc__, None,
+                             "{:s} function needs a docstring".format(name))
+
+
+class TestJSONBackend(unittest.TestCase):
+    """Test that both backends encode and decode alike"""
+    obj = {"b": [1, 2.5, None, True], "a": "café", "c": {"d": ""}}
+
+    def check(self):
+        """Test a round trip through the current backend"""
+        data = json_backend.dumps(self.obj)
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(json.loads(data), self.obj)
+        self.assertEqual(json_backend.loads(data), self.obj)
+        self.assertEqual(json_backend.loads(data.decode()), self.obj)
+        self.assertEqual(json_backend.dumps(self.obj, sort_keys=True),
+                         json.dumps(self.obj, sort_keys=True,
+                                    ensure_ascii=False,
+                                    separators=(",", ":")).encode())
+        self.assertEqual(json_backend.dumps({1: 2**70}), b'{"1":' +
+                         str(2**70).encode() + b'}')
+        with self.assertRaises(TypeError):
+            json_backend.dumps(datetime(2017, 4, 14))
+        self.assertEqual(json_backend.dumps([datetime(2017, 4, 14)],
+                                            default=str),
+                         b'["2017-04-14 00:00:00"]')
+        with self.assertRaises(ValueError):
+            json_backend.loads(b'{"torn": ')
+
+    def test_installed(self):
+        """Test the backend picked at import"""
+        self.check()
+
+    def test_stdlib(self):
+        """Test the json module fallback"""
+        with mock.patch.object(json_backend, "orjson", None):
+            self.check()
@@ -0,0 +1,172 @@
+#!/usr/bin/python3
+"""
+Contains the TestLazyObjectsDocs, TestJSONSnapshot and TestLazyObjects
+classes
+"""
+
+import inspect
+import json
+from models.engine import lazy_objects
+from models.state import State
+import os
+import pycodestyle
+import unittest
+from unittest import mock
+JSONSnapshot = lazy_objects.JSONSnapshot
+LazyObjects = lazy_objects.LazyObjects
+PATH = "/tmp/test_lazy_objects.json"
+
+
+class TestLazyObjectsDocs(unittest.TestCase):
+    """Tests to check the documentation and style of LazyObjects class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.lo_f = [func for cls_ in (JSONSnapshot, LazyObjects)
+                    for func in inspect.getmembers(cls_, inspect.isfunction)
+                    if func[0] in vars(cls_)]
+
+    def test_pep8_conformance_lazy_objects(self):
+        """Test that models/engine/lazy_objects.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/lazy_objects.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_lazy_objects(self):
+        """Test tests/test_models/test_lazy_objects.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_lazy_objects.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_lazy_objects_module_docstring(self):
+        """Test for the lazy_objects.py module docstring"""
+        self.assertIsNot(lazy_objects.__doc__, None,
+                         "lazy_objects.py needs a docstring")
+        self.assertTrue(len(lazy_objects.__doc__) >= 1,
+                        "lazy_objects.py needs a docstring")
+
+    def test_lazy_objects_class_docstrings(self):
+        """Test for the JSONSnapshot and LazyObjects class docstrings"""
+        for cls in (JSONSnapshot, LazyObjects):
+            self.assertIsNot(cls.__doc__, None,
+                             "{} class needs a docstring".format(cls))
+            self.assertTrue(len(cls.__doc__) >= 1,
+                            "{} class needs a docstring".format(cls))
+
+    def test_lo_func_docstrings(self):
+        """Test for the presence of docstrings in LazyObjects methods"""
+        for func in self.lo_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestLazyObjects(unittest.TestCase):
+    """Test the JSONSnapshot and LazyObjects classes"""
+    def setUp(self):
+        """Write a line-per-record snapshot with two states"""
+        self.states = [State(name="California"), State(name="Nevada")]
+        lines = ["{}: {}".format(json.dumps("State." + s.id),
+                                 json.dumps(s.to_dict()))
+                 for s in self.states]
+        with open(PATH, "w") as f:
+            f.write("{\n" + ",\n".join(lines) + "\n}\n")
+
+    def tearDown(self):
+        """Remove the snapshot"""
+        os.remove(PATH)
+
+    def test_rejects_single_line_file(self):
+        """Test that a file with no line per record is rejected"""
+        with open(PATH, "w") as f:
+            json.dump({}, f)
+        with self.assertRaises(ValueError):
+            JSONSnapshot(PATH, ())
+
+    def test_rejects_indented_file(self):
+        """Test that a JSON file not written one record per line is
+        rejected rather than read as empty"""
+        with open(PATH, "w") as f:
+            json.dump({"State." + s.id: s.to_dict() for s in self.states},
+                      f, indent=4)
+        with self.assertRaises(ValueError):
+            JSONSnapshot(PATH, ())
+
+    def test_scan_decodes_nothing(self):
+        """Test that records are only decoded once they are accessed"""
+        loads = lazy_objects.json_backend.loads
+        with mock.patch.object(lazy_objects.json_backend, "loads",
+                               side_effect=loads) as decode:
+            snapshot = JSONSnapshot(PATH, ("name",))
+            self.assertEqual(decode.call_count, 0)
+            key = "State." + self.states[0].id
+            self.assertEqual(snapshot.index_values(key),
+                             {"name": "California"})
+            snapshot.index_values(key)
+            self.assertEqual(decode.call_count, 1)
+        snapshot.close()
+
+    def test_rejects_records_not_objects(self):
+        """Test that a record that is not a JSON object is rejected"""
+        with open(PATH, "w") as f:
+            f.write('{\n"State.x": ["State"]\n}\n')
+        with self.assertRaises(ValueError):
+            JSONSnapshot(PATH, ())
+
+    def test_reads_the_scanned_file(self):
+        """Test that records are read from the file that was scanned
+        after another one replaced it"""
+        snapshot = JSONSnapshot(PATH, ())
+        with open(PATH + ".new", "w") as f:
+            f.write('{\n"State.x": {"name": "B", "__class__": "State"}\n}\n')
+        os.replace(PATH + ".new", PATH)
+        key = "State." + self.states[0].id
+        self.assertEqual(json.loads(snapshot.read(key))["name"],
+                         "California")
+        snapshot.close()
+
+    def test_hydrates_on_access(self):
+        """Test that records are read on access and evicted past the max"""
+        objects = LazyObjects(JSONSnapshot(PATH, ()), {"State": State}, (),
+                              1)
+        first, second = ["State." + s.id for s in self.states]
+        self.assertEqual(len(objects), 2)
+        self.assertIn(first, objects)
+        self.assertIsNone(objects.peek(first))
+        self.assertEqual(objects[first].name, "California")
+        self.assertIs(objects.peek(first), objects[first])
+        self.assertEqual(objects[second].name, "Nevada")
+        self.assertIsNone(objects.peek(first))
+        self.assertEqual(json.loads(objects.raw(first))["name"],
+                         "California")
+
+    def test_set_and_delete(self):
+        """Test that set objects are kept in memory until a snapshot"""
+        objects = LazyObjects(JSONSnapshot(PATH, ()), {"State": State}, ())
+        state = State(name="Oregon")
+        objects["State." + state.id] = state
+        del objects["State." + self.states[0].id]
+        self.assertEqual(len(objects), 2)
+        self.assertEqual(objects.unsaved(), {"State." + state.id: state})
+        self.assertNotIn("State." + self.states[0].id, objects)
+        self.assertEqual(list(objects), ["State." + self.states[1].id,
+                                         "State." + state.id])
+        self.assertIsNone(objects.raw("State." + state.id))
+
+    def test_share_ids(self):
+        """Test that equal ids are replaced by one shared string"""
+        parent = "".join(["parent", "-id"])
+        ids = {parent: parent}
+        record = {"id": "".join(["child", "-id"]),
+                  "state_id": "".join(["parent", "-id"]),
+                  "amenity_ids": ["".join(["parent", "-id"])],
+                  "name": "".join(["parent", "-id"])}
+        lazy_objects.share_ids(record, ids, ("state_id", "amenity_ids"))
+        self.assertIs(record["state_id"], parent)
+        self.assertIs(record["amenity_ids"][0], parent)
+        self.assertIsNot(record["name"], parent)
+        self.assertIs(ids["child-id"], record["id"])
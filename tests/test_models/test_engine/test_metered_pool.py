@@ -0,0 +1,115 @@
+#!/usr/bin/python3
+"""
+Contains the TestMeteredPoolDocs and TestMeteredPool classes
+"""
+
+import inspect
+from models.engine import metered_pool
+import os
+import pycodestyle
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError
+import unittest
+from unittest import mock
+MeteredQueuePool = metered_pool.MeteredQueuePool
+PATH = "/tmp/test_metered_pool.db"
+
+
+class TestMeteredPoolDocs(unittest.TestCase):
+    """Tests to check the documentation and style of MeteredQueuePool"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.mp_f = [func for func in
+                    inspect.getmembers(MeteredQueuePool, inspect.isfunction)
+                    if func[0] in vars(MeteredQueuePool)]
+
+    def test_pep8_conformance_metered_pool(self):
+        """Test that models/engine/metered_pool.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/metered_pool.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_metered_pool(self):
+        """Test tests/test_models/test_metered_pool.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_metered_pool.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_metered_pool_module_docstring(self):
+        """Test for the metered_pool.py module docstring"""
+        self.assertIsNot(metered_pool.__doc__, None,
+                         "metered_pool.py needs a docstring")
+        self.assertTrue(len(metered_pool.__doc__) >= 1,
+                        "metered_pool.py needs a docstring")
+
+    def test_metered_pool_class_docstring(self):
+        """Test for the MeteredQueuePool class docstring"""
+        self.assertIsNot(MeteredQueuePool.__doc__, None,
+                         "MeteredQueuePool class needs a docstring")
+        self.assertTrue(len(MeteredQueuePool.__doc__) >= 1,
+                        "MeteredQueuePool class needs a docstring")
+
+    def test_mp_func_docstrings(self):
+        """Test for the presence of docstrings in MeteredQueuePool methods"""
+        for func in self.mp_f + [("pool_options", metered_pool.pool_options)]:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestMeteredPool(unittest.TestCase):
+    """Test the pool settings and metrics, with SQLite standing in for
+    MySQL"""
+    def tearDown(self):
+        """Remove the SQLite database"""
+        if os.path.exists(PATH):
+            os.remove(PATH)
+
+    def test_pool_options(self):
+        """Test that the HBNB_MYSQL_POOL_* variables set the pool"""
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertEqual(metered_pool.pool_options(),
+                             {"pool_size": 5, "max_overflow": 10,
+                              "pool_timeout": 30, "pool_recycle": 3600,
+                              "pool_pre_ping": True})
+        env = {"HBNB_MYSQL_POOL_SIZE": "2",
+               "HBNB_MYSQL_POOL_MAX_OVERFLOW": "0",
+               "HBNB_MYSQL_POOL_TIMEOUT": "0.5",
+               "HBNB_MYSQL_POOL_RECYCLE": "60",
+               "HBNB_MYSQL_POOL_PRE_PING": "false"}
+        with mock.patch.dict(os.environ, env):
+            self.assertEqual(metered_pool.pool_options(),
+                             {"pool_size": 2, "max_overflow": 0,
+                              "pool_timeout": 0.5, "pool_recycle": 60,
+                              "pool_pre_ping": False})
+
+    def test_stats(self):
+        """Test that checkouts, overflow and timeouts are counted"""
+        engine = create_engine("sqlite:///" + PATH,
+                               poolclass=MeteredQueuePool, pool_size=1,
+                               max_overflow=1, pool_timeout=0.05)
+        pool = engine.pool
+        self.assertEqual(pool.stats()["checkouts"], 0)
+        first = engine.connect()
+        first.execute(text("SELECT 1"))
+        second = engine.connect()
+        stats = pool.stats()
+        self.assertEqual(stats["size"], 1)
+        self.assertEqual(stats["checked_out"], 2)
+        self.assertEqual(stats["overflow"], 1)
+        self.assertEqual(stats["checkouts"], 2)
+        with self.assertRaises(TimeoutError):
+            engine.connect()
+        stats = pool.stats()
+        self.assertEqual(stats["timeouts"], 1)
+        self.assertGreaterEqual(stats["wait_max"], 0.05)
+        self.assertGreaterEqual(stats["wait_total"], stats["wait_max"])
+        second.close()
+        first.close()
+        self.assertEqual(pool.stats()["checked_out"], 0)
+        engine.dispose()
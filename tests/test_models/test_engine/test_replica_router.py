@@ -0,0 +1,134 @@
+#!/usr/bin/python3
+"""
+Contains the TestReplicaRouterDocs and TestReplicaRouter classes
+"""
+
+import inspect
+from models.engine import replica_router
+import os
+import pycodestyle
+from sqlalchemy import Column, String, create_engine, select
+from sqlalchemy.orm import declarative_base, sessionmaker
+import unittest
+ReplicaRouter = replica_router.ReplicaRouter
+RoutingSession = replica_router.RoutingSession
+PATHS = ["/tmp/test_replica_router_{}.db".format(name)
+         for name in ("primary", "replica1", "replica2")]
+Base = declarative_base()
+
+
+class Item(Base):
+    """row stored in the primary and in each replica"""
+    __tablename__ = "items"
+    id = Column(String(60), primary_key=True)
+
+
+class TestReplicaRouterDocs(unittest.TestCase):
+    """Tests to check the documentation and style of ReplicaRouter class"""
+    @classmethod
+    def setUpClass(cls):
+        """Set up for the doc tests"""
+        cls.rr_f = [func for cls_ in (ReplicaRouter, RoutingSession)
+                    for func in inspect.getmembers(cls_, inspect.isfunction)
+                    if func[0] in vars(cls_)]
+
+    def test_pep8_conformance_replica_router(self):
+        """Test that models/engine/replica_router.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/engine/replica_router.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_replica_router(self):
+        """Test tests/test_models/test_replica_router.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_engine/\
+test_replica_router.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_replica_router_module_docstring(self):
+        """Test for the replica_router.py module docstring"""
+        self.assertIsNot(replica_router.__doc__, None,
+                         "replica_router.py needs a docstring")
+        self.assertTrue(len(replica_router.__doc__) >= 1,
+                        "replica_router.py needs a docstring")
+
+    def test_replica_router_class_docstrings(self):
+        """Test for the ReplicaRouter and RoutingSession class docstrings"""
+        for cls in (ReplicaRouter, RoutingSession):
+            self.assertIsNot(cls.__doc__, None,
+                             "{} class needs a docstring".format(cls))
+            self.assertTrue(len(cls.__doc__) >= 1,
+                            "{} class needs a docstring".format(cls))
+
+    def test_rr_func_docstrings(self):
+        """Test for the presence of docstrings in ReplicaRouter methods"""
+        for func in self.rr_f:
+            self.assertIsNot(func[1].__doc__, None,
+                             "{:s} method needs a docstring".format(func[0]))
+            self.assertTrue(len(func[1].__doc__) >= 1,
+                            "{:s} method needs a docstring".format(func[0]))
+
+
+class TestReplicaRouter(unittest.TestCase):
+    """Test the routing, with SQLite files standing in for the primary
+    and two replicas that each hold a row of their own name"""
+    def setUp(self):
+        """Create the databases and a session factory over them"""
+        self.engines = []
+        for path in PATHS:
+            engine = create_engine("sqlite:///" + path)
+            Base.metadata.create_all(engine)
+            with sessionmaker(bind=engine)() as session:
+                session.add(Item(id=os.path.basename(path)))
+                session.commit()
+            self.engines.append(engine)
+        self.broken = create_engine("sqlite:////nonexistent/dir/x.db")
+        self.router = ReplicaRouter([self.broken] + self.engines[1:])
+        self.Session = sessionmaker(bind=self.engines[0],
+                                    class_=RoutingSession,
+                                    router=self.router)
+
+    def tearDown(self):
+        """Remove the databases"""
+        for engine in self.engines:
+            engine.dispose()
+        for path in PATHS:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def read(self, session):
+        """Return the ids of the rows the session reads"""
+        return sorted(session.scalars(select(Item.id)))
+
+    def test_reads_round_robin(self):
+        """Test that reads alternate between the healthy replicas"""
+        session = self.Session()
+        reads = [self.read(session) for i in range(4)]
+        names = [[os.path.basename(path)] for path in PATHS]
+        self.assertEqual(reads, [names[1], names[2]] * 2)
+        self.assertEqual([stats["healthy"] for stats in self.router.stats()],
+                         [False, True, True])
+        self.assertEqual([stats["reads"] for stats in self.router.stats()],
+                         [0, 2, 2])
+        session.close()
+
+    def test_read_your_writes(self):
+        """Test that a session reads from the primary once it wrote"""
+        session = self.Session()
+        session.add(Item(id="new"))
+        session.commit()
+        primary = sorted([os.path.basename(PATHS[0]), "new"])
+        self.assertEqual(self.read(session), primary)
+        self.assertEqual(self.read(session), primary)
+        session.close()
+        with sessionmaker(bind=self.engines[0])() as session:
+            self.assertEqual(self.read(session), primary)
+
+    def test_no_healthy_replica(self):
+        """Test that reads fall back to the primary"""
+        self.Session.configure(router=ReplicaRouter([self.broken]))
+        session = self.Session()
+        self.assertEqual(self.read(session), [os.path.basename(PATHS[0])])
+        session.close()
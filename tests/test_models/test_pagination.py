@@ -0,0 +1,94 @@
+#!/usr/bin/python3
+"""
+Contains the tests of models/pagination.py
+"""
+
+from datetime import datetime
+import inspect
+from models import pagination
+from models.state import State
+import pycodestyle
+import unittest
+
+
+class TestPaginationDocs(unittest.TestCase):
+    """Tests to check the documentation and style of pagination.py"""
+
+    def test_pep8_conformance_pagination(self):
+        """Test that models/pagination.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['models/pagination.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pep8_conformance_test_pagination(self):
+        """Test that tests/test_models/test_pagination.py conforms to
+        PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['tests/test_models/test_pagination.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_pagination_module_docstring(self):
+        """Test for the pagination.py module docstring"""
+        self.assertIsNot(pagination.__doc__, None,
+                         "pagination.py needs a docstring")
+        self.assertTrue(len(pagination.__doc__) >= 1,
+                        "pagination.py needs a docstring")
+
+    def test_pagination_func_docstrings(self):
+        """Test for the presence of docstrings in pagination functions"""
+        for name, func in inspect.getmembers(pagination,
+                                             inspect.isfunction):
+            if func.__module__ == pagination.__name__:
+                self.assertIsNot(func.__doc__, None,
+                                 "{:s} needs a docstring".format(name))
+
+
+class TestPagination(unittest.TestCase):
+    """Test the keyset pagination helpers"""
+
+    def test_cursor_round_trip(self):
+        """Test that a cursor decodes to the key of its object"""
+        state = State(name="California")
+        cursor = pagination.encode_cursor(state)
+        self.assertNotIn("=", cursor)
+        created_at, id = pagination.decode_cursor(cursor)
+        self.assertEqual(id, state.id)
+        self.assertEqual(datetime.fromisoformat(created_at),
+                         state.created_at)
+
+    def test_invalid_cursor(self):
+        """Test that cursors not made by encode_cursor are rejected"""
+        for cursor in ("x", "WzEsIDJd", "WyJ4IiwgInkiXQ"):
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(ValueError):
+                    pagination.decode_cursor(cursor)
+
+    def test_page_args(self):
+        """Test that the limit is checked and capped"""
+        self.assertEqual(pagination.page_args({}), (None, None))
+        self.assertEqual(pagination.page_args({"limit": "5"}), (5, None))
+        self.assertEqual(pagination.page_args({"limit": "100000"}),
+                         (pagination.MAX_LIMIT, None))
+        for limit in ("0", "x"):
+            with self.subTest(limit=limit):
+                with self.assertRaises(ValueError):
+                    pagination.page_args({"limit": limit})
+
+    def test_fetch_page(self):
+        """Test that a cursor is returned only when objects are left"""
+        states = [State(name=str(i)) for i in range(3)]
+
+        def fetch(limit, after):
+            """returns the first limit states"""
+            return states[:limit]
+        objs, cursor = pagination.fetch_page(fetch, 2, None)
+        self.assertEqual(objs, states[:2])
+        self.assertEqual(pagination.decode_cursor(cursor)[1], states[1].id)
+        self.assertEqual(pagination.fetch_page(fetch, 3, None),
+                         (states, None))
+
+
+if __name__ == '__main__':
+    unittest.main()
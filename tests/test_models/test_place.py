@@ -171,6 +171,18 @@ class TestPlace(unittest.TestCase):
         self.assertEqual(type(place.amenity_ids), list)
         self.assertEqual(len(place.amenity_ids), 0)
 
+    @unittest.skipIf(models.storage_t == 'db', "not testing File Storage")
+    def test_amenity_ids_not_shared(self):
+        """Test that places do not share their list of amenity ids"""
+        first = Place()
+        second = Place()
+        stored = Place.from_storage_dict({"__class__": "Place",
+                                          "id": "stored"})
+        first.amenity_ids.append("wifi")
+        self.assertEqual(second.amenity_ids, [])
+        self.assertEqual(stored.amenity_ids, [])
+        self.assertEqual(Place().amenity_ids, [])
+
     def test_to_dict_creates_dict(self):
         """test to_dict method creates a dictionary with proper attrs"""
         p = Place()
@@ -0,0 +1,92 @@
+#!/usr/bin/python3
+"""
+Contains tests for web_common/fragments.py.
+"""
+import importlib
+import unittest
+from unittest import mock
+import pycodestyle
+import models
+from models.amenity import Amenity
+from models.city import City
+from models.state import State
+from web_common import fragments
+
+
+class TestFragmentsDocs(unittest.TestCase):
+    """Tests to check the documentation and style of fragments.py."""
+
+    def test_pep8_conformance_fragments(self):
+        """Test that web_common/fragments.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['web_common/fragments.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_fragments_module_docstring(self):
+        """Test for the web_common/fragments.py module docstring"""
+        self.assertIsNot(fragments.__doc__, None,
+                         "web_common/fragments.py needs a docstring")
+        self.assertTrue(len(fragments.__doc__) >= 1,
+                        "web_common/fragments.py needs a docstring")
+
+
+class TestFragments(unittest.TestCase):
+    """Test the sidebar fragment cache of the web pages."""
+
+    def setUp(self):
+        """adds a state with a city and an amenity to the storage, once
+        it is in sync with its file so requests do not reload it"""
+        models.storage.close()
+        fragments.clear()
+        self.state = State(name="Nevada")
+        self.city = City(name="Reno", state_id=self.state.id)
+        self.amenity = Amenity(name="Wifi")
+        self.objs = [self.state, self.city, self.amenity]
+        for obj in self.objs:
+            models.storage.new(obj)
+        self.app = importlib.import_module("web_flask.100-hbnb").app
+
+    def tearDown(self):
+        """removes the objects added by the test"""
+        for obj in self.objs:
+            models.storage.delete(obj)
+        fragments.clear()
+
+    def test_sidebar_is_cached_until_a_write(self):
+        """Test that the sidebar is rendered once between writes."""
+        client = self.app.test_client()
+        with mock.patch.object(fragments, "sidebar",
+                               wraps=fragments.sidebar) as sidebar:
+            body = client.get('/hbnb').get_data(as_text=True)
+            self.assertIn("Reno", body)
+            self.assertEqual(client.get('/hbnb').get_data(as_text=True),
+                             body)
+            self.assertEqual(sidebar.call_count, 1)
+            other = Amenity(name="Pool")
+            self.objs.append(other)
+            models.storage.new(other)
+            self.assertIn("Pool", client.get('/hbnb').get_data(as_text=True))
+            self.assertEqual(sidebar.call_count, 2)
+
+    def test_shared_sidebar(self):
+        """Test that web_dynamic renders the sidebar of web_common."""
+        client = importlib.import_module("web_dynamic.0-hbnb").app \
+            .test_client()
+        body = client.get('/0-hbnb/').get_data(as_text=True)
+        self.assertIn("<li>Reno</li>", body)
+        self.assertIn("<li>Wifi</li>", body)
+
+    def test_static_hash(self):
+        """Test that the cache_id of the static files is stable."""
+        app = importlib.import_module("web_dynamic.4-hbnb").app
+        with app.app_context():
+            cache_id = fragments.static_hash()
+        self.assertRegex(cache_id, "^[0-9a-f]{12}$")
+        body = app.test_client().get('/4-hbnb/').get_data(as_text=True)
+        self.assertIn("4-hbnb.js?" + cache_id, body)
+        self.assertIn('data-name="Wifi"', body)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+#!/usr/bin/python3
+"""
+Contains tests for web_dynamic/4-hbnb.py.
+"""
+import importlib
+import json
+import unittest
+import pycodestyle
+import models
+from models.city import City
+from models.place import Place
+from models.state import State
+from models.user import User
+
+hbnb = importlib.import_module("web_dynamic.4-hbnb")
+
+
+class TestHbnbDocs(unittest.TestCase):
+    """Tests to check the documentation and style of 4-hbnb.py."""
+
+    def test_pep8_conformance_hbnb(self):
+        """Test that web_dynamic/4-hbnb.py conforms to PEP8."""
+        pep8s = pycodestyle.StyleGuide(quiet=True)
+        result = pep8s.check_files(['web_dynamic/4-hbnb.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+    def test_hbnb_module_docstring(self):
+        """Test for the web_dynamic/4-hbnb.py module docstring"""
+        self.assertIsNot(hbnb.__doc__, None,
+                         "web_dynamic/4-hbnb.py needs a docstring")
+        self.assertTrue(len(hbnb.__doc__) >= 1,
+                        "web_dynamic/4-hbnb.py needs a docstring")
+
+
+class TestPlacesFragment(unittest.TestCase):
+    """Test the server-rendered pages of places."""
+
+    def setUp(self):
+        """adds three places of an owner to the storage, once it is in
+        sync with its file so requests do not reload it"""
+        models.storage.close()
+        self.user = User(email="jon@hbnb.io", password="pwd",
+                         first_name="Jon", last_name="Snow")
+        self.state = State(name="Nevada")
+        self.city = City(name="Reno", state_id=self.state.id)
+        self.objs = [self.user, self.state, self.city]
+        for i in range(3):
+            self.objs.append(Place(name="place_{:d}".format(i),
+                                   city_id=self.city.id,
+                                   user_id=self.user.id, max_guest=1,
+                                   description="<script>nice</script>"))
+        for obj in self.objs:
+            models.storage.new(obj)
+        self.client = hbnb.app.test_client()
+
+    def tearDown(self):
+        """removes the objects added by the test"""
+        for obj in self.objs:
+            models.storage.delete(obj)
+
+    def post(self, query="", data=None):
+        """POSTs the filters data to the places fragment"""
+        return self.client.post('/4-hbnb/places' + query,
+                                data=json.dumps(data or {}),
+                                content_type="application/json")
+
+    def test_pages(self):
+        """Test that the places are rendered one page at a time."""
+        data = {"cities": [self.city.id]}
+        resp = self.post("?limit=2", data)
+        self.assertEqual(resp.status_code, 200)
+        body = resp.get_data(as_text=True)
+        self.assertEqual(body.count("<article>"), 2)
+        self.assertIn("<b>Owner: </b>Jon Snow", body)
+        self.assertIn("1 Guest<", body)
+        self.assertNotIn("<script>nice", body)
+        self.assertIn("&lt;script&gt;nice&lt;/script&gt;", body)
+        cursor = resp.headers["X-Next-Cursor"]
+        resp = self.post("?limit=2&cursor=" + cursor, data)
+        self.assertEqual(resp.get_data(as_text=True).count("<article>"), 1)
+        self.assertNotIn("X-Next-Cursor", resp.headers)
+
+    def test_bad_requests(self):
+        """Test that the fragment needs a JSON body and a valid limit."""
+        resp = self.client.post('/4-hbnb/places', data="not json")
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(self.post("?limit=0").status_code, 400)
+
+    def test_page_embeds_first_page(self):
+        """Test that the page is served with its first page of places."""
+        resp = self.client.get('/4-hbnb/')
+        self.assertEqual(resp.status_code, 200)
+        self.assertIn("place_0", resp.get_data(as_text=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+#!/usr/bin/python3
+"""
+rendered fragment cache and templates shared by the web_flask and
+web_dynamic pages
+"""
+from collections import OrderedDict
+import hashlib
+import os
+from os import getenv
+import threading
+from flask import Blueprint, current_app, render_template
+from markupsafe import Markup
+from models import storage
+
+# fragments kept, 0 disables the cache
+MAX_ENTRIES = int(getenv("HBNB_FRAGMENT_CACHE_MAX", "64"))
+# classes shown by the filters sidebar
+SIDEBAR_CLASSES = ("State", "City", "Amenity")
+# template of the filters sidebar, from the templates of the blueprint
+SIDEBAR = "web_common/filters.html"
+
+# registered by the apps to find the shared templates
+blueprint = Blueprint("web_common", __name__, template_folder="templates")
+
+lock = threading.Lock()
+# OrderedDict - (app, template, generations) to the rendered HTML
+cache = OrderedDict()
+# dictionary - static folder to the hash of its content
+hashes = {}
+
+
+def render_fragment(template, cls_names, context):
+    """returns template rendered with the variables context() returns,
+    from memory until objects of one of cls_names are written
+    Args:
+        template (str): name of the template of the fragment
+        cls_names (tuple): names of the classes the fragment shows
+        context (callable): returns the variables of the template, only
+                            called when the fragment is rendered
+    Returns:
+        Markup: the HTML of the fragment
+    """
+    key = (current_app.import_name, template,
+           storage.generation(*cls_names))
+    with lock:
+        html = cache.get(key)
+        if html is not None:
+            cache.move_to_end(key)
+            return html
+    html = Markup(render_template(template, **context()))
+    if MAX_ENTRIES > 0:
+        with lock:
+            cache[key] = html
+            while len(cache) > MAX_ENTRIES:
+                cache.popitem(last=False)
+    return html
+
+
+def sidebar():
+    """returns the variables of the filters sidebar: the states, their
+    cities and the amenities, ordered by name"""
+    states = storage.sorted_by_name("State")
+    cities = storage.children_of("City", "state_id",
+                                 [state.id for state in states],
+                                 sort_by_name=True)
+    return {"states": states, "cities": cities,
+            "amenities": storage.sorted_by_name("Amenity")}
+
+
+def render_sidebar(template=SIDEBAR):
+    """returns the filters sidebar rendered with template, from memory
+    until states, cities or amenities are written"""
+    return render_fragment(template, SIDEBAR_CLASSES, sidebar)
+
+
+def clear():
+    """empties the fragment cache"""
+    with lock:
+        cache.clear()
+
+
+def static_hash():
+    """returns a hash of the files of the static folder of the current
+    app, computed once, to version their URLs: browsers can keep them
+    until their content changes
+    Returns:
+        str: 12 hexadecimal digits
+    """
+    folder = current_app.static_folder
+    value = hashes.get(folder)
+    if value is None:
+        digest = hashlib.sha1()
+        for root, dirs, files in sorted(os.walk(folder)):
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                digest.update(os.path.relpath(path, folder).encode())
+                with open(path, "rb") as f:
+                    digest.update(f.read())
+        value = digest.hexdigest()[:12]
+        hashes[folder] = value
+    return value
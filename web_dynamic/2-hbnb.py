@@ -6,17 +6,17 @@ starts a Flask web application
 from flask import Flask, render_template
 from models import *
 from models import storage
-import uuid
+from web_common.fragments import blueprint, render_sidebar, static_hash
 app = Flask(__name__)
+app.register_blueprint(blueprint)
 
 
 @app.route('/2-hbnb/', strict_slashes=False)
 def filters():
     """display a HTML page like 8-index.html from static"""
-    states = storage.all("State").values()
-    amenities = storage.all("Amenity").values()
-    return render_template('2-hbnb.html', states=states,
-                           amenities=amenities, cache_id=uuid.uuid4())
+    return render_template('2-hbnb.html',
+                           filters=render_sidebar('1-filters.html'),
+                           cache_id=static_hash())
 
 
 @app.teardown_appcontext
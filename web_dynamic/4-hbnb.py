@@ -3,20 +3,67 @@
 starts a Flask web application
 """
 
-from flask import Flask, render_template
+from flask import Flask, make_response, render_template, request
 from models import *
 from models import storage
-import uuid
+from models.pagination import fetch_page, page_args
+from models.user import User
+from web_common.fragments import blueprint, render_sidebar, static_hash
 app = Flask(__name__)
+app.register_blueprint(blueprint)
+
+# places rendered per page when the request gives no limit
+PAGE_SIZE = 20
+
+
+def places_page(filters, limit, after):
+    """returns the variables of the places fragment for one page of the
+    places matching filters, and the cursor of the next page
+    Args:
+        filters (dict): lists of states, cities and amenities ids, like
+                        the body of places_search
+        limit (int): size of the page, None for PAGE_SIZE
+        after (tuple): (created_at, id) cursor of the previous page
+    Returns:
+        tuple: variables of the template, cursor of the next page or
+               None on the last page
+    """
+    places, cursor = fetch_page(
+        lambda limit, after: storage.search_places(
+            filters.get('states', []), filters.get('cities', []),
+            filters.get('amenities', []), limit, after),
+        limit or PAGE_SIZE, after)
+    owners = storage.get_many(User, {place.user_id for place in places})
+    return {"places": places, "owners": owners}, cursor
 
 
 @app.route('/4-hbnb/', strict_slashes=False)
 def filters():
-    """display a HTML page like 8-index.html from static"""
-    states = storage.all("State").values()
-    amenities = storage.all("Amenity").values()
-    return render_template('4-hbnb.html', states=states,
-                           amenities=amenities, cache_id=uuid.uuid4())
+    """display a HTML page like 8-index.html from static, with the first
+    page of places"""
+    places, cursor = places_page({}, None, None)
+    return render_template('4-hbnb.html',
+                           filters=render_sidebar('1-filters.html'),
+                           cache_id=static_hash(), cursor=cursor, **places)
+
+
+@app.route('/4-hbnb/places', methods=['POST'], strict_slashes=False)
+def places():
+    """renders one page of the places matching the filters of the JSON
+    body, paginated like places_search, with the cursor of the next page
+    in the X-Next-Cursor header if there is one"""
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        return "Not a JSON", 400
+    try:
+        limit, after = page_args(request.args)
+    except ValueError as e:
+        return str(e), 400
+    places, cursor = places_page(data, limit, after)
+    resp = make_response(render_template('4-places.html', **places))
+    if cursor is not None:
+        resp.headers['X-Next-Cursor'] = cursor
+    return resp
 
 
 @app.teardown_appcontext
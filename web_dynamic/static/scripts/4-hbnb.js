@@ -1,5 +1,10 @@
 $(document).ready(function () {
   const amenities = {};
+  let filters = { states: [], cities: [], amenities: [] };
+  let cursor = $('section.places').attr('data-cursor') || null;
+  let loading = false;
+  let search = 0;
+
   $('input[type="checkbox"]').change(function () {
     if ($(this).is(':checked')) {
       amenities[$(this).data('id')] = $(this).data('name');
@@ -22,75 +27,50 @@ $(document).ready(function () {
     }
   });
 
-  $.ajax({
-    url: 'http://localhost:5001/api/v1/users/',
-    type: 'GET',
-    success: function (users) {
-      const userData = {};
-      users.forEach(function (user) {
-        userData[user.id] = user;
-      });
-
-      $.ajax({
-        url: 'http://localhost:5001/api/v1/places_search/',
-        type: 'POST',
-        data: JSON.stringify({ states: [], cities: [], amenities: [] }),
-        contentType: 'application/json',
-        success: function (data) {
-          data.forEach(function (place) {
-            const user = userData[place.user_id];
-            const article = $('<article></article>');
-            const title = $(`<h2>${place.name}</h2>`);
-            const price = $(`<div class="price_by_night"><p>$${place.price_by_night}</p></div>`);
-            const info = $('<div class="information"></div>')
-              .append(`<div class="max_guest"><div class="guest_image"></div>${place.max_guest} Guest${place.max_guest !== 1 ? 's' : ''}</div>`)
-              .append(`<div class="number_rooms"><div class="bed_image"></div>${place.number_rooms} Bedroom${place.number_rooms !== 1 ? 's' : ''}</div>`)
-              .append(`<div class="number_bathrooms"><div class="bath_image"></div>${place.number_bathrooms} Bathroom${place.number_bathrooms !== 1 ? 's' : ''}</div>`);
-            const users = $(`<div class="user"><p><b>Owner:</b> ${place.user_id ? `${user.first_name} ${user.last_name}` : 'Loading'}</p></div>`);
-            const description = $(`<div class="description">${place.description}</div>`);
-            article.append(title).append(price).append(info).append(users).append(description);
-            $('section.places').append(article);
-          });
+  // appends the next page of places, rendered by the server, or the
+  // first one of a new search
+  function loadPlaces (reset) {
+    if (reset) {
+      search += 1;
+      cursor = null;
+    } else if (loading || !cursor) {
+      return;
+    }
+    const current = search;
+    const query = cursor ? '?cursor=' + encodeURIComponent(cursor) : '';
+    loading = true;
+    $.ajax({
+      url: '/4-hbnb/places' + query,
+      type: 'POST',
+      data: JSON.stringify(filters),
+      contentType: 'application/json',
+      success: function (html, status, xhr) {
+        if (current !== search) {
+          return;
+        }
+        if (reset) {
+          $('section.places article').remove();
         }
-      });
+        $('section.places').append(html);
+        cursor = xhr.getResponseHeader('X-Next-Cursor');
+      },
+      complete: function () {
+        if (current === search) {
+          loading = false;
+        }
+      }
+    });
+  }
 
-      $('button').click(function () {
-        console.log('Button clicked'); // Debugging statement
-        const amenityIds = Object.keys(amenities);
-        console.log('Amenity IDs:', amenityIds); // Debugging statement
-        console.log(typeof (amenityIds)); // Debugging statement
-        $.ajax({
-          url: 'http://localhost:5001/api/v1/places_search/',
-          type: 'POST',
-          data: JSON.stringify({ states: [], cities: [], amenities: amenityIds }),
-          contentType: 'application/json',
-          success: function (data) {
-            console.log('AJAX request successful'); // Debugging statement
-            console.log('Received response:', data); // Debugging statement
-            console.log(JSON.stringify(data)); // Debugging statement
-            $('section.places').empty();
-            data.forEach(function (place) {
-              const user = userData[place.user_id];
-              console.log('User:', user); // Debugging statement
-              const article = $('<article></article>');
-              const title = $(`<h2>${place.name}</h2>`);
-              const price = $(`<div class="price_by_night"><p>$${place.price_by_night}</p></div>`);
-              const info = $('<div class="information"></div>')
-                .append(`<div class="max_guest"><div class="guest_image"></div>${place.max_guest} Guest${place.max_guest !== 1 ? 's' : ''}</div>`)
-                .append(`<div class="number_rooms"><div class="bed_image"></div>${place.number_rooms} Bedroom${place.number_rooms !== 1 ? 's' : ''}</div>`)
-                .append(`<div class="number_bathrooms"><div class="bath_image"></div>${place.number_bathrooms} Bathroom${place.number_bathrooms !== 1 ? 's' : ''}</div>`);
-              const users = $(`<div class="user"><p><b>Owner:</b> ${place.user_id ? `${user.first_name} ${user.last_name}` : 'Loading'}</p></div>`);
-              const description = $(`<div class="description">${place.description}</div>`);
-              article.append(title).append(price).append(info).append(users).append(description);
-              $('section.places').append(article);
-            });
-          },
-          error: function (xhr, status, error) {
-            console.log('AJAX request failed'); // Debugging statement
-            console.log('Error:', error); // Debugging statement
-          }
-        });
-      });
+  $(window).scroll(function () {
+    if ($(window).scrollTop() + $(window).height() >=
+        $(document).height() - 200) {
+      loadPlaces(false);
     }
   });
+
+  $('section.filters button').click(function () {
+    filters = { states: [], cities: [], amenities: Object.keys(amenities) };
+    loadPlaces(true);
+  });
 });
@@ -6,16 +6,16 @@ starts a Flask web application
 from flask import Flask, render_template
 from models import *
 from models import storage
+from web_common.fragments import blueprint, render_sidebar
 app = Flask(__name__)
+app.register_blueprint(blueprint)
 
 
 @app.route('/hbnb_filters', strict_slashes=False)
 def filters():
     """display a HTML page like 6-index.html from static"""
-    states = storage.all("State").values()
-    amenities = storage.all("Amenity").values()
-    return render_template('10-hbnb_filters.html', states=states,
-                           amenities=amenities)
+    return render_template('10-hbnb_filters.html',
+                           filters=render_sidebar())
 
 
 @app.teardown_appcontext
@@ -6,16 +6,16 @@ starts a Flask web application
 from flask import Flask, render_template
 from models import *
 from models import storage
+from web_common.fragments import blueprint, render_sidebar
 app = Flask(__name__)
+app.register_blueprint(blueprint)
 
 
 @app.route('/hbnb', strict_slashes=False)
 def filters():
     """display a HTML page like 8-index.html from static"""
-    states = storage.all("State").values()
-    amenities = storage.all("Amenity").values()
-    return render_template('100-hbnb.html', states=states,
-                           amenities=amenities)
+    return render_template('100-hbnb.html',
+                           filters=render_sidebar())
 
 
 @app.teardown_appcontext
@@ -12,8 +12,12 @@ app = Flask(__name__)
 @app.route('/cities_by_states', strict_slashes=False)
 def cities_by_states():
     """display the states and cities listed in alphabetical order"""
-    states = storage.all("State").values()
-    return render_template('8-cities_by_states.html', states=states)
+    states = storage.sorted_by_name("State")
+    cities = storage.children_of("City", "state_id",
+                                 [state.id for state in states],
+                                 sort_by_name=True)
+    return render_template('8-cities_by_states.html', states=states,
+                           cities=cities)
 
 
 @app.teardown_appcontext
@@ -6,6 +6,7 @@ starts a Flask web application
 from flask import Flask, render_template
 from models import *
 from models import storage
+from models.state import State
 app = Flask(__name__)
 
 
@@ -13,10 +14,16 @@ app = Flask(__name__)
 @app.route('/states/<state_id>', strict_slashes=False)
 def states(state_id=None):
     """display the states and cities listed in alphabetical order"""
-    states = storage.all("State")
-    if state_id is not None:
-        state_id = 'State.' + state_id
-    return render_template('9-states.html', states=states, state_id=state_id)
+    if state_id is None:
+        return render_template('9-states.html',
+                               states=storage.sorted_by_name("State"))
+    state = storage.get(State, state_id)
+    cities = []
+    if state is not None:
+        cities = storage.children_of("City", "state_id", [state.id],
+                                     sort_by_name=True)[state.id]
+    return render_template('9-states.html', state_id=state_id, state=state,
+                           cities=cities)
 
 
 @app.teardown_appcontext